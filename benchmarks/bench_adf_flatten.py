@@ -0,0 +1,123 @@
+"""Micro-benchmark del aplanado de descripciones ADF.
+
+Compara el aplanador recursivo anterior con ``flatten_adf`` (pila explícita) y
+con ``flatten_description`` memoizado, sobre documentos sintéticos grandes.
+
+Uso::
+
+    python benchmarks/bench_adf_flatten.py [--docs 200] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Any
+
+from bugfix_automator.adf import clear_flatten_cache, flatten_adf, flatten_description
+
+
+def legacy_flatten(description_node: dict[str, Any] | None) -> str:
+    """Implementación recursiva previa, copiada como referencia."""
+    if not description_node:
+        return ""
+
+    chunks: list[str] = []
+
+    def visit(node: Any) -> None:
+        if isinstance(node, dict):
+            if node.get("type") == "text":
+                chunks.append(node.get("text", ""))
+            for child in node.get("content", []):
+                visit(child)
+        elif isinstance(node, list):
+            for item in node:
+                visit(item)
+
+    visit(description_node)
+    return " ".join(chunk.strip() for chunk in chunks if chunk.strip())
+
+
+def synthetic_document(seed: int, paragraphs: int = 40, table_rows: int = 20) -> dict[str, Any]:
+    def text(value: str) -> dict[str, Any]:
+        return {"type": "text", "text": value}
+
+    content: list[dict[str, Any]] = []
+    for p in range(paragraphs):
+        content.append({"type": "paragraph", "content": [
+            text(f"Paso {p} del issue {seed}: "),
+            {"type": "text", "text": "OO", "marks": [{"type": "strong"}]},
+            text(" revisar fallback "),
+            {"type": "mention", "attrs": {"id": str(p), "text": "@qa"}},
+        ]})
+    content.append({"type": "bulletList", "content": [
+        {"type": "listItem", "content": [
+            {"type": "paragraph", "content": [text(f"item {i}")]},
+            {"type": "bulletList", "content": [
+                {"type": "listItem", "content": [
+                    {"type": "paragraph", "content": [text(f"sub {i}")]},
+                ]},
+            ]},
+        ]}
+        for i in range(paragraphs)
+    ]})
+    content.append({"type": "table", "content": [
+        {"type": "tableRow", "content": [
+            {"type": "tableCell", "content": [
+                {"type": "paragraph", "content": [text(f"r{r}c{c}")]},
+            ]}
+            for c in range(5)
+        ]}
+        for r in range(table_rows)
+    ]})
+    content.append({"type": "codeBlock", "content": [text("def f():\n    return 'OO'\n" * 20)]})
+    return {"type": "doc", "version": 1, "content": content}
+
+
+def timed(label: str, func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<34} {best * 1000:9.2f} ms")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    documents = [synthetic_document(i) for i in range(args.docs)]
+    keyed = [(f"BFV-{i}", "2025-08-01T10:00:00.000+0000", doc) for i, doc in enumerate(documents)]
+    print(f"{args.docs} documentos ADF sintéticos, mejor de {args.repeat} corridas")
+
+    legacy = timed("recursivo (anterior)", lambda: [legacy_flatten(d) for d in documents], args.repeat)
+    iterative = timed("flatten_adf (pila explícita)", lambda: [flatten_adf(d) for d in documents], args.repeat)
+
+    clear_flatten_cache()
+    for key, updated, doc in keyed:
+        flatten_description(doc, key, updated)
+    memo = timed(
+        "flatten_description (memo caliente)",
+        lambda: [flatten_description(doc, key, updated) for key, updated, doc in keyed],
+        args.repeat,
+    )
+    print(f"speedup iterativo: x{legacy / iterative:.2f} | memo: x{legacy / memo:.1f}")
+
+    deep: dict[str, Any] = {"type": "paragraph", "content": [{"type": "text", "text": "fondo"}]}
+    for _ in range(sys.getrecursionlimit() * 2):
+        deep = {"type": "blockquote", "content": [deep]}
+    try:
+        legacy_flatten(deep)
+        print("documento profundo: recursivo OK")
+    except RecursionError:
+        print("documento profundo: recursivo -> RecursionError")
+    print(f"documento profundo: flatten_adf -> {flatten_adf(deep)!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark de memoria: lista de issues procesados frente a ``IssueTable``.
+
+Simula una descarga histórica grande: los issues llegan de a uno (como los
+entrega ``iter_issues_by_statuses``) con cadenas nuevas por issue, igual que
+al parsear JSON. Para cada representación se mide con ``tracemalloc`` la
+memoria que queda retenida al terminar:
+
+- ``dataclass`` sin slots ni interning (el modelo anterior, como referencia),
+- lista de ``ProcessedIssue`` con slots,
+- ``IssueTable`` columnar (``build_issue_table``, y lo que guarda ``ReportAggregator``).
+
+Uso::
+
+    python benchmarks/bench_issue_memory.py [--issues 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+import gc
+import random
+import tracemalloc
+from typing import Any
+
+from bugfix_automator.models import JiraIssue, ProcessedIssue
+from bugfix_automator.processor import (
+    OO_TOKEN,
+    build_issue_table,
+    process_issues,
+    processed_row,
+    select_time_in_minutes,
+)
+
+STATUSES = ["For Review", "QA Passed", "QA Failed", "Under Review"]
+
+
+@dataclass(frozen=True)
+class LegacyProcessedIssue:
+    """``ProcessedIssue`` previo: ``__dict__`` por instancia y cadenas repetidas."""
+
+    issue_key: str
+    summary: str
+    status: str
+    assignee: str
+    tiempo_minutos: int
+    cantidad_oo: int
+
+
+def synthetic_issues(count: int, seed: int = 7) -> Iterator[JiraIssue]:
+    rng = random.Random(seed)
+    words = ["parser", "OO", "fallback", "branch", "login", "cache", "timeout"]
+    for i in range(count):
+        yield JiraIssue(
+            key=f"BFV-{i}",
+            summary=" ".join(rng.choices(words, k=8)),
+            status=rng.choice(STATUSES),
+            assignee=f"dev{i % 25}",
+            description=" ".join(rng.choices(words, k=60)),
+            timespent_seconds=rng.choice([None, 600, 1800, 3600]),
+            timeoriginalestimate_seconds=rng.choice([None, 900, 7200]),
+        )
+
+
+def legacy_list(issues: Iterator[JiraIssue]) -> list[LegacyProcessedIssue]:
+    return [
+        LegacyProcessedIssue(
+            issue_key=issue.key,
+            summary=issue.summary,
+            # Copias sin internar, como quedaban al parsear cada respuesta.
+            status=(issue.status + " ")[:-1],
+            assignee=(issue.assignee + " ")[:-1],
+            tiempo_minutos=select_time_in_minutes(issue),
+            cantidad_oo=issue.summary.count(OO_TOKEN) + issue.description.count(OO_TOKEN),
+        )
+        for issue in issues
+    ]
+
+
+def slotted_list(issues: Iterator[JiraIssue]) -> list[ProcessedIssue]:
+    return [ProcessedIssue(*processed_row(issue)) for issue in issues]
+
+
+def retained_bytes(build: Callable[[Iterator[JiraIssue]], Any], count: int) -> tuple[int, Any]:
+    gc.collect()
+    tracemalloc.start()
+    result = build(synthetic_issues(count))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=100_000)
+    args = parser.parse_args()
+
+    results = {}
+    for label, build in (
+        ("dataclass sin slots", legacy_list),
+        ("ProcessedIssue con slots", slotted_list),
+        ("IssueTable columnar", build_issue_table),
+    ):
+        size, results[label] = retained_bytes(build, args.issues)
+        print(f"{label:<26} {size / 2**20:8.1f} MiB  {size / args.issues:7.1f} B/issue")
+
+    table = results["IssueTable columnar"]
+    assert list(table) == list(results["ProcessedIssue con slots"]), "IssueTable difiere de la lista"
+    assert process_issues(table).total_oo == sum(issue.cantidad_oo for issue in results["dataclass sin slots"])
+
+
+if __name__ == "__main__":
+    main()
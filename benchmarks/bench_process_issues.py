@@ -0,0 +1,93 @@
+"""Benchmark de ``process_issues`` frente a la implementación anterior.
+
+Genera issues sintéticos (resumen + descripción de ~2 KB), verifica que el
+``ProcessedReport`` sea idéntico y mide el motor por lotes.
+
+Uso::
+
+    python benchmarks/bench_process_issues.py [--issues 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from bugfix_automator.models import JiraIssue
+from bugfix_automator.processor import (
+    OO_PATTERN,
+    ProcessedIssue,
+    ProcessedReport,
+    process_issues,
+    select_time_in_minutes,
+)
+
+
+def legacy_process_issues(issues: list[JiraIssue]) -> ProcessedReport:
+    """Implementación previa (f-string + findall por issue), como referencia."""
+    processed: list[ProcessedIssue] = []
+    total_time = 0
+    total_oo = 0
+
+    for issue in issues:
+        minutes = select_time_in_minutes(issue)
+        text = f"{issue.summary} {issue.description}"
+        oo_count = len(OO_PATTERN.findall(text)) if text else 0
+        processed.append(ProcessedIssue(
+            issue_key=issue.key,
+            summary=issue.summary,
+            status=issue.status,
+            assignee=issue.assignee,
+            tiempo_minutos=minutes,
+            cantidad_oo=oo_count,
+        ))
+        total_time += minutes
+        total_oo += oo_count
+
+    return ProcessedReport(issues=processed, total_tiempo_minutos=total_time, total_oo=total_oo)
+
+
+def synthetic_issues(count: int, seed: int = 7) -> list[JiraIssue]:
+    rng = random.Random(seed)
+    words = ["parser", "OO", "fallback", "OOO", "branch", "login", "O", "cache", "timeout"]
+    statuses = ["For Review", "QA Passed", "QA Failed", "Under Review"]
+    return [
+        JiraIssue(
+            key=f"BFV-{i}",
+            summary=" ".join(rng.choices(words, k=8)),
+            status=rng.choice(statuses),
+            assignee=f"dev{i % 25}",
+            description=" ".join(rng.choices(words, k=300)),
+            timespent_seconds=rng.choice([None, 600, 1800, 3600]),
+            timeoriginalestimate_seconds=rng.choice([None, 900, 7200]),
+        )
+        for i in range(count)
+    ]
+
+
+def timed(label: str, func) -> tuple[float, ProcessedReport]:
+    started = time.perf_counter()
+    report = func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed * 1000:10.1f} ms")
+    return elapsed, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=50_000)
+    args = parser.parse_args()
+
+    issues = synthetic_issues(args.issues)
+    print(f"{len(issues)} issues sintéticos")
+
+    legacy_time, expected = timed("anterior", lambda: legacy_process_issues(issues))
+    batch_time, batch = timed("lotes", lambda: process_issues(issues))
+
+    assert batch == expected, "el motor por lotes difiere de la implementación anterior"
+    print(f"speedup: x{legacy_time / batch_time:.2f}")
+
+
+if __name__ == "__main__":
+    main()
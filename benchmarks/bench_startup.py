@@ -0,0 +1,88 @@
+"""Benchmark de arranque: tiempos de import y de ``main --help``.
+
+Cada medición corre en un intérprete nuevo. Para cada módulo se reporta el
+tiempo acumulado de ``python -X importtime`` y los imports más costosos que
+arrastra; luego se mide de punta a punta ``python -m bugfix_automator.main
+--help`` y el calentamiento de Google (``drive_client.warm_up``) que el
+servidor web hace en segundo plano.
+
+Uso::
+
+    python benchmarks/bench_startup.py [--runs 5] [--top 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = [
+    "bugfix_automator.main",
+    "bugfix_automator.webapp",
+    "bugfix_automator.drive_client",
+    "bugfix_automator.jira_client",
+]
+
+
+def import_times(module: str) -> list[tuple[int, int, str]]:
+    """Filas (self_us, cumulative_us, módulo) del árbol de import de ``module``.
+
+    ``-X importtime`` lista cada módulo después de sus dependencias, con
+    sangría por nivel; se toma la fila raíz de ``module`` y las anteriores con
+    sangría hasta la raíz previa (lo que importó ``site`` queda fuera).
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name[1:].rstrip()))
+
+    end = next(i for i, row in enumerate(rows) if row[2] == module)
+    start = end
+    while start > 0 and rows[start - 1][2].startswith(" "):
+        start -= 1
+    return [(self_us, cumulative_us, name.strip()) for self_us, cumulative_us, name in rows[start:end + 1]]
+
+
+def wall_time(args: list[str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], capture_output=True, check=True)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    for module in MODULES:
+        rows = import_times(module)
+        total = rows[-1][1]
+        print(f"\n{module}: {total / 1000:.1f} ms acumulados")
+        for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[1:args.top + 1]:
+            print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    baseline = wall_time(["-c", "pass"], args.runs)
+    help_time = wall_time(["-m", "bugfix_automator.main", "--help"], args.runs)
+    warm_up = wall_time(
+        ["-c", "from bugfix_automator.drive_client import warm_up; warm_up()"], args.runs,
+    )
+    print(f"\nintérprete vacío            {baseline * 1000:8.1f} ms")
+    print(f"main --help                 {help_time * 1000:8.1f} ms")
+    print(f"warm_up de Google (fondo)   {warm_up * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,39 @@
 """BugFix Automator package."""
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+# Tipos públicos re-exportados; se importan al primer acceso para no sumar
+# tiempo de arranque a ``main --help`` ni al servidor web.
+_LAZY_EXPORTS = {
+    "IssueTable": "bugfix_automator.models",
+    "IssueTableView": "bugfix_automator.models",
+    "JiraIssue": "bugfix_automator.models",
+    "LazyJiraIssue": "bugfix_automator.models",
+    "ProcessedIssue": "bugfix_automator.models",
+    "ReportAggregator": "bugfix_automator.processor",
+}
+
 __all__ = [
+    "IssueTable",
+    "IssueTableView",
+    "JiraIssue",
+    "LazyJiraIssue",
+    "ProcessedIssue",
+    "ReportAggregator",
     "jira_client",
+    "issue_cache",
     "drive_client",
     "processor",
     "report_generator",
     "webapp",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
@@ -0,0 +1,129 @@
+"""Conversión de Atlassian Document Format (ADF) a texto plano."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import Any
+
+# Nodos inline sin hijos cuyo texto visible vive en ``attrs``.
+_INLINE_ATTR_TEXT = {
+    "mention": ("text",),
+    "emoji": ("text", "shortName"),
+    "status": ("text",),
+    "inlineCard": ("url",),
+    "blockCard": ("url",),
+    "embedCard": ("url",),
+}
+
+
+def flatten_adf(document: Any) -> str:
+    """Aplana un documento ADF a texto plano.
+
+    Cada fragmento de texto (nodos ``text``, menciones, emoji, estados y
+    cards) se recorta y se une a los demás con un espacio, igual que el
+    aplanador original: dos nodos ``"O"`` contiguos no forman un ``"OO"`` y
+    el conteo de OO de los reportes no cambia.
+
+    El recorrido usa una pila explícita de nodos, así documentos muy profundos
+    no dependen del límite de recursión de Python. Los nodos con un solo hijo
+    (celdas, ítems de lista) se descienden sin pasar por la pila.
+    """
+    if not document:
+        return ""
+
+    parts: list[str] = []
+    append = parts.append
+    stack: list[Any] = [document]
+    pop = stack.pop
+    extend = stack.extend
+
+    while stack:
+        node = pop()
+        while True:
+            if type(node) is dict:
+                children = node.get("content")
+                if not children:
+                    kind = node.get("type")
+                    if kind == "text":
+                        text = node.get("text", "").strip()
+                        if text:
+                            append(text)
+                    elif kind in _INLINE_ATTR_TEXT:
+                        text = _attr_text(node, _INLINE_ATTR_TEXT[kind])
+                        if text:
+                            append(text)
+                    break
+            elif type(node) is list:
+                children = node
+            else:
+                break
+            if len(children) == 1:
+                node = children[0]
+                continue
+            extend(reversed(children))
+            break
+
+    return " ".join(parts)
+
+
+def _attr_text(node: dict[str, Any], attr_names: tuple[str, ...]) -> str:
+    attrs = node.get("attrs") or {}
+    for name in attr_names:
+        if attrs.get(name):
+            return str(attrs[name]).strip()
+    return ""
+
+
+class _FlattenMemo:
+    """LRU acotado de descripciones ya aplanadas, por (key, updated)."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._items: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+    def get(self, cache_key: tuple[str, str]) -> str | None:
+        with self._lock:
+            text = self._items.get(cache_key)
+            if text is not None:
+                self._items.move_to_end(cache_key)
+            return text
+
+    def put(self, cache_key: tuple[str, str], text: str) -> None:
+        with self._lock:
+            self._items[cache_key] = text
+            self._items.move_to_end(cache_key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_MEMO = _FlattenMemo(maxsize=20_000)
+
+
+def flatten_description(
+    document: Any,
+    issue_key: str | None = None,
+    updated: str | None = None,
+) -> str:
+    """Aplana la descripción de un issue reutilizando el resultado si no cambió.
+
+    Con ``issue_key`` y ``updated`` el texto se memoiza: un issue que no se
+    modificó entre ejecuciones del mismo proceso no se vuelve a recorrer.
+    """
+    if not issue_key or not updated:
+        return flatten_adf(document)
+    cache_key = (issue_key, updated)
+    text = _MEMO.get(cache_key)
+    if text is None:
+        text = flatten_adf(document)
+        _MEMO.put(cache_key, text)
+    return text
+
+
+def clear_flatten_cache() -> None:
+    _MEMO.clear()
@@ -0,0 +1,208 @@
+"""HTTP/1.1 mínimo sobre asyncio (cliente con keep-alive y utilidades de parseo).
+
+Sólo cubre lo que necesitan las APIs de Jira y Google Sheets: peticiones con
+cuerpo JSON y respuestas con ``Content-Length``, ``chunked`` o cierre de
+conexión. No agrega dependencias externas.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+import contextlib
+from dataclasses import dataclass
+import json
+import ssl
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else {}
+
+
+class BodyTooLargeError(ValueError):
+    """El cuerpo anunciado o recibido supera el máximo permitido."""
+
+
+async def read_message_head(reader: asyncio.StreamReader) -> tuple[str, dict[str, str]] | None:
+    """Lee la línea inicial y las cabeceras (en minúsculas) de un mensaje HTTP.
+
+    Devuelve ``None`` si la conexión se cerró antes de empezar un mensaje.
+    """
+    try:
+        raw = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as exc:
+        if not exc.partial.strip():
+            return None
+        raise ConnectionError("mensaje HTTP incompleto") from exc
+    except asyncio.LimitOverrunError as exc:
+        raise ConnectionError("cabecera HTTP demasiado grande") from exc
+
+    lines = raw.decode("latin-1").split("\r\n")
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+async def read_body(
+    reader: asyncio.StreamReader,
+    headers: Mapping[str, str],
+    max_bytes: int | None = None,
+) -> bytes:
+    """Lee el cuerpo según ``Content-Length`` o ``Transfer-Encoding: chunked``.
+
+    Con ``max_bytes`` lanza ``BodyTooLargeError`` en cuanto el tamaño anunciado
+    (o lo acumulado en ``chunked`` o hasta el cierre) lo supera, sin leer de más.
+    """
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        parts = []
+        total = 0
+        while True:
+            size_line = await reader.readuntil(b"\r\n")
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size < 0:
+                raise ValueError("tamaño de chunk inválido")
+            if size == 0:
+                await reader.readuntil(b"\r\n")
+                return b"".join(parts)
+            total += size
+            _check_body_size(total, max_bytes)
+            parts.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+    length = headers.get("content-length")
+    if length is not None:
+        size = int(length)
+        if size < 0:
+            raise ValueError("Content-Length negativo")
+        _check_body_size(size, max_bytes)
+        return await reader.readexactly(size)
+    if max_bytes is None:
+        return await reader.read()
+    body = bytearray()
+    while chunk := await reader.read(64 * 1024):
+        body += chunk
+        _check_body_size(len(body), max_bytes)
+    return bytes(body)
+
+
+def _check_body_size(size: int, max_bytes: int | None) -> None:
+    if max_bytes is not None and size > max_bytes:
+        raise BodyTooLargeError(f"el cuerpo supera {max_bytes} bytes")
+
+
+class AsyncHttpClient:
+    """Cliente HTTP/1.1 con un pool de conexiones keep-alive por host.
+
+    Cada host admite a lo sumo ``max_connections_per_host`` peticiones en
+    curso; el resto espera su turno sin abrir sockets extra. Una conexión
+    ociosa que el servidor cerró se reemplaza de forma transparente.
+    """
+
+    def __init__(self, max_connections_per_host: int = 10, timeout_seconds: float = 30.0) -> None:
+        self._max_connections = max_connections_per_host
+        self._timeout = timeout_seconds
+        self._idle: dict[tuple[str, str, int], list[tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self._limits: dict[tuple[str, str, int], asyncio.Semaphore] = {}
+        self._ssl = ssl.create_default_context()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        json_body: Any = None,
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "", port)
+
+        target = parts.path or "/"
+        query = "&".join(q for q in (parts.query, urlencode(params or {}, doseq=True)) if q)
+        if query:
+            target = f"{target}?{query}"
+
+        body = b"" if json_body is None else json.dumps(json_body).encode("utf-8")
+        head = [f"{method} {target} HTTP/1.1", f"Host: {parts.netloc}", f"Content-Length: {len(body)}"]
+        if json_body is not None:
+            head.append("Content-Type: application/json")
+        head.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        payload = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+        limit = self._limits.setdefault(key, asyncio.Semaphore(self._max_connections))
+        async with limit:
+            return await asyncio.wait_for(self._exchange(key, payload, method), self._timeout)
+
+    async def close(self) -> None:
+        for connections in self._idle.values():
+            for _, writer in connections:
+                await _close_writer(writer)
+        self._idle.clear()
+
+    async def _exchange(self, key: tuple[str, str, int], payload: bytes, method: str) -> HttpResponse:
+        idle = self._idle.setdefault(key, [])
+        while idle:
+            reader, writer = idle.pop()
+            try:
+                return await self._send(key, reader, writer, payload, method)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # El servidor cerró la conexión ociosa: se prueba con otra.
+                pass
+        scheme, host, port = key
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=self._ssl if scheme == "https" else None,
+        )
+        return await self._send(key, reader, writer, payload, method)
+
+    async def _send(
+        self,
+        key: tuple[str, str, int],
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        payload: bytes,
+        method: str,
+    ) -> HttpResponse:
+        # Cualquier salida que no devuelva la conexión al pool (error, cierre
+        # pedido por el servidor o cancelación por timeout) la cierra.
+        pooled = False
+        try:
+            writer.write(payload)
+            await writer.drain()
+            message = await read_message_head(reader)
+            if message is None:
+                raise ConnectionError("el servidor cerró la conexión")
+            status_line, headers = message
+            status = int(status_line.split(" ", 2)[1])
+            body = b"" if method == "HEAD" or status in (204, 304) else await read_body(reader, headers)
+
+            keep_alive = headers.get("connection", "").lower() != "close" and (
+                "content-length" in headers or "chunked" in headers.get("transfer-encoding", "")
+            )
+            if keep_alive:
+                self._idle.setdefault(key, []).append((reader, writer))
+                pooled = True
+            return HttpResponse(status=status, headers=headers, body=body)
+        finally:
+            if not pooled:
+                await _close_writer(writer)
+
+
+async def _close_writer(writer: asyncio.StreamWriter) -> None:
+    writer.close()
+    with contextlib.suppress(ConnectionError, ssl.SSLError):
+        await writer.wait_closed()
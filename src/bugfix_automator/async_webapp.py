@@ -0,0 +1,416 @@
+"""Modo asyncio del servidor web: HTTP, Jira y Google Sheets en un solo event loop.
+
+Expone las mismas rutas que ``webapp.WebHandler`` (dashboard, ``/api/generate``,
+estado y eventos SSE de cada trabajo), pero cada conexión y cada generación es
+una corrutina: cientos de clientes SSE inactivos o generaciones solapadas no
+consumen un hilo cada uno.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from http import HTTPStatus
+import json
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+from bugfix_automator.async_http import AsyncHttpClient, BodyTooLargeError, read_body, read_message_head
+from bugfix_automator.config import JiraConfig, env_int, jira_config_from_env, load_env_file
+from bugfix_automator.jobs import BaseJobQueue, Job, JobCache, ProgressCallback, QueueFullError
+from bugfix_automator.webapp import (
+    DASHBOARD,
+    ISSUE_URL_RANGE,
+    JOB_PATH,
+    MAX_REQUEST_BODY_BYTES,
+    PROGRESS_EVERY_ISSUES,
+    SSE_KEEPALIVE_SECONDS,
+    StaticAsset,
+    generation_fingerprint,
+    generation_result,
+    get_google_credentials,
+    job_links,
+    parse_generate_request,
+    resolve_generation_target,
+    result_cache_from_env,
+    sheet_issue_keys,
+    warm_up_google,
+)
+
+if TYPE_CHECKING:
+    from google.oauth2.service_account import Credentials
+
+    from bugfix_automator.drive_client import AsyncSheetsClient
+    from bugfix_automator.jira_client import AsyncJiraClient
+
+
+class AsyncJob(Job):
+    """``Job`` cuyos eventos se esperan con ``await`` en lugar de bloquear un hilo.
+
+    Todos los accesos ocurren en el hilo del event loop, así que ``publish`` y
+    la espera no compiten entre sí.
+    """
+
+    def __init__(self, job_id: str) -> None:
+        super().__init__(job_id)
+        self._changed = asyncio.Event()
+
+    def publish(self, kind: str, **data: Any) -> None:
+        super().publish(kind, **data)
+        self._changed.set()
+
+    def _mark_running(self) -> None:
+        super()._mark_running()
+        self._changed.set()
+
+    def _finish(self, state: str, kind: str, **data: Any) -> None:
+        super()._finish(state, kind, **data)
+        self._changed.set()
+
+    async def wait_events(self, seq: int, timeout: float) -> list[Any]:
+        events = self.events_after(seq, timeout=0)
+        if events or self.finished:
+            return events
+        self._changed.clear()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.events_after(seq, timeout=0)
+
+
+class AsyncJobQueue(BaseJobQueue):
+    """Equivalente asyncio de ``JobQueue``: a lo sumo ``max_workers`` en curso.
+
+    ``submit`` (deduplicación y límite de pendientes) es el de
+    ``BaseJobQueue``; ``target`` es una corrutina que corre como tarea del
+    loop. Se llama desde el hilo del event loop.
+    """
+
+    job_class = AsyncJob
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 20,
+        cache: JobCache | None = None,
+    ) -> None:
+        super().__init__(max_pending, cache)
+        self._slots = asyncio.Semaphore(max(1, max_workers))
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def shutdown(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _dispatch(self, job: Job, target: Callable[[ProgressCallback], Any]) -> None:
+        task = asyncio.get_running_loop().create_task(self._execute(job, target))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, job: Job, target: Callable[[ProgressCallback], Any]) -> None:
+        async with self._slots:
+            progress = self._start(job)
+            try:
+                result = await target(progress)
+            except Exception as exc:
+                self._fail(job, exc)
+            else:
+                self._succeed(job, result)
+
+
+class AsyncServices:
+    """Clientes compartidos por el event loop: un pool HTTP, Jira por config y
+    Sheets por service account.
+
+    ``sheets_base_url`` y ``credentials_loader`` existen para apuntar a
+    servidores locales en pruebas.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 10,
+        sheets_base_url: str | None = None,
+        credentials_loader: Callable[[str], Credentials] = get_google_credentials,
+    ) -> None:
+        self.http = AsyncHttpClient(max_connections_per_host=max_connections_per_host)
+        self._sheets_base_url = sheets_base_url
+        self._credentials_loader = credentials_loader
+        self._jira: dict[JiraConfig, AsyncJiraClient] = {}
+        self._sheets: dict[str, tuple[Credentials, AsyncSheetsClient]] = {}
+
+    def jira(self, config: JiraConfig) -> AsyncJiraClient:
+        from bugfix_automator.jira_client import AsyncJiraClient
+
+        client = self._jira.get(config)
+        if client is None:
+            client = self._jira[config] = AsyncJiraClient(config, self.http)
+        return client
+
+    async def sheets(self, service_account_file: str) -> AsyncSheetsClient:
+        from bugfix_automator.drive_client import SHEETS_API_URL, AsyncSheetsClient
+
+        # getmtime, el import de google-auth y la lectura de la llave bloquean:
+        # se hacen en un hilo para no frenar el loop.
+        credentials = await asyncio.to_thread(self._credentials_loader, service_account_file)
+        cached = self._sheets.get(service_account_file)
+        if cached is not None and cached[0] is credentials:
+            return cached[1]
+        client = AsyncSheetsClient(credentials, self.http, base_url=self._sheets_base_url or SHEETS_API_URL)
+        self._sheets[service_account_file] = (credentials, client)
+        return client
+
+    async def close(self) -> None:
+        await self.http.close()
+
+
+async def run_generation_async(
+    services: AsyncServices,
+    jira_url: str,
+    statuses: list[str],
+    sheet_url: str,
+    round_numbers: list[int] | None = None,
+    tester: str = "",
+    reconcile: bool = False,
+    progress: ProgressCallback | None = None,
+    verify: bool = False,
+    refresh: bool = False,
+) -> dict[str, Any]:
+    """Versión asíncrona de ``webapp.run_generation`` con el mismo resultado."""
+    from bugfix_automator.jira_client import SHEET_FIELDS
+
+    # ``load_env_file`` lee el disco en cada pedido: fuera del loop.
+    target = await asyncio.to_thread(resolve_generation_target, jira_url, sheet_url)
+    progress = progress or (lambda phase, **data: None)
+    reported = 0
+
+    def on_page(received: int) -> None:
+        nonlocal reported
+        if received - reported >= PROGRESS_EVERY_ISSUES:
+            reported = received
+            progress("jira", issues=received)
+
+    jira_client = services.jira(jira_config_from_env(target.base_url))
+    sheets = await services.sheets(target.service_account_file)
+    calls_before = sheets.api_calls
+    if refresh:
+        rows = await sheets.read_rows(target.spreadsheet_id, range_=ISSUE_URL_RANGE)
+        issues = await jira_client.fetch_issues_by_keys(sheet_issue_keys(rows), fields=SHEET_FIELDS)
+    else:
+        issues = await jira_client.fetch_issues_by_statuses(
+            statuses, project=target.project, parent_key=target.parent_key,
+            fields=SHEET_FIELDS, on_page=on_page,
+        )
+    progress("jira", issues=len(issues), done=True)
+
+    setup = await sheets.setup_bfv_spreadsheet(
+        spreadsheet_id=target.spreadsheet_id,
+        title=target.title,
+        jira_base_url=target.base_url,
+        issues=issues,
+        round_numbers=round_numbers or [],
+        default_status=statuses[0] if statuses else "For review",
+        tester=tester,
+        reconcile=reconcile or refresh,
+        on_call=lambda call: progress(
+            "sheets", calls=sheets.api_calls - calls_before, method=call.method,
+        ),
+        verify=verify,
+    )
+    return generation_result(setup, sheets.api_calls - calls_before)
+
+
+class AsyncWebServer:
+    """Servidor HTTP/1.1 keep-alive sobre ``asyncio.start_server``."""
+
+    def __init__(self, services: AsyncServices, jobs: AsyncJobQueue) -> None:
+        self.services = services
+        self.jobs = jobs
+        self._server: asyncio.Server | None = None
+
+    async def start(self, host: str, port: int) -> int:
+        """Empieza a escuchar y devuelve el puerto efectivo (útil con ``port=0``)."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.jobs.shutdown()
+        await self.services.close()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                message = await read_message_head(reader)
+                if message is None:
+                    return
+                request_line, headers = message
+                method, path, version = request_line.split(" ", 2)
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    if version == "HTTP/1.1"
+                    else headers.get("connection", "").lower() == "keep-alive"
+                )
+                body = b""
+                if method == "POST":
+                    # El límite se aplica al leer, sea cual sea el framing; sin
+                    # framing habría que esperar al cierre, así que se pide largo.
+                    rejection = None
+                    chunked = "chunked" in headers.get("transfer-encoding", "").lower()
+                    if "content-length" not in headers and not chunked:
+                        rejection = HTTPStatus.LENGTH_REQUIRED
+                    else:
+                        try:
+                            body = await read_body(reader, headers, MAX_REQUEST_BODY_BYTES)
+                        except BodyTooLargeError:
+                            rejection = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+                        except ValueError:
+                            rejection = HTTPStatus.BAD_REQUEST
+                    if rejection is not None:
+                        await self._respond(writer, rejection, close=True)
+                        return
+                keep_alive = await self._route(writer, method, path, headers, body) and keep_alive
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            return
+        finally:
+            writer.close()
+
+    async def _route(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> bool:
+        """Atiende una petición; devuelve ``False`` si la conexión debe cerrarse."""
+        if method == "GET" and path == "/":
+            await self._asset(writer, DASHBOARD, headers)
+            return True
+        if method == "POST" and path == "/api/generate":
+            await self._generate(writer, body)
+            return True
+        match = JOB_PATH.match(urlparse(path).path) if method == "GET" else None
+        job = self.jobs.get(match.group(1)) if match else None
+        if job is None:
+            await self._respond(writer, HTTPStatus.NOT_FOUND)
+            return True
+        if match.group(2):
+            await self._stream_events(writer, job, headers)
+            return False
+        await self._json(writer, job.snapshot(), HTTPStatus.OK)
+        return True
+
+    async def _generate(self, writer: asyncio.StreamWriter, body: bytes) -> None:
+        try:
+            request = parse_generate_request(json.loads(body.decode("utf-8") or "{}"))
+        except ValueError as exc:
+            await self._json(writer, {"error": str(exc)}, HTTPStatus.BAD_REQUEST)
+            return
+        try:
+            job = self.jobs.submit(
+                lambda progress: run_generation_async(self.services, **request, progress=progress),
+                key=generation_fingerprint(request),
+            )
+        except QueueFullError as exc:
+            await self._json(writer, {"error": str(exc)}, HTTPStatus.SERVICE_UNAVAILABLE)
+            return
+        await self._json(writer, job_links(job), HTTPStatus.ACCEPTED)
+
+    async def _stream_events(self, writer: asyncio.StreamWriter, job: AsyncJob, headers: dict[str, str]) -> None:
+        try:
+            last_seq = int(headers.get("last-event-id", "0"))
+        except ValueError:
+            last_seq = 0
+        writer.write(_head(HTTPStatus.OK, {
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "Connection": "close",
+        }))
+        while True:
+            events = await job.wait_events(last_seq, SSE_KEEPALIVE_SECONDS)
+            if not events:
+                writer.write(b": keepalive\n\n")
+            for event in events:
+                writer.write(
+                    f"id: {event.seq}\nevent: {event.kind}\ndata: {json.dumps(event.data)}\n\n"
+                    .encode("utf-8")
+                )
+                last_seq = event.seq
+            await writer.drain()
+            if job.finished and not job.events_after(last_seq, timeout=0):
+                return
+
+    async def _asset(self, writer: asyncio.StreamWriter, asset: StaticAsset, headers: dict[str, str]) -> None:
+        encoding = asset.negotiate(headers.get("accept-encoding", ""))
+        body, etag = asset.variants[encoding]
+        response_headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if asset.matches(headers.get("if-none-match", ""), encoding):
+            writer.write(_head(HTTPStatus.NOT_MODIFIED, response_headers))
+            await writer.drain()
+            return
+        response_headers["Content-Type"] = asset.content_type
+        if encoding != "identity":
+            response_headers["Content-Encoding"] = encoding
+        await self._respond(writer, HTTPStatus.OK, body, response_headers)
+
+    async def _json(self, writer: asyncio.StreamWriter, payload: dict[str, Any], status: HTTPStatus) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        await self._respond(writer, status, body, {"Content-Type": "application/json"})
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        body: bytes = b"",
+        headers: dict[str, str] | None = None,
+        close: bool = False,
+    ) -> None:
+        headers = {**(headers or {}), "Content-Length": str(len(body))}
+        if close:
+            headers["Connection"] = "close"
+        writer.write(_head(status, headers) + body)
+        await writer.drain()
+
+
+def _head(status: HTTPStatus, headers: dict[str, str]) -> bytes:
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def serve(host: str = "0.0.0.0", port: int = 8080) -> None:
+    load_env_file()
+    services = AsyncServices(max_connections_per_host=env_int("JIRA_POOL_SIZE", 10))
+    jobs = AsyncJobQueue(
+        max_workers=env_int("WEB_MAX_JOBS", 2),
+        max_pending=env_int("WEB_MAX_PENDING_JOBS", 20),
+        cache=result_cache_from_env(),
+    )
+    server = AsyncWebServer(services, jobs)
+    await server.start(host, port)
+    # Importar google-auth bloquea cientos de ms: se hace fuera del loop.
+    warm_up = asyncio.get_running_loop().run_in_executor(None, warm_up_google)
+    print(f"BugFix Automator UI (asyncio) disponible en http://localhost:{port}")
+    try:
+        await server.serve_forever()
+    finally:
+        warm_up.cancel()
+        await server.close()
+
+
+def run_async_server(host: str = "0.0.0.0", port: int = 8080) -> None:
+    try:
+        asyncio.run(serve(host, port))
+    except KeyboardInterrupt:
+        pass
+    print("\nServidor detenido.")
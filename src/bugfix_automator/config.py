@@ -13,6 +13,15 @@ class JiraConfig:
     base_url: str
     email: str
     api_token: str
+    pool_connections: int = 4
+    pool_maxsize: int = 10
+    page_concurrency: int = 1
+    partition_size: int = 0
+    cache_path: Optional[str] = None
+    cache_full_sync_hours: int = 24
+    max_retries: int = 5
+    backoff_base_seconds: float = 1.0
+    backoff_max_seconds: float = 60.0
 
 
 @dataclass(frozen=True)
@@ -56,10 +65,43 @@ def load_env_file(path: str = ".env") -> None:
         os.environ.setdefault(key, value)
 
 
-def load_config_from_env() -> AppConfig:
-    """Carga configuración obligatoria desde variables de entorno."""
+def env_int(key: str, default: int) -> int:
+    """Lee un entero de una variable de entorno, con valor por defecto."""
+    raw = os.getenv(key, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise ValueError(f"{key} debe ser un entero, recibido: {raw!r}") from exc
+
+
+def jira_config_from_env(base_url: str) -> JiraConfig:
+    """Arma ``JiraConfig`` para ``base_url`` con credenciales y ajustes del entorno."""
+    return JiraConfig(
+        base_url=base_url.rstrip("/"),
+        email=os.environ.get("JIRA_EMAIL", ""),
+        api_token=os.environ.get("JIRA_API_TOKEN", ""),
+        pool_maxsize=env_int("JIRA_POOL_SIZE", 10),
+        page_concurrency=env_int("JIRA_PAGE_CONCURRENCY", 1),
+        partition_size=env_int("JIRA_PARTITION_SIZE", 0),
+        cache_path=os.getenv("JIRA_CACHE_PATH") or None,
+        cache_full_sync_hours=env_int("JIRA_CACHE_FULL_SYNC_HOURS", 24),
+        max_retries=env_int("JIRA_MAX_RETRIES", 5),
+    )
+
+
+def load_config_from_env(require_google: bool = True) -> AppConfig:
+    """Carga configuración obligatoria desde variables de entorno.
+
+    Con ``require_google=False`` (reportes locales CSV/XLSX) la service account
+    de Google no es obligatoria.
+    """
+    required = ["JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN"]
+    if require_google:
+        required.append("GOOGLE_SERVICE_ACCOUNT_FILE")
     missing = []
-    for key in ["JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN", "GOOGLE_SERVICE_ACCOUNT_FILE"]:
+    for key in required:
         if not os.getenv(key):
             missing.append(key)
 
@@ -68,13 +110,9 @@ def load_config_from_env() -> AppConfig:
             f"Faltan variables de entorno requeridas: {', '.join(missing)}"
         )
 
-    jira = JiraConfig(
-        base_url=os.environ["JIRA_BASE_URL"].rstrip("/"),
-        email=os.environ["JIRA_EMAIL"],
-        api_token=os.environ["JIRA_API_TOKEN"],
-    )
+    jira = jira_config_from_env(os.environ["JIRA_BASE_URL"])
     google = GoogleConfig(
-        service_account_file=os.environ["GOOGLE_SERVICE_ACCOUNT_FILE"],
+        service_account_file=os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE", ""),
         drive_folder_id=os.getenv("GOOGLE_DRIVE_FOLDER_ID"),
     )
 
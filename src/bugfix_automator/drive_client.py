@@ -2,10 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from functools import lru_cache
+import json
+import re
+from typing import TYPE_CHECKING, Any, TypeVar
+from urllib.parse import quote
 
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from bugfix_automator.retry import RetryPolicy
+
+# Las librerías de Google tardan cientos de ms en importarse: se cargan al
+# crear el primer cliente, no al importar este módulo.
+if TYPE_CHECKING:
+    from google.oauth2.service_account import Credentials
+
+    from bugfix_automator.async_http import AsyncHttpClient
+
+T = TypeVar("T")
+
+SHEETS_API_URL = "https://sheets.googleapis.com"
 
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
@@ -22,6 +39,21 @@ ISSUES_HEADERS = [
 
 NUM_COLS = len(ISSUES_HEADERS)
 
+_SPREADSHEET_ID = re.compile(r"/spreadsheets/d/([a-zA-Z0-9_-]+)")
+
+# Límites de cada escritura al volcar un reporte (la API recomienda payloads
+# de hasta ~2 MB por pedido).
+REPORT_CHUNK_ROWS = 5_000
+REPORT_CHUNK_BYTES = 2_000_000
+
+# Filas de ``Issues`` que se releen con ``verify=True``.
+VERIFY_SAMPLE_ROWS = 5
+
+# Columnas (índice 0) con listas desplegables y colores condicionales.
+COL_ESTADO_JIRA = 5
+COL_QA_RESULT = 6
+COL_STATUS = 7
+
 QA_TEMPLATE = (
     "Template:\n"
     "QA Passed / Failed \n"
@@ -67,15 +99,69 @@ EXTRA_STATUS_COLORS = [
 ]
 
 
+@dataclass(frozen=True)
+class SheetsCall:
+    """Una llamada a la Sheets API descrita como datos.
+
+    ``method`` es ``get``, ``batchUpdate`` o ``values.<método>``; ``params``
+    son los argumentos de la llamada además de ``spreadsheetId``.
+    """
+
+    method: str
+    spreadsheet_id: str
+    params: dict[str, Any]
+
+
+# Un plan produce llamadas, recibe cada respuesta y devuelve un resultado final.
+SheetsPlan = Generator[SheetsCall, dict[str, Any], T]
+
+
+@dataclass(frozen=True)
+class BfvRow:
+    """Columnas de una fila de datos de ``Issues`` que la herramienta escribe."""
+
+    number: str
+    tester: str
+    url: str
+    status: str
+
+
+@dataclass(frozen=True)
+class BfvSetupResult:
+    """Resultado de ``plan_bfv_setup``.
+
+    ``rows`` son las filas de datos de ``Issues`` tal como quedaron (desde la
+    fila 4), calculadas en memoria sin releer la hoja. ``verified`` es
+    ``None`` si no se pidió verificación.
+    """
+
+    spreadsheet: dict[str, Any]
+    rows: list[BfvRow]
+    verified: bool | None = None
+
+
 class DriveClient:
-    """Cliente para crear hojas de cálculo y escribir datos tabulares."""
+    """Cliente para crear hojas de cálculo y escribir datos tabulares.
 
-    def __init__(self, service_account_file: str) -> None:
-        credentials = Credentials.from_service_account_file(
-            service_account_file,
-            scopes=SCOPES,
-        )
-        self._sheets = build("sheets", "v4", credentials=credentials)
+    Las operaciones se arman como planes (``SheetsPlan``) que agrupan todos
+    los requests posibles en una misma llamada; ``api_calls`` cuenta las
+    llamadas HTTP hechas y ``last_run_calls`` las de la última operación.
+    """
+
+    def __init__(
+        self,
+        service_account_file: str | None = None,
+        credentials: Credentials | None = None,
+    ) -> None:
+        """Con ``credentials`` se reutilizan credenciales ya cargadas (y su token
+        vigente) en lugar de leer ``service_account_file``."""
+        if credentials is None:
+            if not service_account_file:
+                raise ValueError("Se requiere service_account_file o credentials")
+            credentials = load_credentials(service_account_file)
+        self._sheets = build_sheets_service(credentials)
+        self.api_calls = 0
+        self.last_run_calls = 0
 
     # ------------------------------------------------------------------
     # Setup BFV structure on an existing spreadsheet
@@ -90,319 +176,723 @@ class DriveClient:
         round_numbers: list[int] | None = None,
         default_status: str = "For review",
         tester: str = "",
+        reconcile: bool = False,
+        on_call: Callable[[SheetsCall], None] | None = None,
+        verify: bool = False,
+    ) -> BfvSetupResult:
+        """Configura un spreadsheet existente con la estructura BFV.
+
+        Usa tres llamadas: lectura de pestañas, un único ``batchUpdate`` con
+        estructura, formato, validaciones y colores, y la escritura de valores.
+        Con ``reconcile=True`` actualiza por diferencias sin borrar lo cargado
+        por los testers (ver ``plan_bfv_setup``). ``on_call`` se invoca tras
+        cada llamada completada, para informar avance. Las filas escritas
+        vuelven en el resultado, sin releer la hoja; ``verify=True`` agrega una
+        lectura de muestra.
+        """
+        return self._run(plan_bfv_setup(
+            spreadsheet_id=spreadsheet_id,
+            title=title,
+            jira_base_url=jira_base_url,
+            issues=issues,
+            round_numbers=round_numbers,
+            default_status=default_status,
+            tester=tester,
+            reconcile=reconcile,
+            verify=verify,
+        ), on_call=on_call)
+
+    def write_rows(
+        self,
+        spreadsheet_id: str,
+        rows: Iterable[Sequence[Any]],
+        sheet_title: str = "Reporte",
+        on_call: Callable[[SheetsCall], None] | None = None,
     ) -> dict[str, Any]:
-        """Configura un spreadsheet existente con la estructura BFV."""
+        """Vuelca ``rows`` en la pestaña ``sheet_title`` por bloques (ver ``plan_report_upload``)."""
+        return self._run(plan_report_upload(spreadsheet_id, sheet_title, rows), on_call=on_call)
 
-        existing = self._sheets.spreadsheets().get(
-            spreadsheetId=spreadsheet_id,
-            fields="spreadsheetId,spreadsheetUrl,sheets/properties",
-        ).execute()
+    # ------------------------------------------------------------------
+    # Generic read helpers
+    # ------------------------------------------------------------------
 
-        existing_tabs = {
-            s["properties"]["title"]: s["properties"]["sheetId"]
-            for s in existing["sheets"]
-        }
+    def read_rows(self, spreadsheet_id: str, range_: str = "A:Z") -> list[list[str]]:
+        result = self._execute(SheetsCall("values.get", spreadsheet_id, {"range": range_}))
+        return result.get("values", [])
 
-        tab_names = ["Issues"]
-        for rn in sorted(round_numbers or []):
-            tab_names.append(f"Round {rn}")
-        tab_names.append("Summary")
-
-        tabs_to_create = [name for name in tab_names if name not in existing_tabs]
-        tabs_to_clear = [name for name in tab_names if name in existing_tabs]
-
-        if tabs_to_create:
-            add_requests: list[dict[str, Any]] = [
-                {"addSheet": {"properties": {"title": name}}}
-                for name in tabs_to_create
-            ]
-            self._sheets.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={"requests": add_requests},
-            ).execute()
-
-        if tabs_to_clear:
-            clear_data = [
-                {"range": f"'{name}'!A:Z"} for name in tabs_to_clear
-            ]
-            self._sheets.spreadsheets().values().batchClear(
-                spreadsheetId=spreadsheet_id,
-                body={"ranges": [d["range"] for d in clear_data]},
-            ).execute()
-
-            unmerge_requests = [
-                {"unmergeCells": {"range": {"sheetId": existing_tabs[name]}}}
-                for name in tabs_to_clear
-            ]
-            self._sheets.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={"requests": unmerge_requests},
-            ).execute()
-
-        self._sheets.spreadsheets().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body={"requests": [
-                {"updateSpreadsheetProperties": {
-                    "properties": {"title": title},
-                    "fields": "title",
-                }}
-            ]},
-        ).execute()
-
-        refreshed = self._sheets.spreadsheets().get(
-            spreadsheetId=spreadsheet_id,
-            fields="spreadsheetId,spreadsheetUrl,sheets/properties",
-        ).execute()
-
-        sheet_ids = {
-            s["properties"]["title"]: s["properties"]["sheetId"]
-            for s in refreshed["sheets"]
-        }
+    # ------------------------------------------------------------------
+    # Plan execution
+    # ------------------------------------------------------------------
 
-        issue_like_tabs = ["Issues"] + [
-            f"Round {rn}" for rn in sorted(round_numbers or [])
-        ]
+    def _run(
+        self,
+        plan: SheetsPlan[T],
+        on_call: Callable[[SheetsCall], None] | None = None,
+    ) -> T:
+        calls_before = self.api_calls
+        try:
+            call = next(plan)
+            while True:
+                response = self._execute(call)
+                if on_call is not None:
+                    on_call(call)
+                call = plan.send(response)
+        except StopIteration as finished:
+            return finished.value
+        finally:
+            self.last_run_calls = self.api_calls - calls_before
 
-        extra_statuses = []
-        for issue in issues:
-            st = issue.status
-            if st and st not in ESTADO_JIRA_COLORS and st not in extra_statuses:
-                extra_statuses.append(st)
+    def _execute(self, call: SheetsCall) -> dict[str, Any]:
+        resource = self._sheets.spreadsheets()
+        method = call.method
+        if method.startswith("values."):
+            resource = resource.values()
+            method = method.split(".", 1)[1]
+        request = getattr(resource, method)(spreadsheetId=call.spreadsheet_id, **call.params)
+        self.api_calls += 1
+        return request.execute()
 
-        estado_colors = dict(ESTADO_JIRA_COLORS)
-        for i, st in enumerate(extra_statuses):
-            estado_colors[st] = EXTRA_STATUS_COLORS[i % len(EXTRA_STATUS_COLORS)]
 
-        self._apply_bfv_formatting(spreadsheet_id, sheet_ids, issue_like_tabs)
-        self._apply_data_validation(
-            spreadsheet_id, sheet_ids, issue_like_tabs, len(issues),
-            estado_colors,
-        )
-        self._apply_conditional_colors(
-            spreadsheet_id, sheet_ids, issue_like_tabs, len(issues),
-            estado_colors,
-        )
-        self._write_bfv_data(
-            spreadsheet_id, jira_base_url, issues, issue_like_tabs,
-            default_status, tester,
-        )
+class AsyncSheetsClient:
+    """Ejecuta los mismos planes que ``DriveClient`` sobre la API REST de Sheets
+    con un ``AsyncHttpClient``, sin bloquear el event loop.
 
-        return refreshed
+    El token de la service account se renueva en un hilo (``google-auth`` es
+    síncrono) sólo cuando vence. Las respuestas 429/5xx transitorias y los
+    fallos de conexión se reintentan según ``retry`` (la misma política que
+    los clientes de Jira). ``base_url`` permite apuntar a un servidor local de
+    pruebas.
+    """
 
-    def _apply_bfv_formatting(
+    def __init__(
         self,
-        spreadsheet_id: str,
-        sheet_ids: dict[str, int],
-        issue_like_tabs: list[str],
+        credentials: Credentials,
+        http: AsyncHttpClient,
+        base_url: str = SHEETS_API_URL,
+        retry: RetryPolicy = RetryPolicy(),
     ) -> None:
-        summary_id = sheet_ids["Summary"]
+        self._credentials = credentials
+        self._http = http
+        self._base_url = base_url.rstrip("/")
+        self._retry = retry
+        self._token_lock = asyncio.Lock()
+        self._sleep = asyncio.sleep
+        self.api_calls = 0
+
+    async def setup_bfv_spreadsheet(
+        self,
+        on_call: Callable[[SheetsCall], None] | None = None,
+        **plan_kwargs: Any,
+    ) -> BfvSetupResult:
+        """Versión asíncrona de ``DriveClient.setup_bfv_spreadsheet``."""
+        return await self.run(plan_bfv_setup(**plan_kwargs), on_call=on_call)
+
+    async def read_rows(self, spreadsheet_id: str, range_: str = "A:Z") -> list[list[str]]:
+        result = await self._execute(SheetsCall("values.get", spreadsheet_id, {"range": range_}))
+        return result.get("values", [])
+
+    async def run(
+        self,
+        plan: SheetsPlan[T],
+        on_call: Callable[[SheetsCall], None] | None = None,
+    ) -> T:
+        try:
+            call = next(plan)
+            while True:
+                response = await self._execute(call)
+                if on_call is not None:
+                    on_call(call)
+                call = plan.send(response)
+        except StopIteration as finished:
+            return finished.value
+
+    async def _execute(self, call: SheetsCall) -> dict[str, Any]:
+        http_method, suffix = _REST_ROUTES[call.method]
+        params = dict(call.params)
+        body = params.pop("body", None)
+        if "range" in params:
+            suffix = suffix.format(range=quote(params.pop("range"), safe=""))
+        url = f"{self._base_url}/v4/spreadsheets/{quote(call.spreadsheet_id, safe='')}{suffix}"
+
+        for attempt in range(self._retry.max_retries + 1):
+            headers = {"Authorization": f"Bearer {await self._token()}", "Accept": "application/json"}
+            try:
+                response = await self._http.request(
+                    http_method, url, params=params, headers=headers, json_body=body,
+                )
+            except (OSError, asyncio.TimeoutError):
+                decision = self._retry.delay(attempt)
+                if decision is None:
+                    raise
+            else:
+                self.api_calls += 1
+                if response.status == 200:
+                    return response.json()
+                decision = self._retry.delay(attempt, response.status, response.headers)
+                if decision is None:
+                    raise RuntimeError(f"Google Sheets respondió {response.status}: {response.text[:500]}")
+            await self._sleep(decision[0])
+        raise AssertionError("unreachable")
+
+    async def _token(self) -> str:
+        async with self._token_lock:
+            if not self._credentials.valid:
+                from google.auth.transport.requests import Request
+
+                await asyncio.to_thread(self._credentials.refresh, Request())
+            return self._credentials.token
+
+
+# Método de ``SheetsCall`` -> (verbo HTTP, sufijo de la ruta REST del spreadsheet).
+_REST_ROUTES = {
+    "get": ("GET", ""),
+    "batchUpdate": ("POST", ":batchUpdate"),
+    "values.get": ("GET", "/values/{range}"),
+    "values.batchGet": ("GET", "/values:batchGet"),
+    "values.batchUpdate": ("POST", "/values:batchUpdate"),
+    "values.update": ("PUT", "/values/{range}"),
+    "values.clear": ("POST", "/values/{range}:clear"),
+}
+
+
+def spreadsheet_id_from_url(url: str) -> str | None:
+    """ID de un Google Sheet a partir de su URL (``.../spreadsheets/d/ID/...``)."""
+    match = _SPREADSHEET_ID.search(url)
+    return match.group(1) if match else None
+
+
+def load_credentials(service_account_file: str) -> Credentials:
+    """Credenciales de service account con los scopes de Sheets y Drive.
+
+    El token de acceso se obtiene en la primera llamada y se renueva solo al
+    vencer, por lo que conviene compartir la instancia entre clientes.
+    """
+    from google.oauth2.service_account import Credentials
+
+    return Credentials.from_service_account_file(service_account_file, scopes=SCOPES)
+
+
+def build_sheets_service(credentials: Credentials) -> Any:
+    """Construye el servicio Sheets v4 sin red, desde el discovery empaquetado."""
+    from googleapiclient.discovery import build, build_from_document
+
+    document = _sheets_discovery_document()
+    if document is None:
+        return build("sheets", "v4", credentials=credentials, static_discovery=True)
+    return build_from_document(document, credentials=credentials)
+
+
+def warm_up() -> None:
+    """Importa las librerías de Google y parsea el discovery por adelantado.
+
+    Pensado para un hilo en segundo plano al arrancar el servidor web, así la
+    primera generación no paga ese costo.
+    """
+    import google.auth.transport.requests  # noqa: F401
+    import google.oauth2.service_account  # noqa: F401
+    import googleapiclient.discovery  # noqa: F401
+
+    _sheets_discovery_document()
+
+
+@lru_cache(maxsize=1)
+def _sheets_discovery_document() -> dict[str, Any] | None:
+    # google-api-python-client >= 2 incluye el documento de discovery de
+    # Sheets v4; se parsea una vez por proceso en lugar de en cada ``build``.
+    from googleapiclient import discovery_cache
+
+    raw = discovery_cache.get_static_doc("sheets", "v4")
+    return json.loads(raw) if raw else None
+
 
-        all_cell = {
-            "userEnteredFormat": {
-                "wrapStrategy": "WRAP",
-                "verticalAlignment": "TOP",
-                "textFormat": {"fontFamily": "Arial"},
+# ------------------------------------------------------------------
+# Plans
+# ------------------------------------------------------------------
+
+def plan_bfv_setup(
+    spreadsheet_id: str,
+    title: str,
+    jira_base_url: str,
+    issues: list[Any],
+    round_numbers: list[int] | None = None,
+    default_status: str = "For review",
+    tester: str = "",
+    reconcile: bool = False,
+    verify: bool = False,
+) -> SheetsPlan[BfvSetupResult]:
+    """Plan de configuración BFV: ``get`` + un ``batchUpdate`` + ``values.batchUpdate``.
+
+    Los ``sheetId`` de las pestañas nuevas se asignan en el propio ``addSheet``,
+    así el formato de esas pestañas viaja en el mismo ``batchUpdate`` sin
+    volver a leer el spreadsheet. Las reglas de color condicional que dejó una
+    corrida anterior se reemplazan en lugar de acumularse. El resultado trae
+    el recurso del spreadsheet con las propiedades de todas sus pestañas
+    (incluidas las nuevas, tomadas de las respuestas de ``addSheet``) y las
+    filas de ``Issues`` escritas.
+
+    Con ``verify=True`` se agrega una lectura de unas pocas filas de muestra
+    (primera, última y algunas intermedias) para confirmar que la hoja quedó
+    como se calculó.
+
+    Con ``reconcile=True`` y una pestaña ``Issues`` existente no se limpia
+    nada: se leen una vez sus columnas A:C y F, se compara por URL del ticket
+    (columna C) y sólo se escriben los estados que cambiaron y las filas
+    nuevas, conservando lo que cargaron los testers. Las pestañas existentes
+    de rondas y ``Summary`` no se tocan.
+    """
+    existing = yield SheetsCall("get", spreadsheet_id, {
+        "fields": "spreadsheetId,spreadsheetUrl,sheets(properties,conditionalFormats)",
+    })
+
+    existing_tabs = {
+        s["properties"]["title"]: s["properties"]["sheetId"]
+        for s in existing["sheets"]
+    }
+
+    tab_names = ["Issues"]
+    for rn in sorted(round_numbers or []):
+        tab_names.append(f"Round {rn}")
+    tab_names.append("Summary")
+
+    tabs_to_create = [name for name in tab_names if name not in existing_tabs]
+    tabs_to_clear = [name for name in tab_names if name in existing_tabs]
+    reconcile = reconcile and "Issues" in existing_tabs
+
+    sheet_ids = dict(existing_tabs)
+    next_id = max(existing_tabs.values(), default=0) + 1
+    for name in tabs_to_create:
+        sheet_ids[name] = next_id
+        next_id += 1
+
+    issue_like_tabs = ["Issues"] + [
+        f"Round {rn}" for rn in sorted(round_numbers or [])
+    ]
+    estado_colors = _estado_colors(issues)
+
+    if reconcile:
+        current = yield SheetsCall("values.batchGet", spreadsheet_id, {
+            "ranges": ["Issues!A1:C", "Issues!F1:F"],
+        })
+        value_ranges = current.get("valueRanges", [{}, {}])
+        value_data, rows = _reconciled_value_data(
+            jira_base_url,
+            issues,
+            current_abc=value_ranges[0].get("values", []),
+            current_f=value_ranges[1].get("values", []),
+            tester=tester,
+        )
+        value_data.extend(_bfv_value_data(
+            jira_base_url, [], [tab for tab in issue_like_tabs if tab in tabs_to_create],
+            default_status, tester, include_summary="Summary" in tabs_to_create,
+        ))
+    else:
+        value_data = _bfv_value_data(
+            jira_base_url, issues, issue_like_tabs, default_status, tester,
+        )
+        rows = [
+            BfvRow(str(number), tester, f"{jira_base_url}/browse/{issue.key}", issue.status)
+            for number, issue in enumerate(issues, start=1)
+        ]
+    num_rows = len(rows)
+
+    requests: list[dict[str, Any]] = [
+        {"addSheet": {"properties": {"title": name, "sheetId": sheet_ids[name]}}}
+        for name in tabs_to_create
+    ]
+    for name in tabs_to_clear:
+        if reconcile:
+            if name in issue_like_tabs:
+                # Sólo la fila "Date", que se vuelve a combinar más abajo.
+                requests.append({"unmergeCells": {
+                    "range": _range(existing_tabs[name], rows=(1, 2), cols=(0, NUM_COLS)),
+                }})
+            continue
+        requests.append({
+            "updateCells": {
+                "range": {"sheetId": existing_tabs[name]},
+                "fields": "userEnteredValue",
             }
+        })
+        requests.append({"unmergeCells": {"range": {"sheetId": existing_tabs[name]}}})
+    requests.append({
+        "updateSpreadsheetProperties": {
+            "properties": {"title": title},
+            "fields": "title",
         }
-        all_fields = "userEnteredFormat(wrapStrategy,verticalAlignment,textFormat)"
-
-        header_cell = {
-            "userEnteredFormat": {
-                "backgroundColor": HEADER_BG,
-                "textFormat": {"fontFamily": "Arial", "bold": True},
-                "wrapStrategy": "WRAP",
-                "verticalAlignment": "TOP",
-            }
+    })
+    requests.extend(_formatting_requests(sheet_ids, issue_like_tabs))
+    requests.extend(_data_validation_requests(
+        sheet_ids, issue_like_tabs, num_rows, estado_colors,
+    ))
+    requests.extend(_owned_rule_deletions(
+        existing["sheets"], [existing_tabs[name] for name in issue_like_tabs if name in existing_tabs],
+    ))
+    requests.extend(_conditional_color_requests(
+        sheet_ids, issue_like_tabs, num_rows, estado_colors,
+    ))
+
+    updated = yield SheetsCall("batchUpdate", spreadsheet_id, {
+        "body": {"requests": requests},
+    })
+
+    if value_data:
+        yield SheetsCall("values.batchUpdate", spreadsheet_id, {
+            "body": {"valueInputOption": "RAW", "data": value_data},
+        })
+
+    verified = None
+    if verify:
+        sample = _verification_sample(len(rows))
+        verified = True
+        if sample:
+            read = yield SheetsCall("values.batchGet", spreadsheet_id, {
+                "ranges": [f"Issues!A{index + 4}:F{index + 4}" for index in sample],
+            })
+            value_ranges = read.get("valueRanges", [])
+            verified = len(value_ranges) == len(sample) and all(
+                _row_matches(rows[index], value_range.get("values", []))
+                for index, value_range in zip(sample, value_ranges)
+            )
+
+    sheets = [{"properties": sheet["properties"]} for sheet in existing["sheets"]]
+    sheets.extend(
+        {"properties": reply["addSheet"]["properties"]}
+        for reply in updated.get("replies", [])
+        if "addSheet" in reply
+    )
+    return BfvSetupResult(spreadsheet={**existing, "sheets": sheets}, rows=rows, verified=verified)
+
+
+# ------------------------------------------------------------------
+# Request builders
+# ------------------------------------------------------------------
+
+def plan_report_upload(
+    spreadsheet_id: str,
+    sheet_title: str,
+    rows: Iterable[Sequence[Any]],
+    chunk_rows: int = REPORT_CHUNK_ROWS,
+    chunk_bytes: int = REPORT_CHUNK_BYTES,
+) -> SheetsPlan[dict[str, Any]]:
+    """Plan para escribir un reporte tabular en una pestaña, por bloques acotados.
+
+    Crea la pestaña si no existe (o limpia sus valores) y escribe ``rows`` con
+    un ``values.update`` por bloque de a lo sumo ``chunk_rows`` filas y
+    ``chunk_bytes`` bytes de JSON aproximados. ``rows`` se consume a medida
+    que se arma cada bloque, así que puede ser un generador. Cuando hace
+    falta, la grilla se agranda al doble con ``appendDimension`` antes del
+    bloque que no entra.
+    """
+    spreadsheet = yield SheetsCall("get", spreadsheet_id, {
+        "fields": "spreadsheetId,spreadsheetUrl,sheets(properties(sheetId,title,gridProperties))",
+    })
+    tabs = [sheet["properties"] for sheet in spreadsheet.get("sheets", [])]
+    tab = next((props for props in tabs if props["title"] == sheet_title), None)
+    target = _a1_sheet(sheet_title)
+
+    if tab is None:
+        sheet_id = max((props["sheetId"] for props in tabs), default=0) + 1
+        grid_rows = chunk_rows
+        yield SheetsCall("batchUpdate", spreadsheet_id, {"body": {"requests": [{"addSheet": {"properties": {
+            "title": sheet_title,
+            "sheetId": sheet_id,
+            "gridProperties": {"rowCount": grid_rows},
+        }}}]}})
+    else:
+        sheet_id = tab["sheetId"]
+        grid_rows = tab.get("gridProperties", {}).get("rowCount", 1000)
+        yield SheetsCall("values.clear", spreadsheet_id, {"range": target, "body": {}})
+
+    written = 0
+    for chunk in _row_chunks(rows, chunk_rows, chunk_bytes):
+        needed = written + len(chunk)
+        if needed > grid_rows:
+            extra = max(needed - grid_rows, grid_rows)
+            yield SheetsCall("batchUpdate", spreadsheet_id, {"body": {"requests": [{"appendDimension": {
+                "sheetId": sheet_id, "dimension": "ROWS", "length": extra,
+            }}]}})
+            grid_rows += extra
+        yield SheetsCall("values.update", spreadsheet_id, {
+            "range": f"{target}!A{written + 1}",
+            "valueInputOption": "RAW",
+            "body": {"values": chunk},
+        })
+        written = needed
+
+    return {
+        "spreadsheetId": spreadsheet.get("spreadsheetId", spreadsheet_id),
+        "spreadsheetUrl": spreadsheet.get("spreadsheetUrl", ""),
+        "sheetTitle": sheet_title,
+        "rows": written,
+    }
+
+
+def _row_chunks(
+    rows: Iterable[Sequence[Any]],
+    max_rows: int,
+    max_bytes: int,
+) -> Iterator[list[list[Any]]]:
+    """Agrupa filas en bloques de a lo sumo ``max_rows`` filas y ~``max_bytes`` de JSON."""
+    chunk: list[list[Any]] = []
+    size = 0
+    for row in rows:
+        values = list(row)
+        row_size = len(json.dumps(values, ensure_ascii=False)) + 1
+        if chunk and (len(chunk) >= max_rows or size + row_size > max_bytes):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(values)
+        size += row_size
+    if chunk:
+        yield chunk
+
+
+def _a1_sheet(title: str) -> str:
+    """Nombre de pestaña citado para rangos A1 (``'Mi hoja'``)."""
+    return "'" + title.replace("'", "''") + "'"
+
+
+def _estado_colors(issues: list[Any]) -> dict[str, dict[str, float]]:
+    extra_statuses = []
+    for issue in issues:
+        st = issue.status
+        if st and st not in ESTADO_JIRA_COLORS and st not in extra_statuses:
+            extra_statuses.append(st)
+
+    estado_colors = dict(ESTADO_JIRA_COLORS)
+    for i, st in enumerate(extra_statuses):
+        estado_colors[st] = EXTRA_STATUS_COLORS[i % len(EXTRA_STATUS_COLORS)]
+    return estado_colors
+
+
+def _formatting_requests(
+    sheet_ids: dict[str, int],
+    issue_like_tabs: list[str],
+) -> list[dict[str, Any]]:
+    all_cell = {
+        "userEnteredFormat": {
+            "wrapStrategy": "WRAP",
+            "verticalAlignment": "TOP",
+            "textFormat": {"fontFamily": "Arial"},
         }
-        header_fields = "userEnteredFormat(backgroundColor,textFormat,wrapStrategy,verticalAlignment)"
+    }
+    all_fields = "userEnteredFormat(wrapStrategy,verticalAlignment,textFormat)"
 
-        requests: list[dict[str, Any]] = []
+    header_cell = {
+        "userEnteredFormat": {
+            "backgroundColor": HEADER_BG,
+            "textFormat": {"fontFamily": "Arial", "bold": True},
+            "wrapStrategy": "WRAP",
+            "verticalAlignment": "TOP",
+        }
+    }
+    header_fields = "userEnteredFormat(backgroundColor,textFormat,wrapStrategy,verticalAlignment)"
 
-        all_sids = list(sheet_ids.values())
-        for sid in all_sids:
-            requests.append({
+    requests: list[dict[str, Any]] = []
+
+    for sid in sheet_ids.values():
+        requests.append({
+            "repeatCell": {
+                "range": {"sheetId": sid},
+                "cell": all_cell,
+                "fields": all_fields,
+            }
+        })
+
+    for tab_name in issue_like_tabs:
+        sid = sheet_ids[tab_name]
+        requests.extend([
+            {
                 "repeatCell": {
-                    "range": {"sheetId": sid},
-                    "cell": all_cell,
-                    "fields": all_fields,
+                    "range": _range(sid, rows=(0, 1), cols=(0, NUM_COLS)),
+                    "cell": header_cell,
+                    "fields": header_fields,
+                }
+            },
+            _col_width(sid, 2, 3, 320),   # C: URL Ticket
+            _col_width(sid, 3, 4, 280),   # D: Comentario
+            _col_width(sid, 9, 10, 350),  # J: Comments Internal
+            {
+                "mergeCells": {
+                    "range": _range(sid, rows=(1, 2), cols=(0, NUM_COLS)),
+                    "mergeType": "MERGE_ALL",
+                }
+            },
+        ])
+
+    return requests
+
+
+def _data_validation_requests(
+    sheet_ids: dict[str, int],
+    issue_like_tabs: list[str],
+    num_issues: int,
+    estado_colors: dict[str, dict[str, float]],
+) -> list[dict[str, Any]]:
+    data_row_start = 3
+    data_row_end = max(data_row_start + num_issues, data_row_start + 200)
+
+    requests: list[dict[str, Any]] = []
+
+    validations = [
+        (COL_ESTADO_JIRA, list(estado_colors.keys())),
+        (COL_QA_RESULT, list(QA_RESULT_COLORS.keys())),
+        (COL_STATUS, list(STATUS_COLORS.keys())),
+    ]
+
+    for tab_name in issue_like_tabs:
+        sid = sheet_ids[tab_name]
+        for col_idx, options in validations:
+            requests.append({
+                "setDataValidation": {
+                    "range": _range(
+                        sid,
+                        rows=(data_row_start, data_row_end),
+                        cols=(col_idx, col_idx + 1),
+                    ),
+                    "rule": {
+                        "condition": {
+                            "type": "ONE_OF_LIST",
+                            "values": [
+                                {"userEnteredValue": v} for v in options
+                            ],
+                        },
+                        "showCustomUi": True,
+                        "strict": False,
+                    },
                 }
             })
 
-        for tab_name in issue_like_tabs:
-            sid = sheet_ids[tab_name]
-            requests.extend([
-                {
-                    "repeatCell": {
-                        "range": _range(sid, rows=(0, 1), cols=(0, NUM_COLS)),
-                        "cell": header_cell,
-                        "fields": header_fields,
-                    }
-                },
-                _col_width(sid, 2, 3, 320),   # C: URL Ticket
-                _col_width(sid, 3, 4, 280),   # D: Comentario
-                _col_width(sid, 9, 10, 350),  # J: Comments Internal
-                {
-                    "mergeCells": {
-                        "range": _range(sid, rows=(1, 2), cols=(0, NUM_COLS)),
-                        "mergeType": "MERGE_ALL",
-                    }
-                },
-            ])
+    return requests
 
-        self._sheets.spreadsheets().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body={"requests": requests},
-        ).execute()
 
-    def _apply_data_validation(
-        self,
-        spreadsheet_id: str,
-        sheet_ids: dict[str, int],
-        issue_like_tabs: list[str],
-        num_issues: int,
-        estado_colors: dict[str, dict[str, float]],
-    ) -> None:
-        data_row_start = 3
-        data_row_end = max(data_row_start + num_issues, data_row_start + 200)
+def _conditional_color_requests(
+    sheet_ids: dict[str, int],
+    issue_like_tabs: list[str],
+    num_issues: int,
+    estado_colors: dict[str, dict[str, float]],
+) -> list[dict[str, Any]]:
+    """Una regla por pestaña, columna y valor, numeradas desde 0 en cada pestaña.
 
-        requests: list[dict[str, Any]] = []
+    Las reglas de corridas anteriores se borran antes (``_owned_rule_deletions``),
+    así que las reglas no se acumulan entre ejecuciones.
+    """
+    data_row_start = 3
+    data_row_end = max(data_row_start + num_issues, data_row_start + 200)
 
-        validations = [
-            (5, list(estado_colors.keys())),
-            (6, list(QA_RESULT_COLORS.keys())),
-            (7, list(STATUS_COLORS.keys())),
-        ]
+    color_maps: list[tuple[int, dict[str, dict[str, float]]]] = [
+        (COL_ESTADO_JIRA, estado_colors),
+        (COL_QA_RESULT, QA_RESULT_COLORS),
+        (COL_STATUS, STATUS_COLORS),
+    ]
 
-        for tab_name in issue_like_tabs:
-            sid = sheet_ids[tab_name]
-            for col_idx, options in validations:
+    requests: list[dict[str, Any]] = []
+
+    for tab_name in issue_like_tabs:
+        sid = sheet_ids[tab_name]
+        rule_idx = 0
+        for col_idx, cmap in color_maps:
+            for value, bg in cmap.items():
                 requests.append({
-                    "setDataValidation": {
-                        "range": _range(
-                            sid,
-                            rows=(data_row_start, data_row_end),
-                            cols=(col_idx, col_idx + 1),
-                        ),
+                    "addConditionalFormatRule": {
                         "rule": {
-                            "condition": {
-                                "type": "ONE_OF_LIST",
-                                "values": [
-                                    {"userEnteredValue": v} for v in options
-                                ],
+                            "ranges": [_range(
+                                sid,
+                                rows=(data_row_start, data_row_end),
+                                cols=(col_idx, col_idx + 1),
+                            )],
+                            "booleanRule": {
+                                "condition": {
+                                    "type": "TEXT_EQ",
+                                    "values": [{"userEnteredValue": value}],
+                                },
+                                "format": {
+                                    "backgroundColor": bg,
+                                    "textFormat": {
+                                        "foregroundColor": {"red": 0, "green": 0, "blue": 0},
+                                        "bold": True,
+                                    },
+                                },
                             },
-                            "showCustomUi": True,
-                            "strict": False,
                         },
+                        "index": rule_idx,
                     }
                 })
+                rule_idx += 1
 
-        if requests:
-            self._sheets.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={"requests": requests},
-            ).execute()
+    return requests
 
-    def _apply_conditional_colors(
-        self,
-        spreadsheet_id: str,
-        sheet_ids: dict[str, int],
-        issue_like_tabs: list[str],
-        num_issues: int,
-        estado_colors: dict[str, dict[str, float]],
-    ) -> None:
-        data_row_start = 3
-        data_row_end = max(data_row_start + num_issues, data_row_start + 200)
 
-        color_maps: list[tuple[int, dict[str, dict[str, float]]]] = [
-            (5, estado_colors),
-            (6, QA_RESULT_COLORS),
-            (7, STATUS_COLORS),
-        ]
+def _owned_rule_deletions(
+    sheets: list[dict[str, Any]],
+    sheet_ids: list[int],
+) -> list[dict[str, Any]]:
+    """Borra las reglas de color que generó esta herramienta en las pestañas dadas.
 
-        requests: list[dict[str, Any]] = []
-        rule_idx = 0
+    Una regla es propia si es ``TEXT_EQ`` y todos sus rangos son una sola
+    columna de estado (F, G o H) desde la primera fila de datos. Se borran de
+    mayor a menor índice para que los índices restantes sigan siendo válidos;
+    las reglas creadas a mano por los usuarios no se tocan.
+    """
+    targets = set(sheet_ids)
+    requests: list[dict[str, Any]] = []
+    for sheet in sheets:
+        sid = sheet["properties"]["sheetId"]
+        if sid not in targets:
+            continue
+        rules = sheet.get("conditionalFormats", [])
+        for index in range(len(rules) - 1, -1, -1):
+            if _is_owned_rule(rules[index]):
+                requests.append({"deleteConditionalFormatRule": {"sheetId": sid, "index": index}})
+    return requests
+
+
+def _is_owned_rule(rule: dict[str, Any]) -> bool:
+    condition = rule.get("booleanRule", {}).get("condition", {})
+    ranges = rule.get("ranges", [])
+    if condition.get("type") != "TEXT_EQ" or not ranges:
+        return False
+    return all(
+        r.get("startRowIndex") == 3
+        and r.get("startColumnIndex") in (COL_ESTADO_JIRA, COL_QA_RESULT, COL_STATUS)
+        and r.get("endColumnIndex") == r.get("startColumnIndex") + 1
+        for r in ranges
+    )
 
-        for tab_name in issue_like_tabs:
-            sid = sheet_ids[tab_name]
-            for col_idx, cmap in color_maps:
-                for value, bg in cmap.items():
-                    requests.append({
-                        "addConditionalFormatRule": {
-                            "rule": {
-                                "ranges": [_range(
-                                    sid,
-                                    rows=(data_row_start, data_row_end),
-                                    cols=(col_idx, col_idx + 1),
-                                )],
-                                "booleanRule": {
-                                    "condition": {
-                                        "type": "TEXT_EQ",
-                                        "values": [{"userEnteredValue": value}],
-                                    },
-                                    "format": {
-                                        "backgroundColor": bg,
-                                        "textFormat": {
-                                            "foregroundColor": {"red": 0, "green": 0, "blue": 0},
-                                            "bold": True,
-                                        },
-                                    },
-                                },
-                            },
-                            "index": rule_idx,
-                        }
-                    })
-                    rule_idx += 1
-
-        if requests:
-            self._sheets.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={"requests": requests},
-            ).execute()
-
-    def _write_bfv_data(
-        self,
-        spreadsheet_id: str,
-        jira_base_url: str,
-        issues: list[Any],
-        issue_like_tabs: list[str],
-        default_status: str,
-        tester: str = "",
-    ) -> None:
-        data: list[dict[str, Any]] = []
 
+def _bfv_value_data(
+    jira_base_url: str,
+    issues: list[Any],
+    issue_like_tabs: list[str],
+    default_status: str,
+    tester: str = "",
+    include_summary: bool = True,
+) -> list[dict[str, Any]]:
+    data: list[dict[str, Any]] = []
+
+    if "Issues" in issue_like_tabs:
         issues_rows: list[list[str]] = [
             ISSUES_HEADERS,
             ["Date", "", "", "", "", "", "", "", "", ""],
             ["", "", QA_TEMPLATE, "", "", "", "", "", "", ""],
         ]
         for idx, issue in enumerate(issues, start=1):
-            url = f"{jira_base_url}/browse/{issue.key}"
-            issues_rows.append([
-                str(idx),
-                tester,
-                url,
-                "",
-                "",
-                issue.status,
-                "",
-                "",
-                "",
-                "",
-            ])
+            issues_rows.append(_issue_row(idx, tester, jira_base_url, issue))
         data.append({"range": "Issues!A1", "values": issues_rows})
 
-        for tab_name in issue_like_tabs:
-            if tab_name == "Issues":
-                continue
-            data.append({
-                "range": f"'{tab_name}'!A1",
-                "values": [
-                    ISSUES_HEADERS,
-                    ["Date", "", "", "", "", "", "", "", "", ""],
-                    ["", "", QA_TEMPLATE, "", "", "", "", "", "", ""],
-                ],
-            })
+    for tab_name in issue_like_tabs:
+        if tab_name == "Issues":
+            continue
+        data.append({
+            "range": f"'{tab_name}'!A1",
+            "values": [
+                ISSUES_HEADERS,
+                ["Date", "", "", "", "", "", "", "", "", ""],
+                ["", "", QA_TEMPLATE, "", "", "", "", "", "", ""],
+            ],
+        })
 
+    if include_summary:
         data.append({
             "range": "Summary!A2",
             "values": [
@@ -414,21 +904,101 @@ class DriveClient:
             ],
         })
 
-        self._sheets.spreadsheets().values().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body={"valueInputOption": "RAW", "data": data},
-        ).execute()
+    return data
 
-    # ------------------------------------------------------------------
-    # Generic read helpers
-    # ------------------------------------------------------------------
 
-    def read_rows(self, spreadsheet_id: str, range_: str = "A:Z") -> list[list[str]]:
-        result = self._sheets.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=range_,
-        ).execute()
-        return result.get("values", [])
+def _issue_row(number: int, tester: str, jira_base_url: str, issue: Any) -> list[str]:
+    return [
+        str(number),
+        tester,
+        f"{jira_base_url}/browse/{issue.key}",
+        "",
+        "",
+        issue.status,
+        "",
+        "",
+        "",
+        "",
+    ]
+
+
+def _reconciled_value_data(
+    jira_base_url: str,
+    issues: list[Any],
+    current_abc: list[list[str]],
+    current_f: list[list[str]],
+    tester: str = "",
+) -> tuple[list[dict[str, Any]], list[BfvRow]]:
+    """Diff por URL (columna C) entre la pestaña ``Issues`` y los issues nuevos.
+
+    Devuelve los rangos a escribir (celdas de estado/tester cambiadas y un
+    bloque con las filas agregadas) y todas las filas de datos como quedan
+    tras escribirlos. Las filas cuyo ticket ya no aparece se conservan tal cual.
+    """
+    data: list[dict[str, Any]] = []
+    header_rows = 3
+
+    if not current_abc or current_abc[0][:3] != ISSUES_HEADERS[:3]:
+        data.append({"range": "Issues!A1", "values": [
+            ISSUES_HEADERS,
+            ["Date", "", "", "", "", "", "", "", "", ""],
+            ["", "", QA_TEMPLATE, "", "", "", "", "", "", ""],
+        ]})
+
+    row_by_url: dict[str, int] = {}
+    last_number = 0
+    for idx in range(header_rows, len(current_abc)):
+        row = current_abc[idx]
+        if len(row) > 2 and row[2].strip():
+            row_by_url.setdefault(row[2].strip().rstrip("/"), idx)
+        if row and row[0].strip().isdigit():
+            last_number = max(last_number, int(row[0]))
+
+    first_free = max(len(current_abc), len(current_f), header_rows)
+    final: dict[int, BfvRow] = {}
+    for idx in range(header_rows, first_free):
+        abc = (current_abc[idx] if idx < len(current_abc) else []) + ["", "", ""]
+        f = current_f[idx][0] if idx < len(current_f) and current_f[idx] else ""
+        final[idx] = BfvRow(abc[0], abc[1], abc[2], f)
+
+    appended: list[list[str]] = []
+    for issue in issues:
+        url = f"{jira_base_url}/browse/{issue.key}"
+        idx = row_by_url.get(url.rstrip("/"))
+        if idx is None:
+            last_number += 1
+            appended.append(_issue_row(last_number, tester, jira_base_url, issue))
+            continue
+        current = final[idx]
+        if current.status != issue.status:
+            data.append({"range": f"Issues!F{idx + 1}", "values": [[issue.status]]})
+            current = replace(current, status=issue.status)
+        if tester and not current.tester.strip():
+            data.append({"range": f"Issues!B{idx + 1}", "values": [[tester]]})
+            current = replace(current, tester=tester)
+        final[idx] = current
+
+    if appended:
+        data.append({"range": f"Issues!A{first_free + 1}", "values": appended})
+
+    rows = list(final.values())
+    rows.extend(BfvRow(row[0], row[1], row[2], row[5]) for row in appended)
+    return data, rows
+
+
+def _verification_sample(num_rows: int, size: int = VERIFY_SAMPLE_ROWS) -> list[int]:
+    """Índices de filas repartidos de forma pareja, incluidas la primera y la última."""
+    if num_rows <= size:
+        return list(range(num_rows))
+    step = (num_rows - 1) / (size - 1)
+    return sorted({round(i * step) for i in range(size)})
+
+
+def _row_matches(expected: BfvRow, values: list[list[str]]) -> bool:
+    written = (values[0] if values else []) + [""] * 6
+    return (written[0], written[1], written[2], written[5]) == (
+        expected.number, expected.tester, expected.url, expected.status,
+    )
 
 
 # ------------------------------------------------------------------
@@ -0,0 +1,179 @@
+"""Caché local persistente (SQLite) de issues Jira para sincronización incremental."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+import sqlite3
+import threading
+
+from bugfix_automator.models import JiraIssue, LazyJiraIssue
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    status TEXT NOT NULL,
+    assignee TEXT NOT NULL,
+    description TEXT NOT NULL,
+    timespent INTEGER,
+    timeoriginalestimate INTEGER,
+    updated TEXT,
+    PRIMARY KEY (scope, key)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    last_sync REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS full_sync_state (
+    scope TEXT PRIMARY KEY,
+    last_full_sync REAL NOT NULL
+);
+"""
+
+
+class IssueCache:
+    """Almacena ``JiraIssue`` por ámbito de búsqueda junto a su marca ``updated``.
+
+    Un ámbito (``scope``) identifica una consulta lógica (proyecto/parent +
+    estados). Para cada ámbito se guarda el instante (epoch UTC) en que empezó
+    la última sincronización, que sirve para pedir a Jira sólo el delta, y
+    el de la última sincronización completa: el delta no ve issues borrados,
+    así que cada tanto conviene volver a bajar el ámbito entero.
+    """
+
+    def __init__(self, path: str) -> None:
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def last_sync(self, scope: str) -> float | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_sync FROM sync_state WHERE scope = ?", (scope,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def last_full_sync(self, scope: str) -> float | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_full_sync FROM full_sync_state WHERE scope = ?", (scope,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def load(
+        self,
+        scope: str,
+        loader: Callable[[str], str] | None = None,
+    ) -> list[JiraIssue]:
+        """Devuelve los issues del ámbito ordenados por ``updated`` descendente.
+
+        Con ``loader`` se devuelven ``LazyJiraIssue`` (ámbitos sin descripción).
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, summary, status, assignee, description, timespent, "
+                "timeoriginalestimate, updated FROM issues WHERE scope = ? "
+                "ORDER BY updated DESC, key",
+                (scope,),
+            ).fetchall()
+        if loader is not None:
+            return [
+                LazyJiraIssue(
+                    key=row[0],
+                    summary=row[1],
+                    status=row[2],
+                    assignee=row[3],
+                    timespent_seconds=row[5],
+                    timeoriginalestimate_seconds=row[6],
+                    updated=row[7],
+                    loader=loader,
+                )
+                for row in rows
+            ]
+        return [
+            JiraIssue(
+                key=row[0],
+                summary=row[1],
+                status=row[2],
+                assignee=row[3],
+                description=row[4],
+                timespent_seconds=row[5],
+                timeoriginalestimate_seconds=row[6],
+                updated=row[7],
+            )
+            for row in rows
+        ]
+
+    def merge(
+        self,
+        scope: str,
+        issues: list[JiraIssue],
+        synced_at: float,
+        replace: bool = False,
+        remove_keys: list[str] | None = None,
+    ) -> None:
+        """Inserta/actualiza issues del ámbito y registra la sincronización.
+
+        Con ``replace=True`` se descartan antes los issues cacheados del ámbito
+        (sincronización completa); ``remove_keys`` elimina issues que dejaron
+        de pertenecer al ámbito.
+        """
+        with self._lock, self._conn:
+            if replace:
+                self._conn.execute("DELETE FROM issues WHERE scope = ?", (scope,))
+            if remove_keys:
+                self._conn.executemany(
+                    "DELETE FROM issues WHERE scope = ? AND key = ?",
+                    [(scope, key) for key in remove_keys],
+                )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO issues (scope, key, summary, status, assignee, "
+                "description, timespent, timeoriginalestimate, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        scope,
+                        issue.key,
+                        issue.summary,
+                        issue.status,
+                        issue.assignee,
+                        _stored_description(issue),
+                        issue.timespent_seconds,
+                        issue.timeoriginalestimate_seconds,
+                        issue.updated,
+                    )
+                    for issue in issues
+                ],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (scope, last_sync) VALUES (?, ?)",
+                (scope, synced_at),
+            )
+            if replace:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO full_sync_state (scope, last_full_sync) VALUES (?, ?)",
+                    (scope, synced_at),
+                )
+
+    def invalidate(self, scope: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM issues WHERE scope = ?", (scope,))
+            self._conn.execute("DELETE FROM sync_state WHERE scope = ?", (scope,))
+            self._conn.execute("DELETE FROM full_sync_state WHERE scope = ?", (scope,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _stored_description(issue: JiraIssue) -> str:
+    # No se fuerza la descarga de descripciones diferidas al guardar.
+    if isinstance(issue, LazyJiraIssue):
+        return issue.loaded_description or ""
+    return issue.description
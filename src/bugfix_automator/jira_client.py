@@ -2,20 +2,142 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import codecs
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+import math
+import threading
+import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from bugfix_automator.adf import flatten_description
+from bugfix_automator.async_http import AsyncHttpClient, HttpResponse
 from bugfix_automator.config import JiraConfig
-from bugfix_automator.models import JiraIssue
+from bugfix_automator.issue_cache import IssueCache
+from bugfix_automator.json_stream import iter_array_items
+from bugfix_automator.models import JiraIssue, LazyJiraIssue
+from bugfix_automator.retry import RetryPolicy
+
+# Margen (minutos) que se solapa con la sincronización anterior para cubrir
+# desfases de reloj entre esta máquina y Jira.
+SYNC_OVERLAP_MINUTES = 5
+
+# Campos que necesita el procesamiento completo (tiempos + conteo de OO).
+ISSUE_FIELDS = (
+    "summary",
+    "status",
+    "assignee",
+    "description",
+    "timespent",
+    "timeoriginalestimate",
+    "updated",
+)
+
+# Campos que usa la hoja BFV (key + estado); la descripción queda diferida.
+SHEET_FIELDS = ("status", "updated")
+
+# Tamaño de lectura al parsear respuestas de búsqueda en streaming.
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Máximo de keys por pedido a ``/rest/api/3/issue/bulkfetch``.
+BULK_FETCH_MAX_KEYS = 100
+
+# Máximo de particiones en que se divide un JQL (ver ``plan_updated_partitions``).
+MAX_PARTITIONS = 32
+
+
+# Cortes de conexión al leer el cuerpo de una respuesta en streaming.
+_STREAM_ERRORS = (requests.exceptions.ChunkedEncodingError, requests.ConnectionError, requests.Timeout)
+
+
+class RetryStats:
+    """Contadores acumulados de reintentos y tiempo de espera por rate limiting.
+
+    ``throttled_seconds`` suma sólo las esperas por 429; el backoff por 5xx o
+    fallos de conexión cuenta en ``retries`` pero no como rate limiting.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+
+    def record(self, delay: float, throttled: bool) -> None:
+        with self._lock:
+            self.retries += 1
+            if throttled:
+                self.throttled += 1
+                self.throttled_seconds += delay
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+            }
 
 
 class JiraClient:
-    """Cliente simple para Jira Cloud REST API v3."""
+    """Cliente simple para Jira Cloud REST API v3.
+
+    Mantiene una ``requests.Session`` persistente (keep-alive) reutilizada entre
+    páginas, estados y ejecuciones sucesivas. Usar como context manager o
+    llamar a ``close()`` para liberar las conexiones del pool.
+
+    Si ``config.cache_path`` está definido, las búsquedas usan un caché SQLite
+    local y sólo piden a Jira los issues actualizados desde la última sincronización.
+
+    Con ``config.partition_size`` mayor a cero, un JQL con más issues que ese
+    tamaño se parte en ventanas disjuntas de ``updated`` que se descargan en
+    paralelo (ver ``plan_updated_partitions``).
+
+    Las respuestas 429/5xx transitorias y los errores de conexión se reintentan
+    con backoff exponencial con jitter, respetando ``Retry-After``; cada página
+    se reintenta de forma individual, por lo que las ya descargadas se conservan.
+    ``retry_stats`` expone cuántos reintentos hubo y cuánto tiempo se esperó.
+    """
 
     def __init__(self, config: JiraConfig, timeout_seconds: int = 30) -> None:
         self._config = config
         self._timeout = timeout_seconds
+        self._session = self._build_session()
+        self._cache = IssueCache(config.cache_path) if config.cache_path else None
+        self._retry = _retry_policy(config)
+        self._sleep = time.sleep
+        self.retry_stats = RetryStats()
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.auth = (self._config.email, self._config.api_token)
+        session.headers.update({"Accept": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=self._config.pool_connections,
+            pool_maxsize=self._config.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Cierra la sesión HTTP y sus conexiones abiertas."""
+        self._session.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def __enter__(self) -> JiraClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def fetch_issues_by_status(
         self,
@@ -23,91 +145,765 @@ class JiraClient:
         project: str | None = None,
         parent_key: str | None = None,
         max_results: int = 200,
+        fields: Iterable[str] = ISSUE_FIELDS,
     ) -> list[JiraIssue]:
         """Obtiene issues filtrados por estado (y opcionalmente epic/parent) usando JQL."""
-        url = f"{self._config.base_url}/rest/api/3/search/jql"
-        headers = {"Accept": "application/json"}
-        auth = (self._config.email, self._config.api_token)
-
-        jql = f'status = "{status}"'
-        if parent_key:
-            jql = f'parent = "{parent_key}" AND {jql}'
-        elif project:
-            jql = f'project = "{project}" AND {jql}'
-        jql += " ORDER BY updated DESC"
-
-        start_at = 0
-        issues: list[JiraIssue] = []
-
-        while True:
-            params = {
-                "jql": jql,
-                "maxResults": min(max_results, 100),
-                "startAt": start_at,
-                "fields": "summary,status,assignee,description,timespent,timeoriginalestimate",
-            }
-            response = requests.get(
-                url,
-                params=params,
-                headers=headers,
-                auth=auth,
-                timeout=self._timeout,
+        return self.fetch_issues_by_statuses(
+            [status], project=project, parent_key=parent_key,
+            max_results=max_results, fields=fields,
+        )
+
+    def fetch_issues_by_statuses(
+        self,
+        statuses: list[str],
+        project: str | None = None,
+        parent_key: str | None = None,
+        max_results: int = 200,
+        full_refresh: bool = False,
+        fields: Iterable[str] = ISSUE_FIELDS,
+    ) -> list[JiraIssue]:
+        """Obtiene issues de varios estados con una sola búsqueda ``status IN (...)``.
+
+        El resultado se pagina una sola vez y se de-duplica por key conservando
+        el orden ``updated DESC`` de Jira. Con caché configurado se sincroniza
+        de forma incremental salvo que se pida ``full_refresh``.
+
+        ``fields`` limita los campos pedidos a Jira (p. ej. ``SHEET_FIELDS``).
+        Si no incluye ``description`` se devuelven ``LazyJiraIssue`` que sólo
+        descargan la descripción cuando alguien la lee.
+        """
+        if not statuses:
+            return []
+        query = _SearchQuery(
+            jql=build_jql(statuses, project=project, parent_key=parent_key),
+            fields=_normalize_fields(fields),
+            page_size=min(max_results, 100),
+        )
+        if self._cache is None:
+            return self._search(query)
+        return self._sync_cached(query, statuses, project, parent_key, full_refresh)
+
+    def iter_issues_by_statuses(
+        self,
+        statuses: list[str],
+        project: str | None = None,
+        parent_key: str | None = None,
+        max_results: int = 200,
+        full_refresh: bool = False,
+        fields: Iterable[str] = ISSUE_FIELDS,
+    ) -> Iterator[JiraIssue]:
+        """Versión generadora de ``fetch_issues_by_statuses``.
+
+        Cada página se parsea en streaming y los issues se entregan a medida
+        que llegan, así el consumidor procesa mientras se descarga el resto y
+        la memoria no crece con el tamaño del proyecto. Con caché configurado
+        se sincroniza primero y luego se recorre el resultado.
+        """
+        if not statuses:
+            return
+        if self._cache is not None:
+            yield from self.fetch_issues_by_statuses(
+                statuses, project=project, parent_key=parent_key,
+                max_results=max_results, full_refresh=full_refresh, fields=fields,
             )
-            if response.status_code != 200:
-                detail = response.text[:500] if response.text else "sin detalle"
-                raise RuntimeError(
-                    f"Jira respondió {response.status_code}: {detail}"
-                )
+            return
+        yield from self._iter_search(_SearchQuery(
+            jql=build_jql(statuses, project=project, parent_key=parent_key),
+            fields=_normalize_fields(fields),
+            page_size=min(max_results, 100),
+        ))
+
+    def fetch_issues_by_keys(
+        self,
+        keys: Iterable[str],
+        fields: Iterable[str] = ISSUE_FIELDS,
+    ) -> list[JiraIssue]:
+        """Refresca exactamente ``keys`` con ``/issue/bulkfetch``, sin JQL.
+
+        Las keys se piden en lotes de ``BULK_FETCH_MAX_KEYS``, hasta
+        ``page_concurrency`` lotes a la vez. El resultado respeta el orden de
+        ``keys``; las que Jira no devuelve (borradas o sin permiso) se omiten
+        y los issues movidos a otra key van al final.
+        """
+        wanted = _unique_keys(keys)
+        if not wanted:
+            return []
+        fields = _normalize_fields(fields)
+        loader = None if "description" in fields else self.fetch_description
+        chunks = _key_chunks(wanted)
+        workers = min(max(1, self._config.page_concurrency), len(chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-bulk") as pool:
+            pages = list(pool.map(lambda chunk: self._bulk_fetch(chunk, fields), chunks))
+        return _issues_in_key_order(wanted, pages, loader)
+
+    def fetch_description(self, key: str) -> str:
+        """Descarga y aplana la descripción ADF de un issue."""
+        url = f"{self._config.base_url}/rest/api/3/issue/{key}"
+        data = self._get_json(url, {"fields": "description,updated"})
+        fields = data.get("fields", {})
+        return flatten_description(fields.get("description"), key, fields.get("updated"))
+
+    def _sync_cached(
+        self,
+        query: _SearchQuery,
+        statuses: list[str],
+        project: str | None,
+        parent_key: str | None,
+        full_refresh: bool,
+    ) -> list[JiraIssue]:
+        """Sincroniza el caché del JQL y devuelve su contenido actualizado.
+
+        La primera vez se descarga el JQL completo. Después se pide sólo el
+        ámbito (proyecto/parent, sin filtro de estado) con ``updated`` reciente:
+        así también se detectan issues que entraron o salieron de los estados
+        pedidos, ya que un cambio de estado actualiza ``updated``.
+
+        Los issues borrados no aparecen en el delta: si la última sincronización
+        completa tiene más de ``cache_full_sync_hours`` horas, se vuelve a
+        descargar el JQL completo y se reemplaza el ámbito.
+        """
+        assert self._cache is not None
+        scope = f"{query.jql} | {','.join(query.fields)}"
+        loader = None if query.loads_description else self.fetch_description
+        started = time.time()
+        last_sync = None if full_refresh else self._cache.last_sync(scope)
+        max_age = self._config.cache_full_sync_hours * 3600
+        if last_sync is not None and max_age > 0:
+            last_full_sync = self._cache.last_full_sync(scope)
+            if last_full_sync is None or started - last_full_sync > max_age:
+                last_sync = None
+
+        if last_sync is None:
+            fetched = self._search(query)
+            self._cache.merge(scope, fetched, synced_at=started, replace=True)
+            return fetched
+
+        minutes = math.ceil(max(0.0, started - last_sync) / 60) + SYNC_OVERLAP_MINUTES
+        delta_query = replace(query, jql=build_jql(
+            None, project=project, parent_key=parent_key, updated_within_minutes=minutes,
+        ))
+        delta = self._search(delta_query)
+
+        wanted = {status.casefold() for status in statuses}
+        matching = [issue for issue in delta if issue.status.casefold() in wanted]
+        left = [issue.key for issue in delta if issue.status.casefold() not in wanted]
+        self._cache.merge(scope, matching, synced_at=started, remove_keys=left)
+        return self._cache.load(scope, loader=loader)
+
+    def _search(self, query: _SearchQuery) -> list[JiraIssue]:
+        return list(self._iter_search(query))
+
+    def _iter_search(self, query: _SearchQuery) -> Iterator[JiraIssue]:
+        """Pagina el JQL entregando issues únicos por key en orden ``updated DESC``."""
+        partitions = self._plan_partitions(query) if self._config.partition_size > 0 else [query]
+        pages = self._iter_pages(query) if len(partitions) == 1 else self._iter_partitions(partitions)
+        seen: set[str] = set()
+        for issue in pages:
+            if issue.key not in seen:
+                seen.add(issue.key)
+                yield issue
+
+    def _plan_partitions(self, query: _SearchQuery) -> list[_SearchQuery]:
+        """Sondea el JQL (conteo aproximado y extremos de ``updated``) y lo parte.
+
+        Si Jira no ofrece el conteo o el resultado entra en una partición se
+        devuelve la consulta original.
+        """
+        count = self._approximate_count(query.jql)
+        if count is None or count <= self._config.partition_size:
+            return [query]
+        newest = self._edge_updated(query, descending=True)
+        oldest = self._edge_updated(query, descending=False)
+        if newest is None or oldest is None:
+            return [query]
+        return [
+            replace(query, jql=jql)
+            for jql in plan_updated_partitions(
+                query.jql, count, oldest, newest, self._config.partition_size,
+            )
+        ]
+
+    def _iter_partitions(self, partitions: list[_SearchQuery]) -> Iterator[JiraIssue]:
+        """Descarga las particiones en paralelo y las entrega de la más nueva a la más vieja.
+
+        Cada partición se pagina de forma secuencial; el paralelismo lo da el
+        pool de ``page_concurrency`` hilos. Un issue actualizado durante la
+        descarga puede aparecer en dos particiones: ``_iter_search`` conserva
+        la primera aparición, así el resultado es el mismo en cada ejecución.
+        """
+        workers = min(max(1, self._config.page_concurrency), len(partitions))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-partition") as pool:
+            results = pool.map(
+                lambda partition: list(self._iter_pages(partition, fan_out=False)), partitions,
+            )
+            for issues in results:
+                yield from issues
+
+    def _bulk_fetch(self, keys: list[str], fields: tuple[str, ...]) -> dict[str, Any]:
+        url = f"{self._config.base_url}/rest/api/3/issue/bulkfetch"
+        response = self._send(lambda: self._session.post(
+            url, json=_bulk_fetch_body(keys, fields), timeout=self._timeout,
+        ))
+        _raise_for_status(response)
+        return response.json()
+
+    def _approximate_count(self, jql: str) -> int | None:
+        url = f"{self._config.base_url}/rest/api/3/search/approximate-count"
+        response = self._send(lambda: self._session.post(
+            url, json={"jql": _jql_filter(jql)}, timeout=self._timeout,
+        ))
+        if response.status_code != 200:
+            return None
+        return int(response.json().get("count", 0))
+
+    def _edge_updated(self, query: _SearchQuery, descending: bool) -> datetime | None:
+        """``updated`` del issue más nuevo (o más viejo) del JQL."""
+        order = "DESC" if descending else "ASC"
+        edge = _SearchQuery(
+            jql=_with_order(query.jql, f"updated {order}"), fields=("updated",), page_size=1,
+        )
+        issues = self._fetch_page(edge, start_at=0).get("issues", [])
+        if not issues:
+            return None
+        return _parse_jira_datetime(issues[0].get("fields", {}).get("updated"))
+
+    def _iter_pages(self, query: _SearchQuery, fan_out: bool = True) -> Iterator[JiraIssue]:
+        """Recorre todas las páginas del JQL, con o sin duplicados.
+
+        ``/search/jql`` pagina con ``nextPageToken`` y puede omitir ``total``;
+        en ese caso se sigue el token (ver ``_iter_token_pages``). Si Jira
+        informa ``total`` se pagina por ``startAt``, en paralelo cuando
+        ``page_concurrency > 1`` y ``fan_out``.
+        """
+        meta: dict[str, Any] = {}
+        first_page = list(self._stream_page(query, 0, meta))
+        if "total" not in meta:
+            yield from self._iter_token_pages(query, first_page, meta)
+            return
+
+        for raw_issue in first_page:
+            yield self._to_issue(raw_issue, query)
+        start_at = len(first_page)
+        total = int(meta["total"])
+        if not start_at or start_at >= total:
+            return
+        if fan_out and self._config.page_concurrency > 1:
+            yield from self._fetch_remaining_concurrently(query, start_at, total)
+            return
+
+        while start_at < total:
+            meta = {}
+            batch_size = 0
+            for raw_issue in self._stream_page(query, start_at, meta):
+                batch_size += 1
+                yield self._to_issue(raw_issue, query)
+            if not batch_size:
+                return
+            start_at += batch_size
+            total = int(meta.get("total", total))
+
+    def _iter_token_pages(
+        self,
+        query: _SearchQuery,
+        page: list[dict[str, Any]],
+        meta: dict[str, Any],
+    ) -> Iterator[JiraIssue]:
+        """Sigue ``nextPageToken`` con la página siguiente ya pedida (doble buffer).
+
+        Apenas se conoce el token de una página se encola el pedido de la
+        siguiente en un hilo aparte, y recién entonces se convierten (y se
+        entregan) los issues de la actual: el recorrido queda acotado por la
+        latencia de red y no por latencia más parseo.
+        """
+        requested: set[str] = set()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="jira-prefetch") as prefetch:
+            while True:
+                token = None if meta.get("isLast") else meta.get("nextPageToken")
+                if token in requested:
+                    raise RuntimeError("Jira repitió el nextPageToken de una página anterior")
+                upcoming = None
+                if token:
+                    requested.add(token)
+                    upcoming = prefetch.submit(self._fetch_page, query, 0, token)
+                for raw_issue in page:
+                    yield self._to_issue(raw_issue, query)
+                if upcoming is None:
+                    return
+                meta = upcoming.result()
+                page = meta.get("issues", [])
+                if not page:
+                    return
+
+    def _fetch_remaining_concurrently(
+        self,
+        query: _SearchQuery,
+        first_batch_size: int,
+        total: int,
+    ) -> Iterator[JiraIssue]:
+        """Reparte los ``startAt`` restantes en un pool acotado y conserva el orden JQL.
+
+        El tamaño de página efectivo es el que devolvió Jira en la primera
+        respuesta (puede ser menor al solicitado). Las páginas se entregan en
+        orden a medida que se completan.
+        """
+        query = replace(query, page_size=first_batch_size)
+        offsets = list(range(query.page_size, total, query.page_size))
+        workers = min(self._config.page_concurrency, len(offsets))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pages = pool.map(lambda offset: self._fetch_page(query, start_at=offset), offsets)
+            for data in pages:
+                for raw_issue in data.get("issues", []):
+                    yield self._to_issue(raw_issue, query)
+
+    def _stream_page(
+        self,
+        query: _SearchQuery,
+        start_at: int,
+        meta: dict[str, Any],
+        page_token: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Descarga una página en streaming; ``total`` y demás claves quedan en ``meta``.
 
+        Si la conexión se corta a mitad del cuerpo, la página se vuelve a pedir
+        con la misma política de backoff y se saltean los issues ya entregados.
+        """
+        url = f"{self._config.base_url}/rest/api/3/search/jql"
+        params = _search_params(query, start_at, page_token)
+        yielded = 0
+        for attempt in range(self._retry.max_retries + 1):
+            response = self._get(url, params, stream=True)
+            try:
+                _raise_for_status(response)
+                items = iter_array_items(_iter_text(response), "issues", meta)
+                for index, raw_issue in enumerate(items):
+                    if index < yielded:
+                        continue
+                    yielded += 1
+                    yield raw_issue
+                return
+            except _STREAM_ERRORS:
+                decision = self._retry.delay(attempt)
+                if decision is None:
+                    raise
+            finally:
+                response.close()
+            delay, throttled = decision
+            self.retry_stats.record(delay, throttled)
+            self._sleep(delay)
+
+    def _fetch_page(
+        self,
+        query: _SearchQuery,
+        start_at: int,
+        page_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Página completa (``issues`` y metadatos) leída con el mismo parser en streaming.
 
-            data = response.json()
-            batch = [self._to_issue(raw_issue) for raw_issue in data.get("issues", [])]
-            issues.extend(batch)
+        Lo usan el prefetch por token y el reparto concurrente: así todas las
+        páginas de la búsqueda pasan por ``_stream_page``.
+        """
+        meta: dict[str, Any] = {}
+        meta["issues"] = list(self._stream_page(query, start_at, meta, page_token))
+        return meta
 
-            total = int(data.get("total", 0))
-            start_at += len(batch)
-            if start_at >= total or not batch:
-                break
+    def _get_json(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        response = self._get(url, params)
+        _raise_for_status(response)
+        return response.json()
+
+    def _get(
+        self,
+        url: str,
+        params: dict[str, Any],
+        stream: bool = False,
+    ) -> requests.Response:
+        return self._send(lambda: self._session.get(
+            url, params=params, timeout=self._timeout, stream=stream,
+        ))
 
-        return issues
+    def _send(self, request: Callable[[], requests.Response]) -> requests.Response:
+        """Envía ``request()`` con reintentos para rate limiting, 5xx y fallos de conexión."""
+        for attempt in range(self._retry.max_retries + 1):
+            try:
+                response = request()
+            except (requests.ConnectionError, requests.Timeout):
+                decision = self._retry.delay(attempt)
+                if decision is None:
+                    raise
+            else:
+                decision = self._retry.delay(attempt, response.status_code, response.headers)
+                if decision is None:
+                    return response
+                response.close()
+            delay, throttled = decision
+            self.retry_stats.record(delay, throttled)
+            self._sleep(delay)
+        raise AssertionError("unreachable")
+
+    def _to_issue(self, raw_issue: dict[str, Any], query: _SearchQuery | None = None) -> JiraIssue:
+        loader = self.fetch_description if query is not None and not query.loads_description else None
+        return _issue_from_raw(raw_issue, loader)
+
+
+class AsyncJiraClient:
+    """Variante asyncio de ``JiraClient`` para el modo de servidor asíncrono.
+
+    Usa el mismo JQL, los mismos campos y la misma política de reintentos,
+    pero sobre un ``AsyncHttpClient`` compartido: las páginas se piden como
+    corrutinas en el event loop, sin un hilo por petición. No usa el caché
+    SQLite. Los issues sin descripción en ``fields`` no pueden cargarla de
+    forma diferida (sería una llamada bloqueante dentro del loop).
+    """
+
+    def __init__(self, config: JiraConfig, http: AsyncHttpClient) -> None:
+        self._config = config
+        self._http = http
+        token = base64.b64encode(f"{config.email}:{config.api_token}".encode("utf-8")).decode("ascii")
+        self._headers = {"Accept": "application/json", "Authorization": f"Basic {token}"}
+        self._retry = _retry_policy(config)
+        self._sleep = asyncio.sleep
+        self.retry_stats = RetryStats()
+
+    async def fetch_issues_by_statuses(
+        self,
+        statuses: list[str],
+        project: str | None = None,
+        parent_key: str | None = None,
+        max_results: int = 200,
+        fields: Iterable[str] = ISSUE_FIELDS,
+        on_page: Callable[[int], None] | None = None,
+    ) -> list[JiraIssue]:
+        """Issues únicos de ``statuses`` en orden ``updated DESC``.
 
-    def _to_issue(self, raw_issue: dict[str, Any]) -> JiraIssue:
-        fields = raw_issue.get("fields", {})
-        status = fields.get("status", {}).get("name", "Unknown")
-        assignee = fields.get("assignee", {})
-        assignee_name = (
-            assignee.get("displayName")
-            if isinstance(assignee, dict)
-            else "Unassigned"
+        Si Jira informa ``total``, tras la primera página las restantes se
+        piden a la vez (hasta ``page_concurrency`` en curso); si sólo devuelve
+        ``nextPageToken`` se sigue el token página a página. ``on_page`` recibe el total acumulado
+        de issues cada vez que llega una página.
+        """
+        if not statuses:
+            return []
+        query = _SearchQuery(
+            jql=build_jql(statuses, project=project, parent_key=parent_key),
+            fields=_normalize_fields(fields),
+            page_size=min(max_results, 100),
         )
+        received = 0
+
+        def page_done(data: dict[str, Any]) -> list[dict[str, Any]]:
+            nonlocal received
+            page = data.get("issues", [])
+            received += len(page)
+            if on_page is not None:
+                on_page(received)
+            return page
+
+        first = await self._fetch_page(query, start_at=0)
+        pages = [page_done(first)]
+        if "total" not in first:
+            data = first
+            requested: set[str] = set()
+            while pages[-1] and not data.get("isLast") and data.get("nextPageToken"):
+                token = data["nextPageToken"]
+                if token in requested:
+                    raise RuntimeError("Jira repitió el nextPageToken de una página anterior")
+                requested.add(token)
+                data = await self._fetch_page(query, start_at=0, page_token=token)
+                pages.append(page_done(data))
+        total = int(first.get("total", 0))
+        page_size = len(pages[0])
+        if page_size and page_size < total:
+            limit = asyncio.Semaphore(max(1, self._config.page_concurrency))
+
+            async def fetch(offset: int) -> list[dict[str, Any]]:
+                async with limit:
+                    return page_done(await self._fetch_page(query, start_at=offset))
+
+            pages.extend(await asyncio.gather(*(
+                fetch(offset) for offset in range(page_size, total, page_size)
+            )))
+
+        issues: dict[str, JiraIssue] = {}
+        for page in pages:
+            for raw_issue in page:
+                issue = _issue_from_raw(raw_issue, None if query.loads_description else _no_async_loader)
+                issues.setdefault(issue.key, issue)
+        return list(issues.values())
+
+    async def fetch_issues_by_keys(
+        self,
+        keys: Iterable[str],
+        fields: Iterable[str] = ISSUE_FIELDS,
+    ) -> list[JiraIssue]:
+        """Versión asíncrona de ``JiraClient.fetch_issues_by_keys``."""
+        wanted = _unique_keys(keys)
+        if not wanted:
+            return []
+        fields = _normalize_fields(fields)
+        url = f"{self._config.base_url}/rest/api/3/issue/bulkfetch"
+        limit = asyncio.Semaphore(max(1, self._config.page_concurrency))
+
+        async def fetch(chunk: list[str]) -> dict[str, Any]:
+            async with limit:
+                response = await self._request("POST", url, json_body=_bulk_fetch_body(chunk, fields))
+            if response.status != 200:
+                detail = response.text[:500] if response.body else "sin detalle"
+                raise RuntimeError(f"Jira respondió {response.status}: {detail}")
+            return response.json()
+
+        pages = await asyncio.gather(*(fetch(chunk) for chunk in _key_chunks(wanted)))
+        loader = None if "description" in fields else _no_async_loader
+        return _issues_in_key_order(wanted, pages, loader)
+
+    async def _fetch_page(
+        self,
+        query: _SearchQuery,
+        start_at: int,
+        page_token: str | None = None,
+    ) -> dict[str, Any]:
+        url = f"{self._config.base_url}/rest/api/3/search/jql"
+        response = await self._get(url, _search_params(query, start_at, page_token))
+        if response.status != 200:
+            detail = response.text[:500] if response.body else "sin detalle"
+            raise RuntimeError(f"Jira respondió {response.status}: {detail}")
+        return response.json()
+
+    async def _get(self, url: str, params: dict[str, Any]) -> HttpResponse:
+        return await self._request("GET", url, params=params)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json_body: Any = None,
+    ) -> HttpResponse:
+        """Petición con la misma política de reintentos que ``JiraClient._send``."""
+        for attempt in range(self._retry.max_retries + 1):
+            try:
+                response = await self._http.request(
+                    method, url, params=params, headers=self._headers, json_body=json_body,
+                )
+            except (OSError, asyncio.TimeoutError):
+                decision = self._retry.delay(attempt)
+                if decision is None:
+                    raise
+            else:
+                decision = self._retry.delay(attempt, response.status, response.headers)
+                if decision is None:
+                    return response
+            delay, throttled = decision
+            self.retry_stats.record(delay, throttled)
+            await self._sleep(delay)
+        raise AssertionError("unreachable")
+
+
+def _no_async_loader(key: str) -> str:
+    raise RuntimeError(
+        f"La descripción de {key} no se pidió; en modo asíncrono incluí 'description' en fields"
+    )
+
+
+def _issue_from_raw(
+    raw_issue: dict[str, Any],
+    loader: Callable[[str], str] | None = None,
+) -> JiraIssue:
+    """Convierte un issue crudo de la API; con ``loader`` la descripción es diferida."""
+    fields = raw_issue.get("fields", {})
+    status = fields.get("status", {}).get("name", "Unknown")
+    assignee = fields.get("assignee", {})
+    assignee_name = (
+        assignee.get("displayName")
+        if isinstance(assignee, dict)
+        else "Unassigned"
+    )
+
+    common = {
+        "key": raw_issue.get("key", ""),
+        "summary": fields.get("summary", ""),
+        "status": status,
+        "assignee": assignee_name or "Unassigned",
+        "timespent_seconds": fields.get("timespent"),
+        "timeoriginalestimate_seconds": fields.get("timeoriginalestimate"),
+        "updated": fields.get("updated"),
+    }
+    if loader is not None:
+        return LazyJiraIssue(**common, loader=loader)
+    return JiraIssue(
+        **common,
+        description=flatten_description(
+            fields.get("description"), common["key"], common["updated"],
+        ),
+    )
+
+
+def _unique_keys(keys: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(key.strip() for key in keys if key and key.strip()))
+
+
+def _key_chunks(keys: list[str]) -> list[list[str]]:
+    return [keys[i:i + BULK_FETCH_MAX_KEYS] for i in range(0, len(keys), BULK_FETCH_MAX_KEYS)]
+
+
+def _bulk_fetch_body(keys: list[str], fields: tuple[str, ...]) -> dict[str, Any]:
+    return {"issueIdsOrKeys": keys, "fields": list(fields)}
+
+
+def _issues_in_key_order(
+    keys: list[str],
+    pages: Iterable[dict[str, Any]],
+    loader: Callable[[str], str] | None,
+) -> list[JiraIssue]:
+    """Ordena los issues de ``bulkfetch`` según ``keys``; los no pedidos van al final."""
+    by_key: dict[str, JiraIssue] = {}
+    for page in pages:
+        for raw_issue in page.get("issues", []):
+            issue = _issue_from_raw(raw_issue, loader)
+            by_key.setdefault(issue.key, issue)
+    ordered = [by_key.pop(key) for key in keys if key in by_key]
+    return ordered + list(by_key.values())
+
+
+def _retry_policy(config: JiraConfig) -> RetryPolicy:
+    return RetryPolicy(config.max_retries, config.backoff_base_seconds, config.backoff_max_seconds)
+
+
+@dataclass(frozen=True)
+class _SearchQuery:
+    jql: str
+    fields: tuple[str, ...]
+    page_size: int
+
+    @property
+    def loads_description(self) -> bool:
+        return "description" in self.fields
 
-        return JiraIssue(
-            key=raw_issue.get("key", ""),
-            summary=fields.get("summary", ""),
-            status=status,
-            assignee=assignee_name or "Unassigned",
-            description=_flatten_jira_description(fields.get("description")),
-            timespent_seconds=fields.get("timespent"),
-            timeoriginalestimate_seconds=fields.get("timeoriginalestimate"),
+
+def _search_params(
+    query: _SearchQuery,
+    start_at: int,
+    page_token: str | None = None,
+) -> dict[str, Any]:
+    """Parámetros de una página: por ``nextPageToken`` si hay, si no por ``startAt``."""
+    params: dict[str, Any] = {
+        "jql": query.jql,
+        "maxResults": query.page_size,
+        "fields": ",".join(query.fields),
+    }
+    if page_token:
+        params["nextPageToken"] = page_token
+    else:
+        params["startAt"] = start_at
+    return params
+
+
+def _raise_for_status(response: requests.Response) -> None:
+    if response.status_code != 200:
+        detail = response.text[:500] if response.text else "sin detalle"
+        raise RuntimeError(
+            f"Jira respondió {response.status_code}: {detail}"
         )
 
 
-def _flatten_jira_description(description_node: dict[str, Any] | None) -> str:
-    """Convierte la descripción ADF de Jira en texto plano básico."""
-    if not description_node:
-        return ""
+def _iter_text(response: requests.Response) -> Iterator[str]:
+    """Decodifica el cuerpo UTF-8 por fragmentos sin cortar caracteres multibyte."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def _normalize_fields(fields: Iterable[str]) -> tuple[str, ...]:
+    """Campos pedidos a Jira; ``status`` y ``updated`` siempre se incluyen."""
+    requested = dict.fromkeys(fields)
+    requested.update(dict.fromkeys(("status", "updated")))
+    return tuple(requested)
+
+
+def build_jql(
+    statuses: list[str] | None,
+    project: str | None = None,
+    parent_key: str | None = None,
+    updated_within_minutes: int | None = None,
+) -> str:
+    """Construye el JQL de búsqueda por estados, acotado a epic/parent o proyecto."""
+    clauses: list[str] = []
+    if parent_key:
+        clauses.append(f"parent = {_jql_quote(parent_key)}")
+    elif project:
+        clauses.append(f"project = {_jql_quote(project)}")
+    if statuses and len(statuses) == 1:
+        clauses.append(f"status = {_jql_quote(statuses[0])}")
+    elif statuses:
+        clauses.append(f"status IN ({', '.join(_jql_quote(s) for s in statuses)})")
+    if updated_within_minutes is not None:
+        # Duración relativa: no depende de la zona horaria del usuario Jira.
+        clauses.append(f'updated >= "-{updated_within_minutes}m"')
+    return f"{' AND '.join(clauses)} ORDER BY updated DESC".strip()
+
+
+def plan_updated_partitions(
+    jql: str,
+    count: int,
+    oldest: datetime,
+    newest: datetime,
+    partition_size: int,
+) -> list[str]:
+    """Divide ``jql`` en ventanas de ``updated`` disjuntas, de la más nueva a la más vieja.
+
+    Se arman ``ceil(count / partition_size)`` ventanas (a lo sumo
+    ``MAX_PARTITIONS``) de igual duración entre ``oldest`` y ``newest``. La
+    primera y la última quedan abiertas, así la unión cubre todo el JQL aunque
+    Jira interprete las fechas en la zona horaria del usuario: esa diferencia
+    sólo afecta el balance entre ventanas, no la completitud.
+    """
+    parts = min(MAX_PARTITIONS, math.ceil(count / max(1, partition_size)))
+    if parts <= 1 or newest <= oldest:
+        return [jql]
+    step = (newest - oldest) / parts
+    bounds = sorted({_jql_minute(oldest + step * i) for i in range(1, parts)}, reverse=True)
+
+    windows = [f'updated >= "{bounds[0]}"']
+    windows.extend(f'updated >= "{low}" AND updated < "{high}"' for high, low in zip(bounds, bounds[1:]))
+    windows.append(f'updated < "{bounds[-1]}"')
+
+    base = _jql_filter(jql)
+    order = jql[len(base):].strip()
+    return [" ".join(filter(None, (f"{base} AND" if base else "", window, order))) for window in windows]
+
+
+def _jql_filter(jql: str) -> str:
+    """El JQL sin su cláusula ``ORDER BY``."""
+    upper = jql.upper()
+    index = upper.rfind("ORDER BY")
+    return jql[:index].strip() if index >= 0 else jql.strip()
+
+
+def _with_order(jql: str, order: str) -> str:
+    return f"{_jql_filter(jql)} ORDER BY {order}".strip()
+
+
+def _jql_minute(moment: datetime) -> str:
+    """Fecha JQL con precisión de minutos (la máxima que acepta Jira)."""
+    return moment.astimezone(timezone.utc).strftime("%Y/%m/%d %H:%M")
+
 
-    chunks: list[str] = []
+def _parse_jira_datetime(value: str | None) -> datetime | None:
+    """Parsea ``updated`` de Jira (``2024-05-01T10:20:30.000+0000``)."""
+    if not value:
+        return None
+    for pattern in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, pattern)
+        except ValueError:
+            continue
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
 
-    def visit(node: Any) -> None:
-        if isinstance(node, dict):
-            if node.get("type") == "text":
-                chunks.append(node.get("text", ""))
-            for child in node.get("content", []):
-                visit(child)
-        elif isinstance(node, list):
-            for item in node:
-                visit(item)
 
-    visit(description_node)
-    return " ".join(chunk.strip() for chunk in chunks if chunk.strip())
+def _jql_quote(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
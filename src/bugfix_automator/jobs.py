@@ -0,0 +1,240 @@
+"""Cola acotada de trabajos en segundo plano con eventos de progreso."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+import time
+import traceback
+from typing import Any
+import uuid
+
+# Cuánto se conservan los trabajos terminados para que el navegador lea el resultado.
+FINISHED_JOB_TTL_SECONDS = 15 * 60
+
+ProgressCallback = Callable[..., None]
+
+
+class QueueFullError(RuntimeError):
+    """La cola alcanzó su máximo de trabajos pendientes."""
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    seq: int
+    kind: str
+    data: dict[str, Any]
+
+
+class Job:
+    """Un trabajo encolado: estado, resultado y el historial de sus eventos.
+
+    Los eventos se numeran desde 1 y se conservan todos, así un cliente que se
+    reconecta (``Last-Event-ID``) retoma desde el último que recibió.
+    """
+
+    def __init__(self, job_id: str) -> None:
+        self.id = job_id
+        self.state = "queued"
+        self.result: dict[str, Any] | None = None
+        self.error: str | None = None
+        self.finished_at: float | None = None
+        self._events: list[JobEvent] = []
+        self._cond = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.state in ("done", "error")
+
+    def publish(self, kind: str, **data: Any) -> None:
+        with self._cond:
+            self._events.append(JobEvent(len(self._events) + 1, kind, data))
+            self._cond.notify_all()
+
+    def events_after(self, seq: int, timeout: float | None = None) -> list[JobEvent]:
+        """Eventos con número mayor a ``seq``; espera hasta ``timeout`` si no hay."""
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._events) > seq or self.finished, timeout)
+            return self._events[seq:]
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._cond:
+            last = self._events[-1] if self._events else None
+            return {
+                "job_id": self.id,
+                "state": self.state,
+                "last_event": {"kind": last.kind, **last.data} if last else None,
+                "result": self.result,
+                "error": self.error,
+            }
+
+    def _mark_running(self) -> None:
+        """Pasa a ``running`` y publica ``started`` bajo el mismo lock que los lectores."""
+        with self._cond:
+            self.state = "running"
+            self._events.append(JobEvent(len(self._events) + 1, "started", {}))
+            self._cond.notify_all()
+
+    def _finish(self, state: str, kind: str, **data: Any) -> None:
+        with self._cond:
+            self.state = state
+            self.finished_at = time.monotonic()
+            self._events.append(JobEvent(len(self._events) + 1, kind, data))
+            self._cond.notify_all()
+
+
+class JobCache:
+    """Índice ``clave -> Job`` para deduplicar pedidos idénticos.
+
+    Un trabajo en cola o en curso se comparte con cualquier pedido de la misma
+    clave (single-flight); uno terminado bien se reutiliza durante
+    ``ttl_seconds``. Los trabajos fallidos no se reutilizan. Se conservan a lo
+    sumo ``maxsize`` claves, descartando la usada hace más tiempo.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, maxsize: int = 64) -> None:
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict[Hashable, Job] = OrderedDict()
+
+    def get(self, key: Hashable) -> Job | None:
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return None
+            expired = job.finished_at is not None and (
+                job.state == "error" or time.monotonic() - job.finished_at > self._ttl
+            )
+            if expired:
+                del self._jobs[key]
+                return None
+            self._jobs.move_to_end(key)
+            return job
+
+    def put(self, key: Hashable, job: Job) -> None:
+        with self._lock:
+            self._jobs[key] = job
+            self._jobs.move_to_end(key)
+            while len(self._jobs) > self._maxsize:
+                self._jobs.popitem(last=False)
+
+
+class BaseJobQueue(ABC):
+    """Admisión común de ``JobQueue`` y ``AsyncJobQueue``.
+
+    Resuelve la deduplicación por ``JobCache``, el límite de pendientes y el
+    registro de trabajos; las subclases sólo deciden cómo se ejecuta
+    ``target`` (``_dispatch``) y qué clase de ``Job`` se crea.
+    """
+
+    job_class: type[Job] = Job
+
+    def __init__(self, max_pending: int = 20, cache: JobCache | None = None) -> None:
+        self._max_pending = max_pending
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._jobs: dict[str, Job] = {}
+        self._waiting: list[Job] = []
+
+    def submit(self, target: Callable[[ProgressCallback], Any], key: Hashable | None = None) -> Job:
+        """Encola ``target(progress)``; ``progress(phase, **datos)`` publica avance.
+
+        Con ``key``, un pedido idéntico en curso o reciente devuelve ese mismo
+        trabajo en lugar de encolar otro (ver ``JobCache``).
+        """
+        with self._lock:
+            self._expire_finished()
+            if key is not None and self._cache is not None:
+                shared = self._cache.get(key)
+                if shared is not None:
+                    self._jobs[shared.id] = shared
+                    return shared
+            if len(self._waiting) >= self._max_pending:
+                raise QueueFullError("Hay demasiadas generaciones en cola, intenta en unos minutos")
+            job = self.job_class(uuid.uuid4().hex)
+            self._jobs[job.id] = job
+            self._waiting.append(job)
+            if key is not None and self._cache is not None:
+                self._cache.put(key, job)
+            job.publish("queued", position=len(self._waiting))
+        self._dispatch(job, target)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    @abstractmethod
+    def _dispatch(self, job: Job, target: Callable[[ProgressCallback], Any]) -> None:
+        """Programa la ejecución de ``target`` para ``job`` (hilo o tarea del loop)."""
+
+    def _start(self, job: Job) -> ProgressCallback:
+        """Saca ``job`` de la espera, lo marca en curso y devuelve su ``progress``."""
+        with self._lock:
+            self._waiting.remove(job)
+        job._mark_running()
+
+        def progress(phase: str, **data: Any) -> None:
+            job.publish("progress", phase=phase, **data)
+
+        return progress
+
+    @staticmethod
+    def _fail(job: Job, exc: Exception) -> None:
+        traceback.print_exc()
+        job.error = str(exc)
+        job._finish("error", "error", error=str(exc))
+
+    @staticmethod
+    def _succeed(job: Job, result: dict[str, Any]) -> None:
+        job.result = result
+        job._finish("done", "done", result=result)
+
+    def _expire_finished(self) -> None:
+        cutoff = time.monotonic() - FINISHED_JOB_TTL_SECONDS
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+class JobQueue(BaseJobQueue):
+    """Ejecuta trabajos con a lo sumo ``max_workers`` en paralelo.
+
+    Los pedidos que exceden los workers esperan en cola (hasta ``max_pending``)
+    en lugar de abrir un hilo cada uno contra Jira y Google Sheets; más allá de
+    ese límite ``submit`` lanza ``QueueFullError``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 20,
+        cache: JobCache | None = None,
+    ) -> None:
+        super().__init__(max_pending, cache)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="bfv-job",
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _dispatch(self, job: Job, target: Callable[[ProgressCallback], dict[str, Any]]) -> None:
+        self._executor.submit(self._execute, job, target)
+
+    def _execute(self, job: Job, target: Callable[[ProgressCallback], dict[str, Any]]) -> None:
+        progress = self._start(job)
+        try:
+            result = target(progress)
+        except Exception as exc:
+            self._fail(job, exc)
+        else:
+            self._succeed(job, result)
@@ -0,0 +1,117 @@
+"""Parseo incremental de respuestas JSON grandes sin materializarlas completas."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import json
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+
+# Caracteres que pueden seguir a la parte entera de un número JSON.
+_NUMBER_CONTINUATION = ".eE+-"
+
+
+def iter_array_items(
+    chunks: Iterable[str],
+    array_key: str,
+    meta: dict[str, Any] | None = None,
+) -> Iterator[Any]:
+    """Recorre un objeto JSON por fragmentos y produce los ítems de ``array_key``.
+
+    Sólo se mantiene en memoria el ítem que se está decodificando. El resto de
+    claves del objeto raíz (``total``, ``nextPageToken``...) se guardan en
+    ``meta`` a medida que aparecen, por lo que están completas al agotar el
+    generador.
+    """
+    return _ArrayStream(iter(chunks), array_key, meta if meta is not None else {}).items()
+
+
+class _ArrayStream:
+    def __init__(self, chunks: Iterator[str], array_key: str, meta: dict[str, Any]) -> None:
+        self._chunks = chunks
+        self._array_key = array_key
+        self._meta = meta
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def items(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            name = self._decode()
+            self._expect(":")
+            if name == self._array_key and self._peek() == "[":
+                self._pos += 1
+                yield from self._array_items()
+            else:
+                self._meta[name] = self._decode()
+            char = self._next_char()
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError(f"JSON inválido: se esperaba ',' o '}}' y llegó {char!r}")
+
+    def _array_items(self) -> Iterator[Any]:
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode()
+            char = self._next_char()
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"JSON inválido: se esperaba ',' o ']' y llegó {char!r}")
+
+    def _fill(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self._buf = self._buf[self._pos:] + chunk
+                self._pos = 0
+                return True
+        self._eof = True
+        return False
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError("JSON incompleto: la respuesta terminó antes de tiempo")
+
+    def _next_char(self) -> str:
+        char = self._peek()
+        self._pos += 1
+        return char
+
+    def _expect(self, char: str) -> None:
+        found = self._next_char()
+        if found != char:
+            raise ValueError(f"JSON inválido: se esperaba {char!r} y llegó {found!r}")
+
+    def _decode(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Un número cortado por el fragmento puede decodificarse a medias:
+            # "12" de "123" termina en el borde, "12" de "12.5" o "1" de "1e5"
+            # queda seguido de su parte decimal o exponente incompleto.
+            numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if numeric and not self._eof and (
+                end == len(self._buf) or self._buf[end] in _NUMBER_CONTINUATION
+            ) and self._fill():
+                continue
+            self._pos = end
+            return value
@@ -1,11 +1,23 @@
-"""Punto de entrada del flujo Jira -> procesamiento -> Google Sheets."""
+"""Punto de entrada del flujo Jira -> procesamiento -> Google Sheets, CSV o XLSX."""
 
 from __future__ import annotations
 
 import argparse
+from collections.abc import Iterable, Iterator
+import os
+from typing import TYPE_CHECKING
 
 from bugfix_automator.config import load_config_from_env, load_env_file
-from bugfix_automator.webapp import run_server
+from bugfix_automator.report_sinks import SINK_FORMATS
+
+if TYPE_CHECKING:
+    from bugfix_automator.config import AppConfig
+    from bugfix_automator.models import JiraIssue
+    from bugfix_automator.processor import ReportAggregator
+    from bugfix_automator.report_sinks import ReportSink
+
+# Cada cuántos issues procesados se informa avance en la CLI.
+PROGRESS_EVERY = 500
 
 
 def parse_args() -> argparse.Namespace:
@@ -21,43 +33,101 @@ def parse_args() -> argparse.Namespace:
         help="Levanta dashboard web moderno para ejecutar la herramienta visualmente",
     )
     parser.add_argument("--port", type=int, default=8080, help="Puerto para modo --web")
+    parser.add_argument(
+        "--asyncio",
+        action="store_true",
+        help="Con --web, usa el servidor asyncio (HTTP, Jira y Sheets en un solo event loop)",
+    )
+    parser.add_argument(
+        "--output",
+        choices=SINK_FORMATS,
+        default="sheets",
+        help="Destino del reporte: pestaña de un Google Sheet, o archivo CSV/XLSX local",
+    )
+    parser.add_argument(
+        "--output-path",
+        default=None,
+        help="Archivo para --output csv/xlsx (default: bug-verification.<formato>)",
+    )
+    parser.add_argument(
+        "--sheet-url",
+        default=None,
+        help="Google Sheet destino para --output sheets (default: GOOGLE_SHEET_URL)",
+    )
     return parser.parse_args()
 
 
+def build_sink(args: argparse.Namespace, config: AppConfig, title: str) -> ReportSink:
+    """Arma el destino elegido con ``--output``."""
+    from bugfix_automator.report_sinks import CsvSink, XlsxSink
+
+    if args.output == "csv":
+        return CsvSink(args.output_path or "bug-verification.csv")
+    if args.output == "xlsx":
+        return XlsxSink(args.output_path or "bug-verification.xlsx", sheet_title=title)
+
+    from bugfix_automator.drive_client import DriveClient, spreadsheet_id_from_url
+    from bugfix_automator.report_sinks import SheetsSink
+
+    sheet_url = args.sheet_url or os.getenv("GOOGLE_SHEET_URL", "")
+    spreadsheet_id = spreadsheet_id_from_url(sheet_url)
+    if not spreadsheet_id:
+        raise ValueError(
+            "Para --output sheets indica --sheet-url (o GOOGLE_SHEET_URL) con un Google Sheet "
+            "compartido con la service account"
+        )
+    drive_client = DriveClient(config.google.service_account_file)
+    return SheetsSink(drive_client, spreadsheet_id, sheet_title=title)
+
+
 def run() -> None:
     load_env_file()
     args = parse_args()
 
+    if args.web and args.asyncio:
+        from bugfix_automator.async_webapp import run_async_server
+
+        run_async_server(port=args.port)
+        return
     if args.web:
+        from bugfix_automator.webapp import run_server
+
         run_server(port=args.port)
         return
 
-    from bugfix_automator.drive_client import DriveClient
     from bugfix_automator.jira_client import JiraClient
-    from bugfix_automator.processor import process_issues
-    from bugfix_automator.report_generator import generate_report
+    from bugfix_automator.processor import ReportAggregator
+    from bugfix_automator.report_generator import stream_report
 
-    config = load_config_from_env()
+    config = load_config_from_env(require_google=args.output == "sheets")
     target_status = args.status or config.jira_status
+    sink = build_sink(args, config, title=f"Bug Verification - {target_status}")
 
-    jira_client = JiraClient(config.jira)
-    drive_client = DriveClient(config.google.service_account_file)
-
-    issues = jira_client.fetch_issues_by_status(status=target_status)
-    report = process_issues(issues)
-    spreadsheet = generate_report(
-        drive_client=drive_client,
-        report=report,
-        folder_id=config.google.drive_folder_id,
-        title_prefix=f"Bug Verification - {target_status}",
-    )
+    aggregator = ReportAggregator()
+    with JiraClient(config.jira) as jira_client:
+        # Jira -> procesamiento -> sink en pipeline: cada issue se escribe
+        # apenas se parsea su página, sin armar el reporte completo antes.
+        issues = _with_progress(jira_client.iter_issues_by_statuses([target_status]), aggregator)
+        location = stream_report(sink, issues, aggregator)
 
     print("Reporte generado con éxito")
     print(f"Status filtrado: {target_status}")
-    print(f"Total issues: {len(report.issues)}")
-    print(f"Total tiempo (min): {report.total_tiempo_minutos}")
-    print(f"Total OO: {report.total_oo}")
-    print(f"Spreadsheet URL: {spreadsheet.get('spreadsheetUrl', 'N/A')}")
+    print(f"Total issues: {len(aggregator)}")
+    print(f"Total tiempo (min): {aggregator.total_tiempo_minutos}")
+    print(f"Total OO: {aggregator.total_oo}")
+    print(f"Reporte: {location or 'N/A'}")
+
+
+def _with_progress(issues: Iterable[JiraIssue], aggregator: ReportAggregator) -> Iterator[JiraIssue]:
+    """Entrega ``issues`` informando avance cada ``PROGRESS_EVERY`` issues sumados."""
+    for issue in issues:
+        yield issue
+        if len(aggregator) % PROGRESS_EVERY == 0:
+            print(
+                f"Procesados {len(aggregator)} issues "
+                f"(tiempo: {aggregator.total_tiempo_minutos} min, OO: {aggregator.total_oo})",
+                flush=True,
+            )
 
 
 if __name__ == "__main__":
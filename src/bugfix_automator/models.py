@@ -1,11 +1,21 @@
-"""Modelos de dominio compartidos."""
+"""Modelos de dominio compartidos.
+
+Los modelos usan ``__slots__`` (sin ``__dict__`` por instancia) y los campos
+categóricos (``status``, ``assignee``) se internan: con cientos de miles de
+issues cada valor distinto vive una sola vez en memoria.
+"""
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from itertools import islice
+import sys
+from typing import overload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraIssue:
     key: str
     summary: str
@@ -14,3 +24,259 @@ class JiraIssue:
     description: str
     timespent_seconds: int | None
     timeoriginalestimate_seconds: int | None
+    updated: str | None = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "status", sys.intern(self.status))
+        object.__setattr__(self, "assignee", sys.intern(self.assignee))
+
+
+class LazyJiraIssue(JiraIssue):
+    """``JiraIssue`` cuya descripción se descarga sólo al primer acceso.
+
+    ``loader`` recibe la key del issue y devuelve la descripción ya aplanada.
+    """
+
+    __slots__ = ("_loader", "_description")
+
+    def __init__(
+        self,
+        *,
+        key: str,
+        summary: str,
+        status: str,
+        assignee: str,
+        timespent_seconds: int | None,
+        timeoriginalestimate_seconds: int | None,
+        updated: str | None = None,
+        loader: Callable[[str], str],
+    ) -> None:
+        for name, value in (
+            ("key", key),
+            ("summary", summary),
+            ("status", sys.intern(status)),
+            ("assignee", sys.intern(assignee)),
+            ("timespent_seconds", timespent_seconds),
+            ("timeoriginalestimate_seconds", timeoriginalestimate_seconds),
+            ("updated", updated),
+            ("_loader", loader),
+            ("_description", None),
+        ):
+            object.__setattr__(self, name, value)
+
+    @property
+    def description(self) -> str:  # type: ignore[override]
+        if self._description is None:
+            object.__setattr__(self, "_description", self._loader(self.key))
+        return self._description
+
+    @property
+    def loaded_description(self) -> str | None:
+        """Descripción si ya fue descargada, sin dispararla."""
+        return self._description
+
+    def _identity(self) -> tuple[object, ...]:
+        # Todo menos la descripción: comparar o hashear no debe descargarla.
+        return (
+            self.key,
+            self.summary,
+            self.status,
+            self.assignee,
+            self.timespent_seconds,
+            self.timeoriginalestimate_seconds,
+            self.updated,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._identity() == other._identity()  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self._identity())
+
+    def __repr__(self) -> str:
+        return f"LazyJiraIssue(key={self.key!r}, status={self.status!r})"
+
+
+@dataclass(frozen=True, slots=True)
+class ProcessedIssue:
+    issue_key: str
+    summary: str
+    status: str
+    assignee: str
+    tiempo_minutos: int
+    cantidad_oo: int
+
+
+class IssueTable(Sequence[ProcessedIssue]):
+    """Issues procesados guardados por columnas.
+
+    ``status`` y ``assignee`` se codifican como índices a la lista de valores
+    distintos (``statuses``/``assignees``); tiempo y OO son ``array("q")``. Es
+    una secuencia de ``ProcessedIssue``: cada elemento se arma al leerlo, así
+    ``build_sheet_rows`` y cualquier código que recorra ``report.issues`` la
+    consume sin cambios.
+    """
+
+    __slots__ = (
+        "keys",
+        "summaries",
+        "statuses",
+        "assignees",
+        "status_codes",
+        "assignee_codes",
+        "tiempo_minutos",
+        "cantidad_oo",
+        "_status_index",
+        "_assignee_index",
+    )
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.summaries: list[str] = []
+        self.statuses: list[str] = []
+        self.assignees: list[str] = []
+        self.status_codes = array("I")
+        self.assignee_codes = array("I")
+        self.tiempo_minutos = array("q")
+        self.cantidad_oo = array("q")
+        self._status_index: dict[str, int] = {}
+        self._assignee_index: dict[str, int] = {}
+
+    def append(
+        self,
+        issue_key: str,
+        summary: str,
+        status: str,
+        assignee: str,
+        tiempo_minutos: int,
+        cantidad_oo: int,
+    ) -> None:
+        self.keys.append(issue_key)
+        self.summaries.append(summary)
+        self.status_codes.append(_encode(status, self._status_index, self.statuses))
+        self.assignee_codes.append(_encode(assignee, self._assignee_index, self.assignees))
+        self.tiempo_minutos.append(tiempo_minutos)
+        self.cantidad_oo.append(cantidad_oo)
+
+    def extend(self, issues: Iterable[ProcessedIssue]) -> None:
+        if isinstance(issues, (IssueTable, IssueTableView)):
+            # Columnas a columnas, sin armar un ProcessedIssue por fila; la
+            # cantidad se fija antes por si ``issues`` es esta misma tabla.
+            for row in islice(issues.rows(), len(issues)):
+                self.append(*row)
+            return
+        for issue in issues:
+            self.append(
+                issue.issue_key, issue.summary, issue.status, issue.assignee,
+                issue.tiempo_minutos, issue.cantidad_oo,
+            )
+
+    @property
+    def total_tiempo_minutos(self) -> int:
+        return sum(self.tiempo_minutos)
+
+    @property
+    def total_oo(self) -> int:
+        return sum(self.cantidad_oo)
+
+    def rows(self, stop: int | None = None) -> Iterator[tuple[str, str, str, str, int, int]]:
+        """Filas ``(key, summary, status, assignee, minutos, oo)`` sin crear objetos.
+
+        Con ``stop`` se recorren sólo las primeras ``stop`` filas.
+        """
+        statuses, assignees = self.statuses, self.assignees
+        columns = zip(
+            self.keys, self.summaries, self.status_codes, self.assignee_codes,
+            self.tiempo_minutos, self.cantidad_oo,
+        )
+        for key, summary, status, assignee, minutes, oo_count in islice(columns, stop):
+            yield key, summary, statuses[status], assignees[assignee], minutes, oo_count
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @overload
+    def __getitem__(self, index: int) -> ProcessedIssue: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ProcessedIssue]: ...
+
+    def __getitem__(self, index: int | slice) -> ProcessedIssue | list[ProcessedIssue]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return ProcessedIssue(
+            issue_key=self.keys[index],
+            summary=self.summaries[index],
+            status=self.statuses[self.status_codes[index]],
+            assignee=self.assignees[self.assignee_codes[index]],
+            tiempo_minutos=self.tiempo_minutos[index],
+            cantidad_oo=self.cantidad_oo[index],
+        )
+
+    def __iter__(self) -> Iterator[ProcessedIssue]:
+        for row in self.rows():
+            yield ProcessedIssue(*row)
+
+    def __eq__(self, other: object) -> bool:
+        # Igual a cualquier secuencia con los mismos issues (p. ej. una lista).
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"IssueTable({len(self)} issues, {len(self.statuses)} estados, {len(self.assignees)} asignados)"
+
+
+class IssueTableView(Sequence[ProcessedIssue]):
+    """Vista de sólo lectura de las primeras ``len(view)`` filas de un ``IssueTable``.
+
+    Un ``IssueTable`` sólo crece por el final, así que la vista no cambia
+    aunque se sigan agregando issues a la tabla, y no copia ninguna columna.
+    """
+
+    __slots__ = ("_table", "_length")
+
+    def __init__(self, table: IssueTable, length: int | None = None) -> None:
+        self._table = table
+        self._length = len(table) if length is None else min(length, len(table))
+
+    def rows(self) -> Iterator[tuple[str, str, str, str, int, int]]:
+        return self._table.rows(self._length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> ProcessedIssue: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ProcessedIssue]: ...
+
+    def __getitem__(self, index: int | slice) -> ProcessedIssue | list[ProcessedIssue]:
+        if isinstance(index, slice):
+            return [self._table[i] for i in range(*index.indices(self._length))]
+        if not -self._length <= index < self._length:
+            raise IndexError("IssueTableView index out of range")
+        return self._table[index % self._length]
+
+    def __iter__(self) -> Iterator[ProcessedIssue]:
+        for row in self.rows():
+            yield ProcessedIssue(*row)
+
+    __eq__ = IssueTable.__eq__
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"IssueTableView({self._length} de {len(self._table)} issues)"
+
+
+def _encode(value: str, index: dict[str, int], values: list[str]) -> int:
+    code = index.get(value)
+    if code is None:
+        code = index[value] = len(values)
+        values.append(sys.intern(value))
+    return code
@@ -2,28 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 import re
 
-from bugfix_automator.models import JiraIssue
+from bugfix_automator.models import IssueTable, IssueTableView, JiraIssue, ProcessedIssue
 
 
 OO_PATTERN = re.compile(r"OO")
-
-
-@dataclass(frozen=True)
-class ProcessedIssue:
-    issue_key: str
-    summary: str
-    status: str
-    assignee: str
-    tiempo_minutos: int
-    cantidad_oo: int
+OO_TOKEN = "OO"
 
 
 @dataclass(frozen=True)
 class ProcessedReport:
-    issues: list[ProcessedIssue]
+    issues: Sequence[ProcessedIssue]
     total_tiempo_minutos: int
     total_oo: int
 
@@ -42,32 +34,132 @@ def count_oo_occurrences(text: str) -> int:
     """Cuenta cuántas veces aparece 'OO' de forma literal en el texto."""
     if not text:
         return 0
-    return len(OO_PATTERN.findall(text))
+    # str.count cuenta apariciones no solapadas, igual que OO_PATTERN.findall,
+    # sin construir la lista de coincidencias.
+    return text.count(OO_TOKEN)
+
+
+def processed_row(issue: JiraIssue) -> tuple[str, str, str, str, int, int]:
+    """Fila procesada ``(key, summary, status, assignee, minutos, oo)`` de un issue.
+
+    Es el único lugar donde se calculan minutos y OO; lo usan tanto
+    ``build_issue_table`` como ``ReportAggregator``.
+    """
+    # Contar por separado equivale a contar en "summary + ' ' + description":
+    # el espacio intermedio impide coincidencias que crucen ambos textos.
+    return (
+        issue.key,
+        issue.summary,
+        issue.status,
+        issue.assignee,
+        select_time_in_minutes(issue),
+        issue.summary.count(OO_TOKEN) + issue.description.count(OO_TOKEN),
+    )
+
 
+def process_issues(issues: Iterable[JiraIssue] | IssueTable) -> ProcessedReport:
+    """Transforma issues de Jira a estructura de reporte con acumulados.
 
-def process_issues(issues: list[JiraIssue]) -> ProcessedReport:
-    """Transforma issues de Jira a estructura de reporte con acumulados."""
-    processed: list[ProcessedIssue] = []
-    total_time = 0
-    total_oo = 0
+    Un ``IssueTable`` (ver ``build_issue_table``) ya está procesado: se usa
+    tal cual como ``issues`` del reporte y sólo se suman sus columnas.
+    """
+    if isinstance(issues, IssueTable):
+        return ProcessedReport(
+            issues=issues,
+            total_tiempo_minutos=issues.total_tiempo_minutos,
+            total_oo=issues.total_oo,
+        )
+    return _process_batch(issues)
 
+
+def build_issue_table(issues: Iterable[JiraIssue]) -> IssueTable:
+    """Procesa ``issues`` a un ``IssueTable`` columnar, sin retener descripciones.
+
+    Pensado para corridas históricas grandes: con un iterador (p. ej.
+    ``JiraClient.iter_issues_by_statuses``) cada ``JiraIssue`` se descarta
+    apenas se procesa y sólo quedan las columnas compactas.
+    """
+    table = IssueTable()
+    append = table.append
     for issue in issues:
-        minutes = select_time_in_minutes(issue)
-        oo_count = count_oo_occurrences(f"{issue.summary} {issue.description}")
-        processed_issue = ProcessedIssue(
-            issue_key=issue.key,
-            summary=issue.summary,
-            status=issue.status,
-            assignee=issue.assignee,
-            tiempo_minutos=minutes,
-            cantidad_oo=oo_count,
+        append(*processed_row(issue))
+    return table
+
+
+class ReportAggregator:
+    """Acumula un ``ProcessedReport`` a medida que llegan issues.
+
+    Permite encadenar descarga y procesamiento: los totales se actualizan con
+    cada issue, ``snapshot()`` entrega el reporte parcial en cualquier momento
+    (sin copiar filas) y ``merge()`` combina agregadores (o reportes) de distintos shards. El
+    merge es asociativo y conserva el orden: ``a.merge(b).merge(c)`` equivale
+    a procesar ``a + b + c`` de una vez.
+
+    Las filas se guardan en un ``IssueTable`` columnar, así la CLI obtiene el
+    mismo ahorro de memoria que ``build_issue_table``.
+    """
+
+    def __init__(self) -> None:
+        self._table = IssueTable()
+        self.total_tiempo_minutos = 0
+        self.total_oo = 0
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def add(self, issue: JiraIssue) -> ProcessedIssue:
+        self.extend((issue,))
+        return self._table[-1]
+
+    def extend(self, issues: Iterable[JiraIssue]) -> None:
+        append = self._table.append
+        total_time = 0
+        total_oo = 0
+        try:
+            for issue in issues:
+                row = processed_row(issue)
+                append(*row)
+                total_time += row[4]
+                total_oo += row[5]
+        finally:
+            # Si el iterador falla a mitad de camino, lo ya procesado queda contado.
+            self.total_tiempo_minutos += total_time
+            self.total_oo += total_oo
+
+    def consume(self, issues: Iterable[JiraIssue]) -> Iterator[tuple[str, str, str, str, int, int]]:
+        """Agrega ``issues`` uno a uno y entrega cada fila apenas queda sumada.
+
+        Permite escribir el reporte mientras se descarga: el consumidor recibe
+        la fila de un issue antes de que se pida el siguiente a Jira.
+        """
+        append = self._table.append
+        for issue in issues:
+            row = processed_row(issue)
+            append(*row)
+            self.total_tiempo_minutos += row[4]
+            self.total_oo += row[5]
+            yield row
+
+    def merge(self, other: ReportAggregator | ProcessedReport) -> ReportAggregator:
+        """Agrega al final los issues y totales de ``other``; devuelve ``self``."""
+        self._table.extend(other.issues if isinstance(other, ProcessedReport) else other._table)
+        self.total_tiempo_minutos += other.total_tiempo_minutos
+        self.total_oo += other.total_oo
+        return self
+
+    def snapshot(self) -> ProcessedReport:
+        """Reporte con lo acumulado hasta ahora.
+
+        ``issues`` es una ``IssueTableView`` de sólo lectura sobre las filas
+        del agregador: no se copia nada y los issues que se agreguen después
+        no aparecen en este reporte.
+        """
+        return ProcessedReport(
+            issues=IssueTableView(self._table),
+            total_tiempo_minutos=self.total_tiempo_minutos,
+            total_oo=self.total_oo,
         )
-        processed.append(processed_issue)
-        total_time += minutes
-        total_oo += oo_count
-
-    return ProcessedReport(
-        issues=processed,
-        total_tiempo_minutos=total_time,
-        total_oo=total_oo,
-    )
+
+
+def _process_batch(issues: Iterable[JiraIssue]) -> ProcessedReport:
+    return process_issues(build_issue_table(issues))
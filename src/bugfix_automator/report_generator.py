@@ -2,24 +2,33 @@
 
 from __future__ import annotations
 
-from bugfix_automator.drive_client import DriveClient
-from bugfix_automator.processor import ProcessedReport
+from collections.abc import Iterable, Iterator
 
+from bugfix_automator.models import IssueTable, IssueTableView, JiraIssue
+from bugfix_automator.processor import ProcessedReport, ReportAggregator
+from bugfix_automator.report_sinks import ReportSink
 
-def build_sheet_rows(report: ProcessedReport) -> list[list[str | int]]:
-    header = [
-        "Issue Key",
-        "Summary",
-        "Status",
-        "Assignee",
-        "Tiempo (minutos)",
-        "Cantidad de OO",
-    ]
-    rows: list[list[str | int]] = [header]
-
-    for issue in report.issues:
-        rows.append(
-            [
+REPORT_HEADER = [
+    "Issue Key",
+    "Summary",
+    "Status",
+    "Assignee",
+    "Tiempo (minutos)",
+    "Cantidad de OO",
+]
+
+
+def iter_report_rows(report: ProcessedReport) -> Iterator[list[str | int]]:
+    """Filas del reporte una por una: encabezado, issues, separador y ``TOTAL``."""
+    yield list(REPORT_HEADER)
+
+    if isinstance(report.issues, (IssueTable, IssueTableView)):
+        # Columnar: se leen las columnas sin crear un ProcessedIssue por fila.
+        for row in report.issues.rows():
+            yield list(row)
+    else:
+        for issue in report.issues:
+            yield [
                 issue.issue_key,
                 issue.summary,
                 issue.status,
@@ -27,27 +36,41 @@ def build_sheet_rows(report: ProcessedReport) -> list[list[str | int]]:
                 issue.tiempo_minutos,
                 issue.cantidad_oo,
             ]
-        )
-
-    rows.append([])
-    rows.append([
-        "TOTAL",
-        "",
-        "",
-        "",
-        report.total_tiempo_minutos,
-        report.total_oo,
-    ])
-    return rows
-
-
-def generate_report(
-    drive_client: DriveClient,
-    report: ProcessedReport,
-    title_prefix: str = "Bug-Fix Verification Report",
-    folder_id: str | None = None,
-) -> dict:
-    spreadsheet = drive_client.create_spreadsheet(title_prefix=title_prefix, folder_id=folder_id)
-    rows = build_sheet_rows(report)
-    drive_client.write_rows(spreadsheet_id=spreadsheet["spreadsheetId"], rows=rows)
-    return spreadsheet
+
+    yield []
+    yield _total_row(report.total_tiempo_minutos, report.total_oo)
+
+
+def iter_streamed_report_rows(
+    issues: Iterable[JiraIssue],
+    aggregator: ReportAggregator,
+) -> Iterator[list[str | int]]:
+    """Como ``iter_report_rows``, pero procesando ``issues`` a medida que se piden filas.
+
+    Cada issue se suma a ``aggregator`` y se entrega como fila antes de leer
+    el siguiente, así un sink en streaming escribe mientras Jira pagina. La
+    fila ``TOTAL`` sale al final con los totales ya completos.
+    """
+    yield list(REPORT_HEADER)
+    for row in aggregator.consume(issues):
+        yield list(row)
+    yield []
+    yield _total_row(aggregator.total_tiempo_minutos, aggregator.total_oo)
+
+
+def _total_row(total_tiempo_minutos: int, total_oo: int) -> list[str | int]:
+    return ["TOTAL", "", "", "", total_tiempo_minutos, total_oo]
+
+
+def build_sheet_rows(report: ProcessedReport) -> list[list[str | int]]:
+    return list(iter_report_rows(report))
+
+
+def generate_report(sink: ReportSink, report: ProcessedReport) -> str:
+    """Escribe el reporte en ``sink`` fila por fila; devuelve dónde quedó."""
+    return sink.write(iter_report_rows(report))
+
+
+def stream_report(sink: ReportSink, issues: Iterable[JiraIssue], aggregator: ReportAggregator) -> str:
+    """Escribe en ``sink`` directamente desde ``issues``; los totales quedan en ``aggregator``."""
+    return sink.write(iter_streamed_report_rows(issues, aggregator))
@@ -0,0 +1,168 @@
+"""Destinos del reporte: Google Sheets, CSV y XLSX.
+
+Cada sink recibe las filas como iterable (encabezado primero) y las escribe
+a medida que llegan, sin armar la tabla completa en memoria. ``write``
+devuelve dónde quedó el reporte (URL o ruta del archivo).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+import csv
+from pathlib import Path
+import re
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from bugfix_automator.drive_client import DriveClient
+
+# Formatos aceptados por ``--output`` en la CLI.
+SINK_FORMATS = ("sheets", "csv", "xlsx")
+
+# Caracteres de control que XML 1.0 no admite (Jira los deja pasar en textos).
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Caracteres prohibidos en nombres de hoja de Excel (máximo 31 caracteres).
+_XLSX_SHEET_INVALID = re.compile(r"[\[\]:*?/\\]")
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml"'
+    ' ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml"'
+    ' ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1"'
+    ' Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"'
+    ' Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+    ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{title}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1"'
+    ' Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"'
+    ' Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+
+_XLSX_SHEET_TAIL = "</sheetData></worksheet>"
+
+
+class ReportSink(Protocol):
+    def write(self, rows: Iterable[Sequence[Any]]) -> str:
+        """Escribe ``rows`` y devuelve la ubicación del reporte."""
+        ...
+
+
+class SheetsSink:
+    """Escribe en una pestaña de un spreadsheet existente, por bloques acotados.
+
+    El spreadsheet tiene que estar compartido con la service account (igual
+    que en el dashboard); la pestaña ``sheet_title`` se crea o se limpia.
+    """
+
+    def __init__(self, drive_client: DriveClient, spreadsheet_id: str, sheet_title: str = "Reporte") -> None:
+        self._drive_client = drive_client
+        self._spreadsheet_id = spreadsheet_id
+        self._sheet_title = sheet_title
+
+    def write(self, rows: Iterable[Sequence[Any]]) -> str:
+        result = self._drive_client.write_rows(self._spreadsheet_id, rows, sheet_title=self._sheet_title)
+        return result.get("spreadsheetUrl", "")
+
+
+class CsvSink:
+    """CSV UTF-8 (con BOM, para que Excel respete los acentos), fila por fila."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+
+    def write(self, rows: Iterable[Sequence[Any]]) -> str:
+        with self._path.open("w", encoding="utf-8-sig", newline="") as handle:
+            writer = csv.writer(handle)
+            for row in rows:
+                writer.writerow(row)
+        return str(self._path)
+
+
+class XlsxSink:
+    """XLSX de una hoja escrito en streaming, sin dependencias externas.
+
+    El XML de la hoja se comprime directamente dentro del ZIP a medida que
+    llegan las filas, con textos como ``inlineStr``: la memoria no crece con
+    la cantidad de filas.
+    """
+
+    def __init__(self, path: str | Path, sheet_title: str = "Reporte") -> None:
+        self._path = Path(path)
+        self._sheet_title = _XLSX_SHEET_INVALID.sub("_", sheet_title)[:31] or "Reporte"
+
+    def write(self, rows: Iterable[Sequence[Any]]) -> str:
+        # zipfile arrastra lzma/bz2: se importa sólo al escribir un XLSX.
+        import zipfile
+
+        with zipfile.ZipFile(self._path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+            archive.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+            archive.writestr(
+                "xl/workbook.xml",
+                _XLSX_WORKBOOK.format(title=_xml_escape(self._sheet_title).replace('"', "&quot;")),
+            )
+            archive.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+            with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+                sheet.write(_XLSX_SHEET_HEAD.encode("utf-8"))
+                for number, row in enumerate(rows, start=1):
+                    sheet.write(_xlsx_row(number, row).encode("utf-8"))
+                sheet.write(_XLSX_SHEET_TAIL.encode("utf-8"))
+        return str(self._path)
+
+
+def _xlsx_row(number: int, row: Sequence[Any]) -> str:
+    cells = []
+    for index, value in enumerate(row):
+        if value is None or value == "":
+            continue
+        ref = f"{_xlsx_column(index)}{number}"
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+        else:
+            text = _xml_escape(_XML_INVALID.sub("", str(value)))
+            cells.append(f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+
+def _xml_escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _xlsx_column(index: int) -> str:
+    """Letra de columna Excel para un índice desde 0 (0 -> A, 26 -> AA)."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
@@ -0,0 +1,83 @@
+"""Política de reintentos compartida por los clientes HTTP (Jira y Sheets).
+
+Sólo decide *cuánto* esperar y *si* reintentar; cada cliente hace la espera
+a su manera (``time.sleep`` o ``asyncio.sleep``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+from typing import Any
+
+# Respuestas transitorias que se reintentan (rate limit y errores de gateway).
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 5
+    backoff_base_seconds: float = 1.0
+    backoff_max_seconds: float = 60.0
+
+    def backoff(self, attempt: int) -> float:
+        """Backoff exponencial con "full jitter"."""
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def delay(
+        self,
+        attempt: int,
+        status: int | None = None,
+        headers: Any = None,
+    ) -> tuple[float, bool] | None:
+        """``(espera, por_429)`` antes de reintentar, o ``None`` si no corresponde.
+
+        ``status=None`` representa un fallo de conexión.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if status is None:
+            return self.backoff(attempt), False
+        if status not in RETRYABLE_STATUS_CODES:
+            return None
+        retry_after = retry_after_seconds(headers) if headers is not None else None
+        if retry_after is None:
+            return self.backoff(attempt), status == 429
+        return retry_after + random.uniform(0, self.backoff_base_seconds), status == 429
+
+
+def retry_after_seconds(headers: Any) -> float | None:
+    """Segundos a esperar según ``Retry-After`` o ``X-RateLimit-Reset`` (Atlassian).
+
+    ``headers`` puede ser el ``CaseInsensitiveDict`` de ``requests`` o el dict
+    con nombres en minúsculas de ``AsyncHttpClient``.
+    """
+    retry_after = _header(headers, "Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                moment = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                moment = None
+            if moment is not None:
+                return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+    reset = _header(headers, "X-RateLimit-Reset")
+    if reset:
+        try:
+            moment = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+    return None
+
+
+def _header(headers: Any, name: str) -> str | None:
+    return headers.get(name) or headers.get(name.lower())
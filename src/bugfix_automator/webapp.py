@@ -2,15 +2,38 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
+import gzip
+import hashlib
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import json
 import os
 import re
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-from bugfix_automator.config import JiraConfig, load_env_file
+from bugfix_automator.config import JiraConfig, env_int, jira_config_from_env, load_env_file
+from bugfix_automator.jobs import Job, JobCache, JobQueue, ProgressCallback, QueueFullError
+
+try:
+    import brotli
+except ImportError:  # dependencia opcional (extra "web")
+    brotli = None
+
+if TYPE_CHECKING:
+    from google.oauth2.service_account import Credentials
+
+    from bugfix_automator.drive_client import BfvSetupResult, DriveClient
+    from bugfix_automator.jira_client import JiraClient
+
+# Cada cuántos issues descargados se publica avance de la generación.
+PROGRESS_EVERY_ISSUES = 100
+# Comentario SSE periódico para que proxies no corten conexiones inactivas.
+SSE_KEEPALIVE_SECONDS = 15.0
+# Tamaño máximo aceptado para el cuerpo de ``POST /api/generate``.
+MAX_REQUEST_BODY_BYTES = 1024 * 1024
 
 
 HTML = """<!doctype html>
@@ -121,6 +144,21 @@ HTML = """<!doctype html>
           </div>
         </div>
 
+        <div style="margin-bottom:16px">
+          <label for="reconcile" style="display:flex;align-items:center;gap:8px;cursor:pointer">
+            <input id="reconcile" type="checkbox" />
+            Actualizar Sheet existente sin borrar lo cargado por testers
+          </label>
+          <label for="refresh" style="display:flex;align-items:center;gap:8px;cursor:pointer">
+            <input id="refresh" type="checkbox" />
+            Refrescar s&oacute;lo los issues que ya est&aacute;n en el Sheet (sin buscar por estado)
+          </label>
+          <label for="verify" style="display:flex;align-items:center;gap:8px;cursor:pointer">
+            <input id="verify" type="checkbox" />
+            Verificar una muestra de filas despu&eacute;s de escribir
+          </label>
+        </div>
+
         <button id="runBtn" class="btn" type="submit" style="width:100%">Generar Sheet con issues</button>
       </form>
     </section>
@@ -244,9 +282,87 @@ HTML = """<!doctype html>
     rows.appendChild(tr);
   }
 
+  function renderResult(data) {
+    document.getElementById('kpiIssues').textContent = data.total_issues;
+    document.getElementById('kpiStatuses').textContent = statuses.join(', ');
+
+    var kpiSheet = document.getElementById('kpiSheet');
+    kpiSheet.textContent = '';
+    var a = document.createElement('a');
+    a.href = data.sheet_url;
+    a.target = '_blank';
+    a.style.color = '#9ec0ff';
+    a.textContent = 'Abrir Sheet';
+    kpiSheet.appendChild(a);
+
+    rows.innerHTML = '';
+    if (!data.issues || !data.issues.length) {
+      showEmpty('No se encontraron issues con esos estados.');
+    } else {
+      data.issues.forEach(function(row) {
+        var tr = document.createElement('tr');
+
+        var tdTester = document.createElement('td');
+        tdTester.textContent = row[0] || '';
+        tr.appendChild(tdTester);
+
+        var tdUrl = document.createElement('td');
+        var url = row[1] || '';
+        if (url) {
+          var lnk = document.createElement('a');
+          lnk.href = url;
+          lnk.target = '_blank';
+          lnk.textContent = url.split('/').pop();
+          tdUrl.appendChild(lnk);
+        }
+        tr.appendChild(tdUrl);
+
+        var tdEstado = document.createElement('td');
+        tdEstado.textContent = row[2] || '';
+        tr.appendChild(tdEstado);
+
+        rows.appendChild(tr);
+      });
+    }
+  }
+
+  function waitForJob(eventsUrl) {
+    return new Promise(function(resolve, reject) {
+      var source = new EventSource(eventsUrl);
+      source.addEventListener('queued', function(e) {
+        var d = JSON.parse(e.data);
+        setMsg('En cola (posición ' + d.position + ')…', true);
+      });
+      source.addEventListener('started', function() {
+        setMsg('Consultando Jira…', true);
+      });
+      source.addEventListener('progress', function(e) {
+        var d = JSON.parse(e.data);
+        if (d.phase === 'jira') {
+          setMsg('Jira: ' + d.issues + ' issues descargados' + (d.done ? '. Configurando Google Sheet…' : '…'), true);
+        } else if (d.phase === 'sheets') {
+          setMsg('Google Sheets: ' + d.calls + ' llamadas completadas…', true);
+        }
+      });
+      source.addEventListener('done', function(e) {
+        source.close();
+        resolve(JSON.parse(e.data).result);
+      });
+      source.addEventListener('error', function(e) {
+        if (e.data) {
+          source.close();
+          reject(new Error(JSON.parse(e.data).error));
+        } else if (source.readyState === EventSource.CLOSED) {
+          reject(new Error('Se perdió la conexión con el servidor'));
+        }
+      });
+    });
+  }
+
   form.addEventListener('submit', async function(e) {
     e.preventDefault();
-    if (!statuses.length) { setMsg('Agrega al menos un estado.', false); return; }
+    var refresh = document.getElementById('refresh').checked;
+    if (!statuses.length && !refresh) { setMsg('Agrega al menos un estado.', false); return; }
 
     btn.disabled = true;
     btn.innerHTML = '<span class="spinner"></span>Generando Sheet&hellip;';
@@ -258,58 +374,26 @@ HTML = """<!doctype html>
         sheet_url: document.getElementById('sheetUrl').value.trim(),
         tester:    document.getElementById('testerName').value.trim(),
         statuses:  statuses,
-        rounds:    rounds
+        rounds:    rounds,
+        reconcile: document.getElementById('reconcile').checked,
+        verify:    document.getElementById('verify').checked,
+        refresh:   refresh
       });
       var r = await fetch('/api/generate', {
         method: 'POST',
         headers: {'Content-Type':'application/json'},
         body: payload
       });
-      var data = await r.json();
-      if (!r.ok) throw new Error(data.error || 'Error desconocido');
-
-      document.getElementById('kpiIssues').textContent = data.total_issues;
-      document.getElementById('kpiStatuses').textContent = statuses.join(', ');
-
-      var kpiSheet = document.getElementById('kpiSheet');
-      kpiSheet.textContent = '';
-      var a = document.createElement('a');
-      a.href = data.sheet_url;
-      a.target = '_blank';
-      a.style.color = '#9ec0ff';
-      a.textContent = 'Abrir Sheet';
-      kpiSheet.appendChild(a);
-
-      rows.innerHTML = '';
-      if (!data.issues || !data.issues.length) {
-        showEmpty('No se encontraron issues con esos estados.');
+      var job = await r.json();
+      if (!r.ok) throw new Error(job.error || 'Error desconocido');
+
+      var data = await waitForJob(job.events_url);
+      renderResult(data);
+      if (data.verified === false) {
+        setMsg('Sheet configurado, pero la muestra verificada no coincide con lo escrito.', false);
       } else {
-        data.issues.forEach(function(row) {
-          var tr = document.createElement('tr');
-
-          var tdTester = document.createElement('td');
-          tdTester.textContent = row[0] || '';
-          tr.appendChild(tdTester);
-
-          var tdUrl = document.createElement('td');
-          var url = row[1] || '';
-          if (url) {
-            var lnk = document.createElement('a');
-            lnk.href = url;
-            lnk.target = '_blank';
-            lnk.textContent = url.split('/').pop();
-            tdUrl.appendChild(lnk);
-          }
-          tr.appendChild(tdUrl);
-
-          var tdEstado = document.createElement('td');
-          tdEstado.textContent = row[2] || '';
-          tr.appendChild(tdEstado);
-
-          rows.appendChild(tr);
-        });
+        setMsg('Sheet configurado con ' + data.total_issues + ' issues. Abre el link para ver y editar.', true);
       }
-      setMsg('Sheet configurado con ' + data.total_issues + ' issues. Abre el link para ver y editar.', true);
     } catch(err) {
       setMsg(String(err), false);
     } finally {
@@ -327,53 +411,188 @@ HTML = """<!doctype html>
 """
 
 
+@dataclass(frozen=True)
+class StaticAsset:
+    """Recurso estático codificado una sola vez, con sus variantes comprimidas.
+
+    ``variants`` mapea ``Content-Encoding`` (``"identity"``, ``"gzip"``,
+    ``"br"``) a ``(cuerpo, ETag)``; cada variante lleva su propio ETag fuerte
+    porque sus bytes difieren.
+    """
+
+    content_type: str
+    variants: dict[str, tuple[bytes, str]]
+
+    @classmethod
+    def from_text(cls, text: str, content_type: str) -> StaticAsset:
+        body = text.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:20]
+        variants = {
+            "identity": (body, f'"{digest}"'),
+            "gzip": (gzip.compress(body, compresslevel=9, mtime=0), f'"{digest}-gzip"'),
+        }
+        if brotli is not None:
+            variants["br"] = (brotli.compress(body), f'"{digest}-br"')
+        return cls(content_type=content_type, variants=variants)
+
+    def negotiate(self, accept_encoding: str) -> str:
+        """Elige la mejor codificación aceptada por el cliente (br > gzip > identity)."""
+        accepted = set()
+        for token in accept_encoding.lower().split(","):
+            name, *params = (part.strip() for part in token.split(";"))
+            quality = next((param[2:] for param in params if param.startswith("q=")), "1")
+            try:
+                if float(quality) > 0:
+                    accepted.add(name)
+            except ValueError:
+                continue
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and encoding in accepted:
+                return encoding
+        return "identity"
+
+    def matches(self, if_none_match: str, encoding: str) -> bool:
+        """``True`` si ``If-None-Match`` incluye el ETag de la variante ``encoding``.
+
+        Sólo se compara con la variante negociada: un ETag de otra codificación
+        (por ejemplo el gzip cacheado por un proxy) no habilita un 304.
+        """
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return self.variants[encoding][1] in tags
+
+
+DASHBOARD = StaticAsset.from_text(HTML, "text/html; charset=utf-8")
+
+
 class BFVServer(ThreadingHTTPServer):
     allow_reuse_address = True
     daemon_threads = True
 
 
 class WebHandler(BaseHTTPRequestHandler):
+    # Keep-alive: todas las respuestas llevan Content-Length salvo el stream SSE,
+    # que cierra la conexión al terminar.
+    protocol_version = "HTTP/1.1"
+    # Segundos sin actividad antes de cortar una conexión keep-alive ociosa:
+    # sin esto un cliente que no cierra ocupa su hilo indefinidamente.
+    timeout = 30
+
     def do_GET(self) -> None:  # noqa: N802
-        if self.path != "/":
-            self.send_response(404)
-            self.end_headers()
+        if self.path == "/":
+            self._asset_response(DASHBOARD)
             return
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.end_headers()
-        self.wfile.write(HTML.encode("utf-8"))
+
+        match = JOB_PATH.match(urlparse(self.path).path)
+        job = get_job_queue().get(match.group(1)) if match else None
+        if job is None:
+            self._empty_response(404)
+            return
+        if match.group(2):
+            self._stream_events(job)
+        else:
+            self._json_response(job.snapshot(), 200)
 
     def do_POST(self) -> None:  # noqa: N802
         if self.path != "/api/generate":
-            self.send_response(404)
-            self.end_headers()
+            # El cuerpo no se lee: se cierra la conexión para no desincronizarla.
+            self.close_connection = True
+            self._empty_response(404)
+            return
+
+        # Un largo inválido o excesivo no se lee (``read(-n)`` bloquearía el hilo
+        # hasta que el cliente corte): se responde y se cierra la conexión.
+        raw_length = self.headers.get("Content-Length")
+        if raw_length is None:
+            self.close_connection = True
+            self._json_response({"error": "Falta Content-Length"}, 411)
+            return
+        try:
+            content_length = int(raw_length)
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self.close_connection = True
+            self._json_response({"error": "Content-Length inválido"}, 400)
+            return
+        if content_length > MAX_REQUEST_BODY_BYTES:
+            self.close_connection = True
+            self._json_response({"error": "El cuerpo del pedido es demasiado grande"}, 413)
             return
 
         try:
-            content_length = int(self.headers.get("Content-Length", "0"))
             raw_body = self.rfile.read(content_length).decode("utf-8") if content_length else "{}"
-            payload = json.loads(raw_body)
-
-            jira_url = payload.get("jira_url", "")
-            statuses = payload.get("statuses", [])
-            sheet_url = payload.get("sheet_url", "")
-            tester = payload.get("tester", "")
-            round_numbers = payload.get("rounds", [])
-
-            if not jira_url:
-                raise ValueError("Falta el link del proyecto Jira")
-            if not statuses:
-                raise ValueError("Agrega al menos un estado a buscar")
-            if not sheet_url:
-                raise ValueError("Falta la URL del Google Sheet destino")
-
-            result = run_generation(jira_url, statuses, sheet_url, round_numbers, tester)
-            self._json_response(result, 200)
-        except Exception as exc:
-            import traceback
-            with open("D:/Chamba/BugFix-Automator/error.log", "w") as f:
-                traceback.print_exc(file=f)
-            self._json_response({"error": str(exc)}, 500)
+            request = parse_generate_request(json.loads(raw_body))
+        except ValueError as exc:
+            self._json_response({"error": str(exc)}, 400)
+            return
+
+        try:
+            job = get_job_queue().submit(
+                lambda progress: run_generation(**request, progress=progress),
+                key=generation_fingerprint(request),
+            )
+        except QueueFullError as exc:
+            self._json_response({"error": str(exc)}, 503)
+            return
+
+        self._json_response(job_links(job), 202)
+
+    def _stream_events(self, job: Job) -> None:
+        """Server-Sent Events con el avance del trabajo hasta que termina."""
+        try:
+            last_seq = int(self.headers.get("Last-Event-ID", "0"))
+        except ValueError:
+            last_seq = 0
+
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        try:
+            while True:
+                events = job.events_after(last_seq, timeout=SSE_KEEPALIVE_SECONDS)
+                if not events:
+                    self.wfile.write(b": keepalive\n\n")
+                for event in events:
+                    self.wfile.write(
+                        f"id: {event.seq}\nevent: {event.kind}\ndata: {json.dumps(event.data)}\n\n"
+                        .encode("utf-8")
+                    )
+                    last_seq = event.seq
+                self.wfile.flush()
+                if job.finished and not job.events_after(last_seq, timeout=0):
+                    return
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+    def _asset_response(self, asset: StaticAsset) -> None:
+        """Sirve un recurso precomprimido; responde 304 si el ETag coincide."""
+        encoding = asset.negotiate(self.headers.get("Accept-Encoding", ""))
+        body, etag = asset.variants[encoding]
+        not_modified = asset.matches(self.headers.get("If-None-Match", ""), encoding)
+
+        self.send_response(304 if not_modified else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if not_modified:
+            self.end_headers()
+            return
+        self.send_header("Content-Type", asset.content_type)
+        if encoding != "identity":
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _empty_response(self, status_code: int) -> None:
+        self.send_response(status_code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
 
     def _json_response(self, payload: dict[str, Any], status_code: int) -> None:
         body = json.dumps(payload).encode("utf-8")
@@ -384,16 +603,221 @@ class WebHandler(BaseHTTPRequestHandler):
         self.wfile.write(body)
 
 
-def run_generation(
-    jira_url: str,
-    statuses: list[str],
-    sheet_url: str,
-    round_numbers: list[int] | None = None,
-    tester: str = "",
-) -> dict[str, Any]:
-    from bugfix_automator.drive_client import DriveClient
+JOB_PATH = re.compile(r"^/api/jobs/([0-9a-f]+)(/events)?$")
+_SHEET_ID = re.compile(r"/spreadsheets/d/([a-zA-Z0-9_-]+)")
+_ISSUE_KEY = re.compile(r"/browse/([A-Za-z][A-Za-z0-9_]*-\d+)")
+
+# Columna ``URL Ticket`` de la pestaña Issues (de allí salen las keys a refrescar).
+ISSUE_URL_RANGE = "Issues!C4:C"
+_JOB_QUEUE: JobQueue | None = None
+_JOB_QUEUE_LOCK = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Cola de generaciones del proceso, creada al primer uso."""
+    global _JOB_QUEUE
+    with _JOB_QUEUE_LOCK:
+        if _JOB_QUEUE is None:
+            load_env_file()
+            _JOB_QUEUE = JobQueue(
+                max_workers=env_int("WEB_MAX_JOBS", 2),
+                max_pending=env_int("WEB_MAX_PENDING_JOBS", 20),
+                cache=result_cache_from_env(),
+            )
+        return _JOB_QUEUE
+
+
+def close_job_queue() -> None:
+    global _JOB_QUEUE
+    with _JOB_QUEUE_LOCK:
+        if _JOB_QUEUE is not None:
+            _JOB_QUEUE.shutdown()
+            _JOB_QUEUE = None
+
+
+def result_cache_from_env() -> JobCache | None:
+    """Caché de resultados según ``WEB_RESULT_TTL_SECONDS`` (0 lo desactiva)."""
+    ttl = env_int("WEB_RESULT_TTL_SECONDS", 300)
+    if ttl <= 0:
+        return None
+    return JobCache(ttl_seconds=ttl, maxsize=env_int("WEB_RESULT_CACHE_SIZE", 64))
+
+
+def job_links(job: Job) -> dict[str, Any]:
+    """Respuesta de ``POST /api/generate``; ``state`` distinto de ``queued``
+    indica que se reutilizó un trabajo idéntico en curso o reciente."""
+    return {
+        "job_id": job.id,
+        "state": job.state,
+        "status_url": f"/api/jobs/{job.id}",
+        "events_url": f"/api/jobs/{job.id}/events",
+    }
+
+
+def generation_fingerprint(request: dict[str, Any]) -> tuple[Any, ...]:
+    """Clave de pedidos equivalentes para ``JobCache``.
+
+    Normaliza la URL de Jira (esquema/host en minúsculas, sin query ni barra
+    final), los estados (sin mayúsculas ni repetidos, ordenados), el ID del
+    spreadsheet y las rondas; el tester ya llega sin espacios de
+    ``parse_generate_request``.
+    """
+    jira = urlparse(request["jira_url"].strip())
+    jira_url = f"{jira.scheme.lower()}://{jira.netloc.lower()}{jira.path.rstrip('/')}"
+    sheet_match = _SHEET_ID.search(request["sheet_url"])
+    return (
+        jira_url,
+        tuple(sorted({status.strip().casefold() for status in request["statuses"]})),
+        sheet_match.group(1) if sheet_match else request["sheet_url"].strip(),
+        tuple(sorted(set(request["round_numbers"]))),
+        request["tester"],
+        request["reconcile"],
+        request.get("verify", False),
+        request.get("refresh", False),
+    )
+
+
+def parse_generate_request(payload: dict[str, Any]) -> dict[str, Any]:
+    """Valida el cuerpo de ``/api/generate`` y lo traduce a argumentos de ``run_generation``.
+
+    Cualquier tipo inesperado (cuerpo que no es un objeto, estados que no son
+    lista de textos, etc.) se informa con ``ValueError`` para responder 400.
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("El cuerpo debe ser un objeto JSON")
+    jira_url = payload.get("jira_url", "")
+    statuses = payload.get("statuses", [])
+    sheet_url = payload.get("sheet_url", "")
+    tester = payload.get("tester", "")
+    rounds = payload.get("rounds", [])
+    refresh = bool(payload.get("refresh", False))
+
+    if not isinstance(jira_url, str) or not isinstance(sheet_url, str):
+        raise ValueError("jira_url y sheet_url deben ser textos")
+    if not isinstance(statuses, list) or not all(isinstance(status, str) for status in statuses):
+        raise ValueError("Los estados deben ser una lista de textos")
+    if not isinstance(tester, str):
+        raise ValueError("El tester debe ser un texto")
+    if not isinstance(rounds, list):
+        raise ValueError("Las rondas deben ser una lista de números enteros")
+
+    if not jira_url:
+        raise ValueError("Falta el link del proyecto Jira")
+    if not statuses and not refresh:
+        raise ValueError("Agrega al menos un estado a buscar")
+    if not sheet_url:
+        raise ValueError("Falta la URL del Google Sheet destino")
+
+    try:
+        round_numbers = [int(number) for number in rounds]
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Las rondas deben ser números enteros") from exc
+
+    return {
+        "jira_url": jira_url,
+        "statuses": statuses,
+        "sheet_url": sheet_url,
+        "round_numbers": round_numbers,
+        "tester": tester.strip(),
+        "reconcile": bool(payload.get("reconcile", False)),
+        "verify": bool(payload.get("verify", False)),
+        "refresh": refresh,
+    }
+
+
+_JIRA_CLIENTS: dict[JiraConfig, JiraClient] = {}
+_JIRA_CLIENTS_LOCK = threading.Lock()
+
+
+def get_jira_client(config: JiraConfig) -> JiraClient:
+    """Devuelve un JiraClient caliente (sesión keep-alive) por configuración."""
     from bugfix_automator.jira_client import JiraClient
 
+    with _JIRA_CLIENTS_LOCK:
+        client = _JIRA_CLIENTS.get(config)
+        if client is None:
+            client = JiraClient(config)
+            _JIRA_CLIENTS[config] = client
+        return client
+
+
+def close_jira_clients() -> None:
+    """Cierra todas las sesiones Jira abiertas por el servidor."""
+    with _JIRA_CLIENTS_LOCK:
+        for client in _JIRA_CLIENTS.values():
+            client.close()
+        _JIRA_CLIENTS.clear()
+
+
+_GOOGLE_CREDENTIALS: dict[tuple[str, float], Credentials] = {}
+_GOOGLE_CREDENTIALS_LOCK = threading.Lock()
+_DRIVE_CLIENTS = threading.local()
+
+
+def get_google_credentials(service_account_file: str) -> Credentials:
+    """Credenciales de la service account compartidas por todo el proceso.
+
+    La clave incluye la fecha de modificación del archivo para tomar una
+    llave rotada; el token de acceso se renueva solo al vencer.
+    """
+    from bugfix_automator.drive_client import load_credentials
+
+    path = os.path.abspath(service_account_file)
+    key = (path, os.path.getmtime(path))
+    with _GOOGLE_CREDENTIALS_LOCK:
+        credentials = _GOOGLE_CREDENTIALS.get(key)
+        if credentials is None:
+            _drop_stale(_GOOGLE_CREDENTIALS, path)
+            credentials = load_credentials(path)
+            _GOOGLE_CREDENTIALS[key] = credentials
+        return credentials
+
+
+def get_drive_client(service_account_file: str) -> DriveClient:
+    """Devuelve un DriveClient caliente para el hilo actual.
+
+    Las credenciales se comparten (``get_google_credentials``); el servicio
+    Sheets y su transporte HTTP son por hilo porque ``httplib2`` no es seguro
+    entre hilos.
+    """
+    from bugfix_automator.drive_client import DriveClient
+
+    credentials = get_google_credentials(service_account_file)
+    path = os.path.abspath(service_account_file)
+    key = (path, os.path.getmtime(path))
+
+    clients: dict[tuple[str, float], DriveClient] = _DRIVE_CLIENTS.__dict__.setdefault("by_key", {})
+    client = clients.get(key)
+    if client is None:
+        _drop_stale(clients, path)
+        client = DriveClient(credentials=credentials)
+        clients[key] = client
+    return client
+
+
+def _drop_stale(registry: dict[tuple[str, float], Any], path: str) -> None:
+    for stale in [key for key in registry if key[0] == path]:
+        del registry[stale]
+
+
+@dataclass(frozen=True)
+class GenerationTarget:
+    """Destino de una generación resuelto a partir de las URLs del formulario."""
+
+    base_url: str
+    project: str | None
+    parent_key: str | None
+    spreadsheet_id: str
+    service_account_file: str
+
+    @property
+    def title(self) -> str:
+        now = datetime.now(timezone.utc)
+        return f"BFV {now.strftime('%B')} {now.year} {self.project or 'Project'}"
+
+
+def resolve_generation_target(jira_url: str, sheet_url: str) -> GenerationTarget:
+    """Valida credenciales del entorno y extrae proyecto/parent y el ID del Sheet."""
     load_env_file()
 
     jira_email = os.environ.get("JIRA_EMAIL", "")
@@ -421,57 +845,123 @@ def run_generation(
                 project = issue_key.rsplit("-", 1)[0]
             break
 
-    sheet_match = re.search(r"/spreadsheets/d/([a-zA-Z0-9_-]+)", sheet_url)
+    sheet_match = _SHEET_ID.search(sheet_url)
     if not sheet_match:
         raise ValueError(
             "No se pudo extraer el ID del Google Sheet de la URL. "
             "Formato esperado: https://docs.google.com/spreadsheets/d/ID/..."
         )
-    spreadsheet_id = sheet_match.group(1)
-
-    jira_config = JiraConfig(base_url=base_url, email=jira_email, api_token=jira_token)
-    jira_client = JiraClient(jira_config)
-
-    all_issues = []
-    for status in statuses:
-        fetched = jira_client.fetch_issues_by_status(
-            status=status, project=project, parent_key=parent_key,
-        )
-        all_issues.extend(fetched)
 
-    now = datetime.now(timezone.utc)
-    project_label = project or "Project"
-    title = f"BFV {now.strftime('%B')} {now.year} {project_label}"
+    return GenerationTarget(
+        base_url=base_url,
+        project=project,
+        parent_key=parent_key,
+        spreadsheet_id=sheet_match.group(1),
+        service_account_file=sa_file,
+    )
 
-    default_status = statuses[0] if statuses else "For review"
 
-    drive_client = DriveClient(sa_file)
-    spreadsheet = drive_client.setup_bfv_spreadsheet(
-        spreadsheet_id=spreadsheet_id,
-        title=title,
-        jira_base_url=base_url,
+def run_generation(
+    jira_url: str,
+    statuses: list[str],
+    sheet_url: str,
+    round_numbers: list[int] | None = None,
+    tester: str = "",
+    reconcile: bool = False,
+    progress: ProgressCallback | None = None,
+    verify: bool = False,
+    refresh: bool = False,
+) -> dict[str, Any]:
+    """Genera (o actualiza) el Sheet BFV con los issues de Jira.
+
+    Con ``refresh`` no se ejecuta el JQL: se leen las keys de la columna
+    ``URL Ticket`` del Sheet, se refrescan con ``fetch_issues_by_keys`` y la
+    hoja se reconcilia con esos datos.
+    """
+    from bugfix_automator.jira_client import SHEET_FIELDS
+
+    target = resolve_generation_target(jira_url, sheet_url)
+    jira_client = get_jira_client(jira_config_from_env(target.base_url))
+    drive_client = get_drive_client(target.service_account_file)
+    calls_before = drive_client.api_calls
+
+    if progress is None:
+        progress = _ignore_progress
+
+    if refresh:
+        keys = sheet_issue_keys(drive_client.read_rows(target.spreadsheet_id, range_=ISSUE_URL_RANGE))
+        all_issues = jira_client.fetch_issues_by_keys(keys, fields=SHEET_FIELDS)
+    else:
+        all_issues = []
+        for issue in jira_client.iter_issues_by_statuses(
+            statuses, project=target.project, parent_key=target.parent_key, fields=SHEET_FIELDS,
+        ):
+            all_issues.append(issue)
+            if len(all_issues) % PROGRESS_EVERY_ISSUES == 0:
+                progress("jira", issues=len(all_issues))
+    progress("jira", issues=len(all_issues), done=True)
+
+    setup = drive_client.setup_bfv_spreadsheet(
+        spreadsheet_id=target.spreadsheet_id,
+        title=target.title,
+        jira_base_url=target.base_url,
         issues=all_issues,
         round_numbers=round_numbers or [],
-        default_status=default_status,
+        default_status=statuses[0] if statuses else "For review",
         tester=tester,
+        reconcile=reconcile or refresh,
+        on_call=lambda call: progress(
+            "sheets", calls=drive_client.api_calls - calls_before, method=call.method,
+        ),
+        verify=verify,
     )
 
-    raw = drive_client.read_rows(spreadsheet_id, range_="Issues!A4:J")
+    return generation_result(setup, drive_client.api_calls - calls_before)
 
-    ui_rows = []
-    for row in raw:
-        padded = row + [""] * (10 - len(row))
-        ui_rows.append([padded[1], padded[2], padded[5]])
 
-    return {
-        "total_issues": len(ui_rows),
-        "sheet_url": spreadsheet.get("spreadsheetUrl", ""),
-        "issues": ui_rows,
+def sheet_issue_keys(rows: list[list[str]]) -> list[str]:
+    """Keys de Jira de las URLs ``.../browse/KEY`` de la columna ``URL Ticket``."""
+    keys = []
+    for row in rows:
+        match = _ISSUE_KEY.search(row[0]) if row else None
+        if match:
+            keys.append(match.group(1))
+    return keys
+
+
+def generation_result(setup: BfvSetupResult, sheet_api_calls: int) -> dict[str, Any]:
+    """Respuesta para el dashboard: (tester, URL, estado) por fila de ``Issues``.
+
+    Se arma con las filas que devolvió el plan, sin releer la hoja.
+    """
+    result = {
+        "total_issues": len(setup.rows),
+        "sheet_url": setup.spreadsheet.get("spreadsheetUrl", ""),
+        "issues": [[row.tester, row.url, row.status] for row in setup.rows],
+        "sheet_api_calls": sheet_api_calls,
     }
+    if setup.verified is not None:
+        result["verified"] = setup.verified
+    return result
+
+
+def _ignore_progress(phase: str, **data: Any) -> None:
+    pass
+
+
+def warm_up_google() -> None:
+    from bugfix_automator.drive_client import warm_up
+
+    try:
+        warm_up()
+    except Exception:
+        # Sólo es una optimización: si falla, el error real aparecerá al generar.
+        pass
 
 
 def run_server(host: str = "0.0.0.0", port: int = 8080) -> None:
     server = BFVServer((host, port), WebHandler)
+    threading.Thread(target=warm_up_google, name="bfv-warm-up", daemon=True).start()
     print(f"BugFix Automator UI disponible en http://localhost:{port}")
     try:
         server.serve_forever()
@@ -480,6 +970,8 @@ def run_server(host: str = "0.0.0.0", port: int = 8080) -> None:
     finally:
         server.shutdown()
         server.server_close()
+        close_job_queue()
+        close_jira_clients()
         print("\nServidor detenido.")
 
 
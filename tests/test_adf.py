@@ -0,0 +1,58 @@
+from bugfix_automator.adf import clear_flatten_cache, flatten_adf, flatten_description
+
+
+def paragraph(*inline):
+    return {"type": "paragraph", "content": list(inline)}
+
+
+def text(value):
+    return {"type": "text", "text": value}
+
+
+def test_flatten_adf_joins_every_fragment_with_a_space():
+    document = {
+        "type": "doc",
+        "content": [
+            paragraph(text("Hola "), text("mundo"), {"type": "hardBreak"}, text("segunda")),
+            paragraph(
+                {"type": "mention", "attrs": {"id": "1", "text": "@dev"}},
+                text(" ver "),
+                {"type": "inlineCard", "attrs": {"url": "https://x.test/1"}},
+            ),
+            {"type": "codeBlock", "content": [text("print('OO')")]},
+            {"type": "bulletList", "content": [
+                {"type": "listItem", "content": [paragraph(text("uno"))]},
+                {"type": "listItem", "content": [paragraph(text("dos"))]},
+            ]},
+        ],
+    }
+
+    assert flatten_adf(document) == (
+        "Hola mundo segunda @dev ver https://x.test/1 print('OO') uno dos"
+    )
+
+
+def test_flatten_adf_does_not_join_adjacent_text_nodes_into_an_oo():
+    # Mismo separador que el aplanador original: "O" + "O" no cuenta como OO.
+    document = {"type": "doc", "content": [paragraph(text("O"), text("O")), paragraph(text("x"))]}
+
+    assert flatten_adf(document) == "O O x"
+    assert flatten_adf(document).count("OO") == 0
+
+
+def test_flatten_adf_handles_documents_deeper_than_recursion_limit():
+    node = paragraph(text("fondo"))
+    for _ in range(5000):
+        node = {"type": "blockquote", "content": [node]}
+
+    assert flatten_adf({"type": "doc", "content": [node]}) == "fondo"
+
+
+def test_flatten_description_memoizes_by_key_and_updated():
+    clear_flatten_cache()
+    original = {"type": "doc", "content": [paragraph(text("v1"))]}
+    changed = {"type": "doc", "content": [paragraph(text("v2"))]}
+
+    assert flatten_description(original, "ABC-1", "2025-01-01") == "v1"
+    assert flatten_description(changed, "ABC-1", "2025-01-01") == "v1"
+    assert flatten_description(changed, "ABC-1", "2025-01-02") == "v2"
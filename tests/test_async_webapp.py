@@ -0,0 +1,229 @@
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pytest
+
+from bugfix_automator.async_http import AsyncHttpClient
+from bugfix_automator.async_webapp import AsyncJobQueue, AsyncServices, AsyncWebServer
+from bugfix_automator.drive_client import AsyncSheetsClient
+from bugfix_automator.retry import RetryPolicy
+
+
+def raw_issue(key, status="For Review"):
+    return {"key": key, "fields": {"status": {"name": status}, "updated": "2024-01-01T00:00:00.000+0000"}}
+
+
+class StandIn:
+    """Servidor HTTP local que responde con ``routes[(método, ruta)](query, body)``.
+
+    La ruta devuelve el JSON de la respuesta o ``(status, json, headers)``.
+    """
+
+    def __init__(self, routes):
+        self.requests = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length", "0"))
+                body = json.loads(self.rfile.read(length)) if length else None
+                stand_in.requests.append((self.command, unquote(parts.path), self.headers.get("Authorization")))
+                result = routes[(self.command, unquote(parts.path))](parse_qs(parts.query), body)
+                status, result, headers = result if isinstance(result, tuple) else (200, result, {})
+                payload = json.dumps(result).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = _serve
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FakeCredentials:
+    valid = True
+    token = "sheets-token"
+
+
+def jira_page(query, body):
+    pages = {0: [raw_issue("ABC-1"), raw_issue("ABC-2")], 2: [raw_issue("ABC-3", "QA Failed")]}
+    return {"issues": pages[int(query["startAt"][0])], "total": 3}
+
+
+def sheets_routes():
+    spreadsheet = {
+        "spreadsheetId": "sid",
+        "spreadsheetUrl": "https://sheet",
+        "sheets": [{"properties": {"title": "Issues", "sheetId": 0}}],
+    }
+    return {
+        ("GET", "/v4/spreadsheets/sid"): lambda query, body: spreadsheet,
+        ("POST", "/v4/spreadsheets/sid:batchUpdate"): lambda query, body: {"replies": []},
+        ("POST", "/v4/spreadsheets/sid/values:batchUpdate"): lambda query, body: {},
+    }
+
+
+async def http_exchange(port, raw_request):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw_request)
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    return data.decode()
+
+
+def test_async_server_runs_generation_against_stand_in_services(tmp_path, monkeypatch):
+    sa_file = tmp_path / "sa.json"
+    sa_file.write_text("{}")
+    monkeypatch.setenv("JIRA_EMAIL", "a@b.c")
+    monkeypatch.setenv("JIRA_API_TOKEN", "token")
+    monkeypatch.setenv("JIRA_PAGE_CONCURRENCY", "2")
+    monkeypatch.setenv("GOOGLE_SERVICE_ACCOUNT_FILE", str(sa_file))
+    jira = StandIn({("GET", "/rest/api/3/search/jql"): jira_page})
+    sheets = StandIn(sheets_routes())
+
+    async def scenario():
+        services = AsyncServices(sheets_base_url=sheets.url, credentials_loader=lambda path: FakeCredentials())
+        server = AsyncWebServer(services, AsyncJobQueue(max_workers=1))
+        port = await server.start("127.0.0.1", 0)
+        try:
+            payload = json.dumps({
+                "jira_url": f"{jira.url}/browse/ABC-100",
+                "sheet_url": "https://docs.google.com/spreadsheets/d/sid/edit",
+                "statuses": ["For Review", "QA Failed"],
+                "tester": "Ana",
+            }).encode()
+            accepted = await http_exchange(port, (
+                b"POST /api/generate HTTP/1.1\r\nHost: x\r\nConnection: close\r\n"
+                + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+            ))
+            job = json.loads(accepted.split("\r\n\r\n", 1)[1])
+            events = await http_exchange(port, f"GET {job['events_url']} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+            return accepted, events
+        finally:
+            await server.close()
+
+    try:
+        accepted, events = asyncio.run(scenario())
+    finally:
+        jira.close()
+        sheets.close()
+
+    assert accepted.startswith("HTTP/1.1 202")
+    assert "event: done" in events
+    done = json.loads(events.split("event: done\ndata: ", 1)[1].split("\n", 1)[0])
+    assert done["result"] == {
+        "total_issues": 3,
+        "sheet_url": "https://sheet",
+        "issues": [
+            ["Ana", f"{jira.url}/browse/ABC-1", "For Review"],
+            ["Ana", f"{jira.url}/browse/ABC-2", "For Review"],
+            ["Ana", f"{jira.url}/browse/ABC-3", "QA Failed"],
+        ],
+        "sheet_api_calls": 3,
+    }
+    assert [path for _, path, _ in jira.requests] == ["/rest/api/3/search/jql"] * 2
+    assert {auth for _, _, auth in sheets.requests} == {"Bearer sheets-token"}
+
+
+def test_async_server_limits_post_bodies_for_every_framing():
+    async def scenario():
+        server = AsyncWebServer(AsyncServices(), AsyncJobQueue(max_workers=1))
+        port = await server.start("127.0.0.1", 0)
+        try:
+            post = b"POST /api/generate HTTP/1.1\r\nHost: x\r\n"
+            return [
+                await http_exchange(port, post + b"Content-Length: 99999999\r\n\r\n"),
+                await http_exchange(port, post + b"Transfer-Encoding: chunked\r\n\r\n5000000\r\n"),
+                await http_exchange(port, post + b"Content-Length: -1\r\n\r\n"),
+                await http_exchange(port, post + b"\r\n"),
+            ]
+        finally:
+            await server.close()
+
+    responses = asyncio.run(asyncio.wait_for(scenario(), 10))
+
+    assert [response.split("\r\n", 1)[0] for response in responses] == [
+        "HTTP/1.1 413 Request Entity Too Large",
+        "HTTP/1.1 413 Request Entity Too Large",
+        "HTTP/1.1 400 Bad Request",
+        "HTTP/1.1 411 Length Required",
+    ]
+
+
+def test_async_http_client_closes_the_connection_when_the_request_times_out(monkeypatch):
+    writers = []
+    open_connection = asyncio.open_connection
+
+    async def recording_open_connection(*args, **kwargs):
+        reader, writer = await open_connection(*args, **kwargs)
+        writers.append(writer)
+        return reader, writer
+
+    monkeypatch.setattr(asyncio, "open_connection", recording_open_connection)
+
+    async def scenario():
+        async def silent(reader, writer):
+            await reader.read()
+            writer.close()
+
+        server = await asyncio.start_server(silent, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncHttpClient(timeout_seconds=0.2)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await client.request("GET", f"http://127.0.0.1:{port}/slow")
+            return [writer.is_closing() for writer in writers]
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+    assert asyncio.run(scenario()) == [True]
+
+
+def test_async_sheets_client_retries_rate_limited_calls():
+    responses = [
+        (429, {"error": "rate"}, {"Retry-After": "0"}),
+        (503, {"error": "unavailable"}, {}),
+        {"values": [["Issue"], ["ABC-1"]]},
+    ]
+    sheets = StandIn({("GET", "/v4/spreadsheets/sid/values/A:Z"): lambda query, body: responses.pop(0)})
+
+    async def scenario():
+        http = AsyncHttpClient()
+        client = AsyncSheetsClient(
+            FakeCredentials(), http, base_url=sheets.url, retry=RetryPolicy(backoff_base_seconds=0.0),
+        )
+        try:
+            return await client.read_rows("sid"), client.api_calls
+        finally:
+            await http.close()
+
+    try:
+        rows, api_calls = asyncio.run(scenario())
+    finally:
+        sheets.close()
+
+    assert rows == [["Issue"], ["ABC-1"]]
+    assert api_calls == 3
+    assert len(sheets.requests) == 3
@@ -0,0 +1,185 @@
+from bugfix_automator.drive_client import plan_bfv_setup, plan_report_upload
+from bugfix_automator.models import JiraIssue
+
+
+def build_issue(key, status="For Review"):
+    return JiraIssue(
+        key=key,
+        summary="",
+        status=status,
+        assignee="Jane",
+        description="",
+        timespent_seconds=None,
+        timeoriginalestimate_seconds=None,
+    )
+
+
+def run_plan(plan, responses):
+    """Ejecuta un plan con respuestas simuladas y devuelve (llamadas, resultado)."""
+    calls = []
+    try:
+        call = next(plan)
+        while True:
+            calls.append(call)
+            call = plan.send(responses[call.method](call))
+    except StopIteration as finished:
+        return calls, finished.value
+
+
+def spreadsheet(*tabs):
+    return {
+        "spreadsheetId": "sid",
+        "spreadsheetUrl": "https://sheet",
+        "sheets": [{"properties": {"title": title, "sheetId": sheet_id}} for title, sheet_id in tabs],
+    }
+
+
+def echo_added_sheets(call):
+    return {"replies": [
+        {"addSheet": {"properties": request["addSheet"]["properties"]}} if "addSheet" in request else {}
+        for request in call.params["body"]["requests"]
+    ]}
+
+
+def test_bfv_setup_uses_three_calls_and_assigns_new_sheet_ids():
+    plan = plan_bfv_setup(
+        spreadsheet_id="sid",
+        title="BFV",
+        jira_base_url="https://jira.test",
+        issues=[build_issue("ABC-1"), build_issue("ABC-2", "Custom")],
+        round_numbers=[2],
+    )
+
+    calls, result = run_plan(plan, {
+        "get": lambda call: spreadsheet(("Issues", 0)),
+        "batchUpdate": echo_added_sheets,
+        "values.batchUpdate": lambda call: {},
+    })
+
+    assert [call.method for call in calls] == ["get", "batchUpdate", "values.batchUpdate"]
+    requests = calls[1].params["body"]["requests"]
+    added = [r["addSheet"]["properties"] for r in requests if "addSheet" in r]
+    assert added == [{"title": "Round 2", "sheetId": 1}, {"title": "Summary", "sheetId": 2}]
+    formatted_ids = {r["repeatCell"]["range"]["sheetId"] for r in requests if "repeatCell" in r}
+    assert formatted_ids == {0, 1, 2}
+    assert [s["properties"]["title"] for s in result.spreadsheet["sheets"]] == ["Issues", "Round 2", "Summary"]
+    issue_rows = calls[2].params["body"]["data"][0]["values"][3:]
+    assert [row[2] for row in issue_rows] == ["https://jira.test/browse/ABC-1", "https://jira.test/browse/ABC-2"]
+
+
+def test_reconcile_writes_only_changed_cells_and_appended_rows():
+    plan = plan_bfv_setup(
+        spreadsheet_id="sid",
+        title="BFV",
+        jira_base_url="https://jira.test",
+        issues=[build_issue("ABC-1", "QA Failed"), build_issue("ABC-2"), build_issue("ABC-3")],
+        tester="Ana",
+        reconcile=True,
+    )
+    current_abc = [
+        ["#", "Tester", "URL Ticket"],
+        ["Date"],
+        ["", "", "template"],
+        ["1", "Luis", "https://jira.test/browse/ABC-1"],
+        ["2", "", "https://jira.test/browse/ABC-2"],
+        ["3", "Luis", "https://jira.test/browse/ABC-9"],
+    ]
+    current_f = [["Estado Actual en JIRA"], [], [], ["For Review"], ["For Review"], ["Won't Fix"]]
+
+    calls, result = run_plan(plan, {
+        "get": lambda call: spreadsheet(("Issues", 0), ("Summary", 5)),
+        "values.batchGet": lambda call: {"valueRanges": [{"values": current_abc}, {"values": current_f}]},
+        "batchUpdate": echo_added_sheets,
+        "values.batchUpdate": lambda call: {},
+    })
+
+    assert [call.method for call in calls] == ["get", "values.batchGet", "batchUpdate", "values.batchUpdate"]
+    requests = calls[2].params["body"]["requests"]
+    assert not any("updateCells" in r for r in requests)
+    assert calls[3].params["body"]["data"] == [
+        {"range": "Issues!F4", "values": [["QA Failed"]]},
+        {"range": "Issues!B5", "values": [["Ana"]]},
+        {"range": "Issues!A7", "values": [["4", "Ana", "https://jira.test/browse/ABC-3", "", "", "For Review", "", "", "", ""]]},
+    ]
+    assert [(row.tester, row.status) for row in result.rows] == [
+        ("Luis", "QA Failed"), ("Ana", "For Review"), ("Luis", "Won't Fix"), ("Ana", "For Review"),
+    ]
+
+
+def test_verify_reads_back_only_a_sample_of_the_written_rows():
+    issues = [build_issue(f"ABC-{n}") for n in range(1, 21)]
+    plan = plan_bfv_setup("sid", "BFV", "https://jira.test", issues, tester="Ana", verify=True)
+
+    def sample(call):
+        return {"valueRanges": [
+            {"values": [[str(int(r.split("A")[1].split(":")[0]) - 3), "Ana",
+                         f"https://jira.test/browse/ABC-{int(r.split('A')[1].split(':')[0]) - 3}",
+                         "", "", "For Review"]]}
+            for r in call.params["ranges"]
+        ]}
+
+    calls, result = run_plan(plan, {
+        "get": lambda call: spreadsheet(("Issues", 0)),
+        "batchUpdate": echo_added_sheets,
+        "values.batchUpdate": lambda call: {},
+        "values.batchGet": sample,
+    })
+
+    assert [call.method for call in calls][-1] == "values.batchGet"
+    assert 0 < len(calls[-1].params["ranges"]) < len(issues)
+    assert len(result.rows) == 20
+    assert result.verified is True
+
+
+def test_setup_replaces_previous_color_rules_and_keeps_foreign_ones():
+    owned = {
+        "ranges": [{"sheetId": 0, "startRowIndex": 3, "endRowIndex": 203, "startColumnIndex": 6, "endColumnIndex": 7}],
+        "booleanRule": {"condition": {"type": "TEXT_EQ", "values": [{"userEnteredValue": "Passed"}]}},
+    }
+    foreign = {
+        "ranges": [{"sheetId": 0, "startRowIndex": 0, "endRowIndex": 50, "startColumnIndex": 1, "endColumnIndex": 2}],
+        "booleanRule": {"condition": {"type": "TEXT_CONTAINS", "values": [{"userEnteredValue": "x"}]}},
+    }
+    existing = spreadsheet(("Issues", 0))
+    existing["sheets"][0]["conditionalFormats"] = [owned, foreign, owned]
+
+    calls, result = run_plan(
+        plan_bfv_setup("sid", "BFV", "https://jira.test", [build_issue("ABC-1")]),
+        {
+            "get": lambda call: existing,
+            "batchUpdate": echo_added_sheets,
+            "values.batchUpdate": lambda call: {},
+        },
+    )
+
+    requests = calls[1].params["body"]["requests"]
+    deletions = [r["deleteConditionalFormatRule"] for r in requests if "deleteConditionalFormatRule" in r]
+    assert deletions == [{"sheetId": 0, "index": 2}, {"sheetId": 0, "index": 0}]
+    first_add = next(i for i, r in enumerate(requests) if "addConditionalFormatRule" in r)
+    assert all(i < first_add for i, r in enumerate(requests) if "deleteConditionalFormatRule" in r)
+    added = [r["addConditionalFormatRule"] for r in requests if "addConditionalFormatRule" in r]
+    assert [rule["index"] for rule in added] == list(range(len(added)))
+    assert "conditionalFormats" not in result.spreadsheet["sheets"][0]
+
+
+def test_report_upload_writes_bounded_chunks_and_grows_the_grid():
+    rows = ([f"ABC-{n}", "x" * 10] for n in range(7))
+    plan = plan_report_upload("sid", "Reporte", rows, chunk_rows=3, chunk_bytes=10_000)
+
+    calls, result = run_plan(plan, {
+        "get": lambda call: spreadsheet(("Issues", 4)),
+        "batchUpdate": lambda call: {},
+        "values.update": lambda call: {},
+    })
+
+    assert [call.method for call in calls] == [
+        "get", "batchUpdate", "values.update",
+        "batchUpdate", "values.update", "batchUpdate", "values.update",
+    ]
+    assert calls[1].params["body"]["requests"][0]["addSheet"]["properties"]["sheetId"] == 5
+    growth = [call.params["body"]["requests"][0]["appendDimension"]["length"] for call in calls[3::2]]
+    assert growth == [3, 6]
+    updates = [call for call in calls if call.method == "values.update"]
+    assert [call.params["range"] for call in updates] == ["'Reporte'!A1", "'Reporte'!A4", "'Reporte'!A7"]
+    assert [len(call.params["body"]["values"]) for call in updates] == [3, 3, 1]
+    assert result["rows"] == 7 and result["spreadsheetUrl"] == "https://sheet"
@@ -0,0 +1,343 @@
+from datetime import datetime, timezone
+import json
+import threading
+
+import pytest
+import requests
+
+from bugfix_automator.config import JiraConfig
+from bugfix_automator.jira_client import SHEET_FIELDS, JiraClient, plan_updated_partitions
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200, headers=None):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ""
+
+    def json(self):
+        return self._payload
+
+    def iter_content(self, chunk_size=1):
+        body = json.dumps(self._payload).encode("utf-8")
+        for start in range(0, len(body), 7):
+            yield body[start:start + 7]
+
+    def close(self):
+        pass
+
+
+class TruncatedResponse(FakeResponse):
+    """Corta la conexión después de ``cut`` bytes del cuerpo."""
+
+    def __init__(self, payload, cut):
+        super().__init__(payload)
+        self._cut = cut
+
+    def iter_content(self, chunk_size=1):
+        body = json.dumps(self._payload).encode("utf-8")
+        yield body[:self._cut]
+        raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+
+class FakeSession:
+    def __init__(self, pages):
+        self._pages = list(pages)
+        self.calls = []
+        self.streamed = []
+        self.closed = False
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        self.calls.append(dict(params or {}))
+        self.streamed.append(stream)
+        page = self._pages.pop(0)
+        return page if isinstance(page, FakeResponse) else FakeResponse(page)
+
+    def close(self):
+        self.closed = True
+
+
+class OffsetSession(FakeSession):
+    """Responde según ``startAt`` para poder atender páginas fuera de orden."""
+
+    def __init__(self, pages_by_offset):
+        super().__init__([])
+        self._by_offset = pages_by_offset
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        self.calls.append(dict(params or {}))
+        return FakeResponse(self._by_offset[params["startAt"]])
+
+
+def raw_issue(key, status="For Review"):
+    return {
+        "key": key,
+        "fields": {
+            "summary": f"Summary {key}",
+            "status": {"name": status},
+            "assignee": {"displayName": "Jane"},
+            "description": None,
+            "timespent": 60,
+            "timeoriginalestimate": None,
+        },
+    }
+
+
+def build_client(pages, **config_overrides):
+    config = JiraConfig(base_url="https://jira.test", email="a@b.c", api_token="t", **config_overrides)
+    client = JiraClient(config)
+    client._session = pages if isinstance(pages, FakeSession) else FakeSession(pages)
+    return client
+
+
+def test_fetch_issues_reuses_session_across_pages():
+    pages = [
+        {"issues": [raw_issue("ABC-1"), raw_issue("ABC-2")], "total": 3},
+        {"issues": [raw_issue("ABC-3")], "total": 3},
+    ]
+    client = build_client(pages)
+
+    issues = client.fetch_issues_by_status("For Review", project="ABC")
+
+    assert [issue.key for issue in issues] == ["ABC-1", "ABC-2", "ABC-3"]
+    assert [call["startAt"] for call in client._session.calls] == [0, 2]
+
+
+def test_context_manager_closes_session():
+    client = build_client([])
+    with client as entered:
+        assert entered is client
+    assert client._session.closed
+
+
+def test_concurrent_pages_keep_jql_order_and_drop_duplicates():
+    session = OffsetSession({
+        0: {"issues": [raw_issue("ABC-1"), raw_issue("ABC-2")], "total": 6},
+        2: {"issues": [raw_issue("ABC-3"), raw_issue("ABC-2")], "total": 6},
+        4: {"issues": [raw_issue("ABC-5"), raw_issue("ABC-6")], "total": 6},
+    })
+    client = build_client(session, page_concurrency=3)
+
+    issues = client.fetch_issues_by_status("For Review")
+
+    assert [issue.key for issue in issues] == ["ABC-1", "ABC-2", "ABC-3", "ABC-5", "ABC-6"]
+    assert sorted(call["startAt"] for call in session.calls) == [0, 2, 4]
+
+
+def test_fetch_issues_by_statuses_single_query_dedupes():
+    pages = [{"issues": [raw_issue("ABC-1"), raw_issue("ABC-2", "QA Failed"), raw_issue("ABC-1")], "total": 3}]
+    client = build_client(pages)
+
+    issues = client.fetch_issues_by_statuses(["For Review", "QA Failed"], parent_key="ABC-100")
+
+    assert [issue.key for issue in issues] == ["ABC-1", "ABC-2"]
+    assert len(client._session.calls) == 1
+    assert client._session.calls[0]["jql"] == (
+        'parent = "ABC-100" AND status IN ("For Review", "QA Failed") ORDER BY updated DESC'
+    )
+
+
+def test_cached_sync_only_requests_delta_and_merges(tmp_path):
+    first = {"issues": [raw_issue("ABC-1"), raw_issue("ABC-2")], "total": 2}
+    delta = {"issues": [raw_issue("ABC-2", "QA Passed"), raw_issue("ABC-3")], "total": 2}
+    cache_path = str(tmp_path / "issues.sqlite")
+
+    client = build_client([first, delta], cache_path=cache_path)
+    assert [i.key for i in client.fetch_issues_by_status("For Review", project="ABC")] == ["ABC-1", "ABC-2"]
+
+    issues = client.fetch_issues_by_status("For Review", project="ABC")
+
+    assert sorted(issue.key for issue in issues) == ["ABC-1", "ABC-3"]
+    delta_jql = client._session.calls[1]["jql"]
+    assert delta_jql.startswith('project = "ABC" AND updated >= "-')
+    assert "status" not in delta_jql
+    client.close()
+
+
+def test_cached_sync_resyncs_fully_after_max_age_and_drops_deleted_issues(tmp_path):
+    first = {"issues": [raw_issue("ABC-1"), raw_issue("ABC-2")], "total": 2}
+    full = {"issues": [raw_issue("ABC-2")], "total": 1}
+    client = build_client([first, full], cache_path=str(tmp_path / "issues.sqlite"), cache_full_sync_hours=1)
+    client.fetch_issues_by_status("For Review", project="ABC")
+    # Simula que la última sincronización completa fue hace dos horas.
+    client._cache._conn.execute("UPDATE full_sync_state SET last_full_sync = last_full_sync - 7200")
+
+    issues = list(client.iter_issues_by_statuses(["For Review"], project="ABC"))
+
+    assert [issue.key for issue in issues] == ["ABC-2"]
+    assert [call["jql"] for call in client._session.calls] == [
+        'project = "ABC" AND status = "For Review" ORDER BY updated DESC',
+    ] * 2
+    client.close()
+
+
+def test_throttled_page_is_retried_without_losing_previous_pages():
+    pages = [
+        {"issues": [raw_issue("ABC-1")], "total": 2},
+        FakeResponse({}, status_code=429, headers={"Retry-After": "3"}),
+        FakeResponse({}, status_code=503),
+        {"issues": [raw_issue("ABC-2")], "total": 2},
+    ]
+    client = build_client(pages, backoff_base_seconds=0.0)
+    sleeps = []
+    client._sleep = sleeps.append
+
+    issues = client.fetch_issues_by_status("For Review")
+
+    assert [issue.key for issue in issues] == ["ABC-1", "ABC-2"]
+    assert [call["startAt"] for call in client._session.calls] == [0, 1, 1, 1]
+    assert sleeps == [3.0, 0.0]
+    assert client.retry_stats.snapshot() == {"retries": 2, "throttled": 1, "throttled_seconds": 3.0}
+
+
+def test_stream_cut_mid_body_retries_page_without_repeating_issues():
+    page = {"total": 3, "issues": [raw_issue("ABC-1"), raw_issue("ABC-2"), raw_issue("ABC-3")]}
+    cut = json.dumps(page).index('"ABC-3"')
+    client = build_client([TruncatedResponse(page, cut), page], backoff_base_seconds=0.0)
+    client._sleep = lambda _: None
+
+    issues = client.fetch_issues_by_status("For Review")
+
+    assert [issue.key for issue in issues] == ["ABC-1", "ABC-2", "ABC-3"]
+    assert [call["startAt"] for call in client._session.calls] == [0, 0]
+    assert client.retry_stats.snapshot() == {"retries": 1, "throttled": 0, "throttled_seconds": 0.0}
+
+
+def test_non_retryable_error_raises():
+    client = build_client([FakeResponse({}, status_code=401)])
+    client._sleep = lambda _: None
+
+    with pytest.raises(RuntimeError, match="401"):
+        client.fetch_issues_by_status("For Review")
+
+
+def test_sheet_fields_defer_description_until_accessed():
+    pages = [
+        {"issues": [raw_issue("ABC-1")], "total": 1},
+        {"fields": {"description": {"type": "doc", "content": [{"type": "text", "text": "OO here"}]}}},
+    ]
+    client = build_client(pages)
+
+    issues = client.fetch_issues_by_status("For Review", fields=SHEET_FIELDS)
+
+    assert client._session.calls[0]["fields"] == "status,updated"
+    assert len(client._session.calls) == 1
+    assert issues[0].description == "OO here"
+    assert issues[0].description == "OO here"
+    assert len(client._session.calls) == 2
+
+
+def test_iter_issues_streams_pages_lazily():
+    pages = [
+        {"issues": [raw_issue("ABC-1"), raw_issue("ABC-2")], "total": 3},
+        {"issues": [raw_issue("ABC-3")], "total": 3},
+    ]
+    client = build_client(pages)
+
+    stream = client.iter_issues_by_statuses(["For Review"])
+
+    assert next(stream).key == "ABC-1"
+    assert len(client._session.calls) == 1
+    assert [issue.key for issue in stream] == ["ABC-2", "ABC-3"]
+    assert len(client._session.calls) == 2
+
+
+def test_token_pagination_follows_next_page_token_without_total():
+    pages = [
+        {"issues": [raw_issue("ABC-1"), raw_issue("ABC-2")], "nextPageToken": "t1", "isLast": False},
+        {"issues": [raw_issue("ABC-3"), raw_issue("ABC-2")], "nextPageToken": "t2", "isLast": False},
+        {"issues": [raw_issue("ABC-4")], "isLast": True},
+    ]
+    client = build_client(pages)
+
+    issues = client.fetch_issues_by_statuses(["For Review"])
+
+    assert [issue.key for issue in issues] == ["ABC-1", "ABC-2", "ABC-3", "ABC-4"]
+    calls = client._session.calls
+    assert [call.get("nextPageToken") for call in calls] == [None, "t1", "t2"]
+    assert all("startAt" not in call for call in calls[1:])
+    # Todas las páginas (también las del prefetch) pasan por el parser en streaming.
+    assert client._session.streamed == [True, True, True]
+
+
+def test_plan_updated_partitions_covers_range_with_open_edges():
+    jql = 'project = "ABC" AND status = "Open" ORDER BY updated DESC'
+    oldest = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    newest = datetime(2024, 1, 4, tzinfo=timezone.utc)
+
+    partitions = plan_updated_partitions(jql, count=250, oldest=oldest, newest=newest, partition_size=100)
+
+    assert partitions == [
+        'project = "ABC" AND status = "Open" AND updated >= "2024/01/03 00:00" ORDER BY updated DESC',
+        'project = "ABC" AND status = "Open" AND updated >= "2024/01/02 00:00"'
+        ' AND updated < "2024/01/03 00:00" ORDER BY updated DESC',
+        'project = "ABC" AND status = "Open" AND updated < "2024/01/02 00:00" ORDER BY updated DESC',
+    ]
+    assert plan_updated_partitions(jql, 80, oldest, newest, 100) == [jql]
+
+
+class PartitionSession(FakeSession):
+    """Atiende el conteo, los sondeos de extremos y una página por ventana."""
+
+    def __init__(self, count, windows):
+        super().__init__([])
+        self._count = count
+        self._windows = windows
+        self._lock = threading.Lock()
+
+    def post(self, url, json=None, timeout=None):
+        assert url.endswith("/search/approximate-count")
+        return FakeResponse({"count": self._count})
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        with self._lock:
+            self.calls.append(dict(params or {}))
+        jql = params["jql"]
+        if jql.endswith("ORDER BY updated ASC"):
+            return FakeResponse({"issues": [{"fields": {"updated": "2024-01-01T00:00:00.000+0000"}}], "total": 1})
+        if params["maxResults"] == 1:
+            return FakeResponse({"issues": [{"fields": {"updated": "2024-01-03T00:00:00.000+0000"}}], "total": 1})
+        issues = next(issues for marker, issues in self._windows if marker in jql)
+        return FakeResponse({"issues": issues, "total": len(issues)})
+
+
+def test_partitioned_search_merges_windows_newest_first_and_dedupes():
+    session = PartitionSession(count=5, windows=[
+        ('updated >= "2024/01/02 00:00" ORDER', [raw_issue("ABC-5"), raw_issue("ABC-4")]),
+        ('updated < "2024/01/02 00:00"', [raw_issue("ABC-4"), raw_issue("ABC-2"), raw_issue("ABC-1")]),
+    ])
+    client = build_client(session, partition_size=3, page_concurrency=2)
+
+    issues = client.fetch_issues_by_statuses(["For Review"], project="ABC")
+
+    assert [issue.key for issue in issues] == ["ABC-5", "ABC-4", "ABC-2", "ABC-1"]
+    assert sum("updated <" in call["jql"] or "updated >=" in call["jql"] for call in session.calls) == 2
+
+
+class BulkFetchSession(FakeSession):
+    def __init__(self, known):
+        super().__init__([])
+        self._known = known
+        self._lock = threading.Lock()
+
+    def post(self, url, json=None, timeout=None):
+        assert url.endswith("/rest/api/3/issue/bulkfetch")
+        with self._lock:
+            self.calls.append(json)
+        found = [self._known[key] for key in reversed(json["issueIdsOrKeys"]) if key in self._known]
+        return FakeResponse({"issues": found, "issueErrors": []})
+
+
+def test_fetch_issues_by_keys_chunks_requests_and_keeps_key_order():
+    keys = [f"ABC-{n}" for n in range(1, 151)]
+    known = {key: raw_issue(key, "QA Passed") for key in keys if key != "ABC-7"}
+    session = BulkFetchSession(known)
+    client = build_client(session, page_concurrency=2)
+
+    issues = client.fetch_issues_by_keys(keys + ["ABC-3"], fields=SHEET_FIELDS)
+
+    assert [issue.key for issue in issues] == [key for key in keys if key != "ABC-7"]
+    assert sorted(len(call["issueIdsOrKeys"]) for call in session.calls) == [50, 100]
+    assert "updated" in session.calls[0]["fields"]
+    assert issues[0].status == "QA Passed"
@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+from bugfix_automator.jobs import BaseJobQueue, Job, JobCache, JobQueue, QueueFullError
+
+
+def test_job_publishes_progress_and_result():
+    queue = JobQueue(max_workers=1)
+
+    def target(progress):
+        progress("jira", issues=100)
+        return {"total_issues": 100}
+
+    job = queue.submit(target)
+    events = []
+    while not job.finished or len(events) < 4:
+        events.extend(job.events_after(len(events), timeout=1))
+
+    assert [event.kind for event in events] == ["queued", "started", "progress", "done"]
+    assert events[2].data == {"phase": "jira", "issues": 100}
+    assert job.snapshot()["result"] == {"total_issues": 100}
+    queue.shutdown()
+
+
+def test_running_transition_wakes_waiters_with_a_consistent_state():
+    job = Job("job-1")
+    seen = []
+    waiter = threading.Thread(
+        target=lambda: seen.extend((event.kind, job.state) for event in job.events_after(0, timeout=5))
+    )
+    waiter.start()
+    job._mark_running()
+    waiter.join(5)
+
+    assert seen == [("started", "running")]
+
+
+def test_failed_job_reports_error():
+    queue = JobQueue(max_workers=1)
+
+    def target(progress):
+        raise ValueError("sin permisos")
+
+    job = queue.submit(target)
+    job.events_after(2, timeout=5)
+
+    assert job.state == "error"
+    assert job.events_after(0)[-1].data == {"error": "sin permisos"}
+    queue.shutdown()
+
+
+def test_queue_rejects_when_pending_limit_is_reached():
+    release = threading.Event()
+    started = threading.Event()
+    queue = JobQueue(max_workers=1, max_pending=1)
+
+    def blocking(progress):
+        started.set()
+        release.wait(5)
+        return {}
+
+    queue.submit(blocking)
+    started.wait(5)
+    waiting = queue.submit(blocking)
+
+    with pytest.raises(QueueFullError):
+        queue.submit(blocking)
+
+    assert waiting.events_after(0)[0].data == {"position": 1}
+    release.set()
+    queue.shutdown()
+
+
+def test_identical_keys_share_in_flight_and_recent_jobs():
+    release = threading.Event()
+    runs = []
+    queue = JobQueue(max_workers=2, cache=JobCache(ttl_seconds=60))
+
+    def target(progress):
+        runs.append(1)
+        release.wait(5)
+        return {"total_issues": 3}
+
+    first = queue.submit(target, key=("jira", "sheet"))
+    in_flight = queue.submit(target, key=("jira", "sheet"))
+    other = queue.submit(target, key=("jira", "other-sheet"))
+    release.set()
+    first.events_after(3, timeout=5)
+    other.events_after(3, timeout=5)
+    recent = queue.submit(target, key=("jira", "sheet"))
+
+    assert in_flight is first and recent is first
+    assert other is not first
+    assert len(runs) == 2
+    queue.shutdown()
+
+
+def test_failed_jobs_are_not_reused():
+    queue = JobQueue(max_workers=1, cache=JobCache(ttl_seconds=60))
+
+    def failing(progress):
+        raise RuntimeError("Jira caído")
+
+    failed = queue.submit(failing, key="k")
+    failed.events_after(2, timeout=5)
+
+    assert queue.submit(lambda progress: {}, key="k") is not failed
+    queue.shutdown()
+
+
+def test_base_job_queue_requires_a_dispatch_implementation():
+    with pytest.raises(TypeError):
+        BaseJobQueue()
@@ -0,0 +1,48 @@
+import json
+import random
+
+import pytest
+
+from bugfix_automator.json_stream import iter_array_items
+
+
+def parse(chunks, key="issues"):
+    meta = {}
+    items = list(iter_array_items(chunks, key, meta))
+    return items, meta
+
+
+@pytest.mark.parametrize("chunks", [
+    ['{"total": 12.', '5, "issues":[]}'],
+    ['{"issues":[1.', '5]}'],
+    ['{"issues":[1', 'e3, 2E', '-2, -', '7.0e+', '1]}'],
+])
+def test_numbers_split_across_chunks(chunks):
+    document = json.loads("".join(chunks))
+    items, meta = parse(chunks)
+    assert items == document["issues"]
+    assert meta == {k: v for k, v in document.items() if k != "issues"}
+
+
+def test_chunk_boundaries_match_json_loads():
+    rng = random.Random(3)
+    document = json.dumps({
+        "startAt": 0,
+        "total": 12.5,
+        "ratio": -3.25e-4,
+        "issues": [
+            {"key": f"ABC-{i}", "n": rng.choice([0, -1, 17, 2.5, 1e21, -0.125e+3]),
+             "text": "ñ \"OO\" \\ x", "flags": [True, False, None]}
+            for i in range(6)
+        ],
+        "nextPageToken": "tok",
+        "isLast": False,
+    })
+    expected = json.loads(document)
+
+    for _ in range(300):
+        cuts = sorted(rng.sample(range(1, len(document)), rng.randint(1, 12)))
+        chunks = [document[a:b] for a, b in zip([0, *cuts], [*cuts, len(document)])]
+        items, meta = parse(chunks)
+        assert items == expected["issues"]
+        assert meta == {k: v for k, v in expected.items() if k != "issues"}
@@ -1,5 +1,12 @@
-from bugfix_automator.models import JiraIssue
-from bugfix_automator.processor import count_oo_occurrences, process_issues, select_time_in_minutes
+from bugfix_automator.models import IssueTable, IssueTableView, JiraIssue, LazyJiraIssue, ProcessedIssue
+from bugfix_automator.report_generator import build_sheet_rows
+from bugfix_automator.processor import (
+    ReportAggregator,
+    build_issue_table,
+    count_oo_occurrences,
+    process_issues,
+    select_time_in_minutes,
+)
 
 
 def build_issue(**kwargs):
@@ -41,3 +48,81 @@ def test_process_issues_totals():
     assert len(report.issues) == 2
     assert report.total_tiempo_minutos == 12
     assert report.total_oo == 3
+
+
+def test_report_aggregator_merge_matches_single_pass():
+    issues = [
+        build_issue(key=f"ABC-{i}", description="OO " * i, timespent_seconds=60 * i)
+        for i in range(6)
+    ]
+    left, right = ReportAggregator(), ReportAggregator()
+    left.extend(issues[:2])
+    partial = left.snapshot()
+    right.extend(issues[2:])
+
+    assert partial.total_oo == process_issues(issues[:2]).total_oo
+    assert left.merge(right).snapshot() == process_issues(issues)
+    assert len(partial.issues) == 2
+    # La vista no copia filas y no ve los issues agregados después del snapshot.
+    assert isinstance(partial.issues, IssueTableView)
+    assert partial.issues[-1].issue_key == "ABC-1"
+    assert [row[0] for row in partial.issues.rows()] == ["ABC-0", "ABC-1"]
+    assert left.add(build_issue(key="ABC-9", summary="OO")) == ProcessedIssue("ABC-9", "OO", "For Review", "Jane", 10, 3)
+
+
+def test_issue_table_is_columnar_and_matches_processed_list():
+    issues = [
+        build_issue(key=f"ABC-{i}", status=["For Review", "QA Failed"][i % 2], description="OO " * i)
+        for i in range(5)
+    ]
+
+    table = build_issue_table(iter(issues))
+    report = process_issues(table)
+
+    assert report.issues is table
+    assert list(table) == process_issues(issues).issues
+    assert report.total_oo == process_issues(issues).total_oo
+    assert table.statuses == ["For Review", "QA Failed"]
+    assert list(table.status_codes) == [0, 1, 0, 1, 0]
+    assert build_sheet_rows(report) == build_sheet_rows(process_issues(issues))
+
+
+def test_models_are_slotted_and_intern_categorical_fields():
+    first = build_issue(status="".join(["For ", "Review"]))
+    second = build_issue(status="".join(["For ", "Review"]))
+
+    assert not hasattr(first, "__dict__")
+    assert first.status is second.status
+
+
+def test_lazy_issue_equality_and_hash_do_not_load_description():
+    calls = []
+
+    def loader(key):
+        calls.append(key)
+        return "desc"
+
+    def lazy(**overrides):
+        fields = {
+            "key": "ABC-1", "summary": "s", "status": "For Review", "assignee": "Jane",
+            "timespent_seconds": 60, "timeoriginalestimate_seconds": None, "updated": "2024-01-01",
+        }
+        fields.update(overrides)
+        return LazyJiraIssue(**fields, loader=loader)
+
+    first, second = lazy(), lazy()
+
+    assert first == second
+    assert first != lazy(updated="2024-01-02")
+    assert len({first, second}) == 1
+    assert [first].index(second) == 0
+    assert calls == []
+
+
+def test_package_exports_public_report_types():
+    import bugfix_automator
+
+    assert bugfix_automator.ReportAggregator is ReportAggregator
+    assert bugfix_automator.IssueTable is IssueTable
+    assert bugfix_automator.LazyJiraIssue is LazyJiraIssue
+    assert {"IssueTable", "LazyJiraIssue", "ReportAggregator"} <= set(bugfix_automator.__all__)
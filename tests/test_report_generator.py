@@ -0,0 +1,74 @@
+import csv
+import xml.etree.ElementTree as ET
+import zipfile
+
+from bugfix_automator.models import JiraIssue
+from bugfix_automator.processor import ProcessedIssue, ProcessedReport, ReportAggregator
+from bugfix_automator.report_generator import generate_report, stream_report
+from bugfix_automator.report_sinks import CsvSink, XlsxSink
+
+NS = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def sample_report():
+    issues = [
+        ProcessedIssue("ABC-1", "Fix <OO> & more", "For Review", "Jane", 10, 2),
+        ProcessedIssue("ABC-2", "Árbol", "QA Failed", "Luis", 5, 0),
+    ]
+    return ProcessedReport(issues=issues, total_tiempo_minutos=15, total_oo=2)
+
+
+def test_csv_sink_streams_header_issues_and_total(tmp_path):
+    location = generate_report(CsvSink(tmp_path / "report.csv"), sample_report())
+
+    with open(location, encoding="utf-8-sig", newline="") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0][0] == "Issue Key"
+    assert rows[2] == ["ABC-2", "Árbol", "QA Failed", "Luis", "5", "0"]
+    assert rows[-2:] == [[], ["TOTAL", "", "", "", "15", "2"]]
+
+
+def test_xlsx_sink_writes_a_valid_single_sheet_workbook(tmp_path):
+    location = generate_report(XlsxSink(tmp_path / "report.xlsx", "Bug Verification: QA"), sample_report())
+
+    with zipfile.ZipFile(location) as archive:
+        workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+        sheet = ET.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    assert workbook.find("x:sheets/x:sheet", NS).get("name") == "Bug Verification_ QA"
+
+    rows = sheet.findall("x:sheetData/x:row", NS)
+    assert [row.get("r") for row in rows] == ["1", "2", "3", "4", "5"]
+    first_issue = rows[1].findall("x:c", NS)
+    assert first_issue[1].find("x:is/x:t", NS).text == "Fix <OO> & more"
+    assert [(cell.get("r"), cell.find("x:v", NS).text) for cell in rows[4].findall("x:c", NS)[1:]] == [
+        ("E5", "15"), ("F5", "2"),
+    ]
+
+
+def test_stream_report_writes_each_issue_before_fetching_the_next():
+    events = []
+
+    def issues():
+        for n in (1, 2):
+            events.append(f"fetch ABC-{n}")
+            yield JiraIssue(f"ABC-{n}", "OO", "For Review", "Jane", "", 60 * n, None)
+
+    class RecordingSink:
+        def write(self, rows):
+            written = []
+            for row in rows:
+                events.append(f"write {row[0]}" if row else "write blank")
+                written.append(row)
+            return str(len(written))
+
+    aggregator = ReportAggregator()
+    location = stream_report(RecordingSink(), issues(), aggregator)
+
+    assert events == [
+        "write Issue Key",
+        "fetch ABC-1", "write ABC-1",
+        "fetch ABC-2", "write ABC-2",
+        "write blank", "write TOTAL",
+    ]
+    assert location == "5"
+    assert (len(aggregator), aggregator.total_tiempo_minutos, aggregator.total_oo) == (2, 3, 2)
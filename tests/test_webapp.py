@@ -0,0 +1,152 @@
+import gzip
+import http.client
+import json
+import socket
+import threading
+
+from google.auth.credentials import AnonymousCredentials
+import pytest
+
+from bugfix_automator import drive_client, webapp
+
+
+def test_drive_clients_are_warm_per_thread_and_share_credentials(tmp_path, monkeypatch):
+    sa_file = tmp_path / "service-account.json"
+    sa_file.write_text("{}")
+    loads = []
+
+    def fake_load(path):
+        loads.append(path)
+        return AnonymousCredentials()
+
+    monkeypatch.setattr(drive_client, "load_credentials", fake_load)
+    monkeypatch.setattr(webapp, "_GOOGLE_CREDENTIALS", {})
+
+    first = webapp.get_drive_client(str(sa_file))
+    other = []
+    worker = threading.Thread(target=lambda: other.append(webapp.get_drive_client(str(sa_file))))
+    worker.start()
+    worker.join()
+
+    assert webapp.get_drive_client(str(sa_file)) is first
+    assert other[0] is not first
+    assert other[0]._sheets._http.credentials is first._sheets._http.credentials
+    assert len(loads) == 1
+
+
+def test_dashboard_is_precompressed_and_revalidated_on_keep_alive_connection():
+    server = webapp.BFVServer(("127.0.0.1", 0), webapp.WebHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    try:
+        connection.request("GET", "/", headers={"Accept-Encoding": "gzip, deflate"})
+        first = connection.getresponse()
+        body = first.read()
+        etag = first.getheader("ETag")
+
+        assert first.status == 200
+        assert first.getheader("Content-Encoding") == "gzip"
+        assert gzip.decompress(body).decode("utf-8") == webapp.HTML
+
+        connection.request("GET", "/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        second = connection.getresponse()
+
+        assert second.status == 304
+        assert second.read() == b""
+        assert second.getheader("ETag") == etag
+
+        # El ETag gzip no revalida la variante sin comprimir.
+        connection.request("GET", "/", headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+        third = connection.getresponse()
+
+        assert third.status == 200
+        assert third.read().decode("utf-8") == webapp.HTML
+        assert third.getheader("ETag") != etag
+    finally:
+        connection.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_generation_fingerprint_normalizes_equivalent_requests():
+    first = webapp.parse_generate_request({
+        "jira_url": "https://Acme.atlassian.net/browse/ABC-1/",
+        "sheet_url": "https://docs.google.com/spreadsheets/d/sheet123/edit#gid=0",
+        "statuses": ["QA Failed", "For Review"],
+        "rounds": [3, 2],
+        "tester": "Ana ",
+    })
+    second = webapp.parse_generate_request({
+        "jira_url": "https://acme.atlassian.net/browse/ABC-1",
+        "sheet_url": "https://docs.google.com/spreadsheets/d/sheet123/",
+        "statuses": ["for review", "QA Failed", "QA Failed"],
+        "rounds": ["2", 3],
+        "tester": "Ana",
+    })
+
+    assert first["tester"] == second["tester"] == "Ana"
+    assert webapp.generation_fingerprint(first) == webapp.generation_fingerprint(second)
+    assert webapp.generation_fingerprint(first) != webapp.generation_fingerprint({**second, "reconcile": True})
+
+
+def test_refresh_request_needs_no_statuses_and_reads_keys_from_urls():
+    request = webapp.parse_generate_request({
+        "jira_url": "https://acme.atlassian.net/browse/ABC-1",
+        "sheet_url": "https://docs.google.com/spreadsheets/d/sheet123/edit",
+        "refresh": True,
+    })
+
+    assert request["refresh"] is True and request["statuses"] == []
+    assert webapp.sheet_issue_keys([
+        ["https://acme.atlassian.net/browse/ABC-7"], [], ["template"], ["https://acme.atlassian.net/browse/DEF-12?x=1"],
+    ]) == ["ABC-7", "DEF-12"]
+
+
+MALFORMED_REQUESTS = [
+    ["no", "es", "objeto"],
+    {"jira_url": "https://acme.atlassian.net", "sheet_url": "https://x/d/s", "statuses": "For Review"},
+    {"jira_url": "https://acme.atlassian.net", "sheet_url": "https://x/d/s", "statuses": ["For Review", 3]},
+    {"jira_url": "https://acme.atlassian.net", "sheet_url": "https://x/d/s", "statuses": ["QA"], "tester": ["Ana"]},
+    {"jira_url": {"url": "x"}, "sheet_url": "https://x/d/s", "statuses": ["QA"]},
+    {"jira_url": "https://acme.atlassian.net", "sheet_url": "https://x/d/s", "statuses": ["QA"], "rounds": 3},
+]
+
+
+def test_malformed_generate_requests_are_rejected_with_400():
+    server = webapp.BFVServer(("127.0.0.1", 0), webapp.WebHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    try:
+        for payload in MALFORMED_REQUESTS:
+            with pytest.raises(ValueError):
+                webapp.parse_generate_request(payload)
+
+            connection.request("POST", "/api/generate", body=json.dumps(payload))
+            response = connection.getresponse()
+
+            assert response.status == 400
+            assert "error" in json.loads(response.read())
+    finally:
+        connection.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_generate_rejects_bad_content_length_without_reading_the_body():
+    server = webapp.BFVServer(("127.0.0.1", 0), webapp.WebHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    too_big = webapp.MAX_REQUEST_BODY_BYTES + 1
+    try:
+        for header, expected in (
+            ("Content-Length: -5\r\n", b"400"),
+            (f"Content-Length: {too_big}\r\n", b"413"),
+            ("", b"411"),
+        ):
+            with socket.create_connection(server.server_address, timeout=5) as sock:
+                sock.sendall(f"POST /api/generate HTTP/1.1\r\nHost: x\r\n{header}\r\n".encode())
+                status_line = sock.makefile("rb").readline()
+
+            assert status_line.split()[1] == expected
+    finally:
+        server.shutdown()
+        server.server_close()